@@ -1,6 +1,10 @@
 from supabase import create_client
 from dotenv import load_dotenv
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scraping'))
+from paged_reader import iter_rows, estimate_count
 
 load_dotenv('.env')
 
@@ -13,15 +17,20 @@ print(f"Key exists: {bool(key)}")
 
 supabase = create_client(url, key)
 
-# 실제 데이터 카운트
+# 실제 데이터 카운트 (전체 COUNT 대신 추정치 + 키셋 페이지 조회)
 try:
-    restaurants = supabase.table('adlog_restaurants').select('*', count='exact').execute()
-    print(f"\n식당 데이터: {len(restaurants.data)}개")
-    
+    print(f"\n식당 데이터 (추정): {estimate_count(supabase, 'adlog_restaurants')}개")
+
     # 실제 식당 (테스트 제외)
-    real_restaurants = [r for r in restaurants.data if not r.get('place_id', '').startswith('test_')]
+    total = 0
+    real_restaurants = []
+    for r in iter_rows(supabase, 'adlog_restaurants', ('place_id', 'place_name')):
+        total += 1
+        if not (r.get('place_id') or '').startswith('test_'):
+            real_restaurants.append(r)
+    print(f"식당 데이터: {total}개")
     print(f"실제 식당: {len(real_restaurants)}개")
-    
+
     # 샘플 출력
     print("\n실제 식당 샘플:")
     for r in real_restaurants[:5]:
@@ -30,12 +39,12 @@ except Exception as e:
     print(f"식당 조회 오류: {e}")
 
 try:
-    keywords = supabase.table('tracking_keywords').select('*', count='exact').execute()
-    print(f"\n키워드 데이터: {len(keywords.data)}개")
-    
+    keywords = list(iter_rows(supabase, 'tracking_keywords', ('keyword',)))
+    print(f"\n키워드 데이터: {len(keywords)}개")
+
     # 샘플 출력
     print("\n키워드 샘플:")
-    for k in keywords.data[:5]:
+    for k in keywords[:5]:
         print(f"  - {k.get('keyword', 'N/A')}")
 except Exception as e:
     print(f"키워드 조회 오류: {e}")
@@ -44,7 +53,9 @@ except Exception as e:
 try:
     from datetime import datetime
     today = datetime.now().strftime('%Y-%m-%d')
-    rankings = supabase.table('daily_rankings').select('*', count='exact').eq('search_date', today).execute()
-    print(f"\n오늘 순위 데이터: {len(rankings.data)}개")
+    today_filter = [('eq', 'search_date', today)]
+    print(f"\n오늘 순위 데이터 (추정): {estimate_count(supabase, 'daily_rankings', today_filter)}개")
+    rankings_count = sum(1 for _ in iter_rows(supabase, 'daily_rankings', ('id',), filters=today_filter))
+    print(f"오늘 순위 데이터: {rankings_count}개")
 except Exception as e:
     print(f"순위 조회 오류: {e}")
@@ -0,0 +1,188 @@
+-- ==========================================
+-- ADLOG 일일 요약 테이블 (집계 뷰 대체)
+-- today_top20 / member_rankings 뷰는 읽을 때마다 daily_rankings 전체를 조인/정렬했음
+-- → 수집이 끝날 때마다 refresh_daily_summary(날짜)로 그 날짜만 계산해 테이블에 저장
+-- (adlog-ranking-schema.sql 실행 후 Supabase SQL Editor에서 실행)
+-- ==========================================
+
+-- 기존 뷰 제거 (같은 이름의 테이블로 대체)
+DROP VIEW IF EXISTS today_top20;
+DROP VIEW IF EXISTS member_rankings;
+
+-- 1. 날짜별 키워드 TOP 20
+CREATE TABLE IF NOT EXISTS daily_top20 (
+    search_date DATE NOT NULL,
+    search_keyword VARCHAR(200) NOT NULL,
+    rank INTEGER NOT NULL,
+
+    restaurant_id UUID REFERENCES adlog_restaurants(id),
+    place_name VARCHAR(200),
+    category VARCHAR(100),
+    address VARCHAR(500),
+    rank_change INTEGER,
+
+    PRIMARY KEY (search_date, search_keyword, rank, restaurant_id)
+);
+
+-- 2. 날짜별 우리 회원 순위
+CREATE TABLE IF NOT EXISTS member_rankings (
+    search_date DATE NOT NULL,
+    search_keyword VARCHAR(200) NOT NULL,
+    restaurant_id UUID REFERENCES adlog_restaurants(id),
+
+    place_name VARCHAR(200),
+    user_id UUID REFERENCES profiles(id),
+    rank INTEGER,
+    rank_change INTEGER,
+
+    PRIMARY KEY (search_date, search_keyword, restaurant_id)
+);
+
+-- ==========================================
+-- 인덱스 (리포트 쿼리 조건/정렬과 같은 순서)
+-- ==========================================
+
+-- daily_top20: search_date = ? ORDER BY search_keyword, rank → 기본 키로 처리
+-- member_rankings: search_date = ? ORDER BY rank
+CREATE INDEX IF NOT EXISTS idx_member_rankings_date_rank ON member_rankings(search_date, rank);
+
+-- 상승 TOP 10: daily_rankings에서 search_date = ? ORDER BY rank_change DESC LIMIT 10
+CREATE INDEX IF NOT EXISTS idx_daily_rankings_date_change
+    ON daily_rankings(search_date, rank_change DESC NULLS LAST);
+
+-- 전일 순위 조회: restaurant_id + search_keyword + search_date
+CREATE INDEX IF NOT EXISTS idx_daily_rankings_restaurant_keyword_date
+    ON daily_rankings(restaurant_id, search_keyword, search_date);
+
+-- 트렌딩: period_type = 'weekly' AND period_end <= ? ORDER BY period_end DESC, times_in_top10 DESC
+CREATE INDEX IF NOT EXISTS idx_ranking_statistics_period_top10
+    ON ranking_statistics(period_type, period_end, times_in_top10 DESC);
+
+-- ==========================================
+-- 하루치 요약 갱신 함수
+-- ==========================================
+
+CREATE OR REPLACE FUNCTION refresh_daily_summary(p_date DATE DEFAULT CURRENT_DATE)
+RETURNS JSONB AS $$
+DECLARE
+    v_changes INTEGER;
+    v_top20 INTEGER;
+    v_members INTEGER;
+    v_stats INTEGER;
+BEGIN
+    -- 1. 전일 대비 순위 변동 (upsert로 갱신된 행은 INSERT 트리거가 다시 계산하지 않으므로 여기서 맞춤)
+    UPDATE daily_rankings cur
+    SET prev_rank = prev.rank,
+        rank_change = prev.rank - cur.rank
+    FROM daily_rankings prev
+    WHERE cur.search_date = p_date
+        AND prev.search_date = p_date - 1
+        AND prev.restaurant_id = cur.restaurant_id
+        AND prev.search_keyword = cur.search_keyword
+        AND cur.rank IS NOT NULL
+        AND prev.rank IS NOT NULL;
+    GET DIAGNOSTICS v_changes = ROW_COUNT;
+
+    -- 2. TOP 20 (그 날짜만 다시 계산)
+    DELETE FROM daily_top20 WHERE search_date = p_date;
+    INSERT INTO daily_top20 (search_date, search_keyword, rank, restaurant_id,
+                             place_name, category, address, rank_change)
+    SELECT dr.search_date, dr.search_keyword, dr.rank, dr.restaurant_id,
+           ar.place_name, ar.category, ar.address, dr.rank_change
+    FROM daily_rankings dr
+    JOIN adlog_restaurants ar ON dr.restaurant_id = ar.id
+    WHERE dr.search_date = p_date
+        AND dr.rank <= 20;
+    GET DIAGNOSTICS v_top20 = ROW_COUNT;
+
+    -- 3. 우리 회원 순위
+    DELETE FROM member_rankings WHERE search_date = p_date;
+    INSERT INTO member_rankings (search_date, search_keyword, restaurant_id,
+                                 place_name, user_id, rank, rank_change)
+    SELECT dr.search_date, dr.search_keyword, dr.restaurant_id,
+           ar.place_name, ar.user_id, dr.rank, dr.rank_change
+    FROM daily_rankings dr
+    JOIN adlog_restaurants ar ON dr.restaurant_id = ar.id
+    WHERE dr.search_date = p_date
+        AND ar.is_our_member = TRUE;
+    GET DIAGNOSTICS v_members = ROW_COUNT;
+
+    -- 4. 일간 / 최근 7일 통계 (그 날짜로 끝나는 기간만)
+    INSERT INTO ranking_statistics (
+        period_type, period_start, period_end, restaurant_id,
+        avg_rank, best_rank, worst_rank,
+        total_searches, times_in_top10, times_in_top20,
+        best_keyword, worst_keyword
+    )
+    SELECT
+        period.period_type,
+        period.period_start,
+        p_date,
+        dr.restaurant_id,
+        AVG(dr.rank),
+        MIN(dr.rank),
+        MAX(dr.rank),
+        COUNT(*),
+        COUNT(CASE WHEN dr.rank <= 10 THEN 1 END),
+        COUNT(CASE WHEN dr.rank <= 20 THEN 1 END),
+        (ARRAY_AGG(dr.search_keyword ORDER BY dr.rank ASC))[1],
+        (ARRAY_AGG(dr.search_keyword ORDER BY dr.rank DESC))[1]
+    FROM (VALUES ('daily', p_date), ('weekly', p_date - 6)) AS period(period_type, period_start)
+    JOIN daily_rankings dr
+        ON dr.search_date BETWEEN period.period_start AND p_date
+    WHERE dr.rank IS NOT NULL
+    GROUP BY period.period_type, period.period_start, dr.restaurant_id
+    ON CONFLICT (period_type, period_start, period_end, restaurant_id)
+    DO UPDATE SET
+        avg_rank = EXCLUDED.avg_rank,
+        best_rank = EXCLUDED.best_rank,
+        worst_rank = EXCLUDED.worst_rank,
+        total_searches = EXCLUDED.total_searches,
+        times_in_top10 = EXCLUDED.times_in_top10,
+        times_in_top20 = EXCLUDED.times_in_top20,
+        best_keyword = EXCLUDED.best_keyword,
+        worst_keyword = EXCLUDED.worst_keyword;
+    GET DIAGNOSTICS v_stats = ROW_COUNT;
+
+    RETURN jsonb_build_object(
+        'date', p_date,
+        'rank_changes', v_changes,
+        'top20', v_top20,
+        'member_rankings', v_members,
+        'statistics', v_stats
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+-- ==========================================
+-- 기존 기록 한 번 채우기 (뷰가 보여 주던 이전 날짜, 이미 채운 날짜는 건너뜀)
+-- ==========================================
+
+DO $$
+DECLARE
+    v_date DATE;
+BEGIN
+    FOR v_date IN
+        SELECT DISTINCT dr.search_date FROM daily_rankings dr
+        WHERE NOT EXISTS (SELECT 1 FROM daily_top20 t WHERE t.search_date = dr.search_date)
+        ORDER BY dr.search_date
+    LOOP
+        PERFORM refresh_daily_summary(v_date);
+    END LOOP;
+END $$;
+
+-- ==========================================
+-- 권한 설정
+-- ==========================================
+
+ALTER TABLE daily_top20 ENABLE ROW LEVEL SECURITY;
+ALTER TABLE member_rankings ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "관리자 전체 권한" ON daily_top20
+    FOR ALL USING (auth.jwt() ->> 'role' = 'service_role');
+
+CREATE POLICY "관리자 전체 권한" ON member_rankings
+    FOR ALL USING (auth.jwt() ->> 'role' = 'service_role');
+
+COMMENT ON TABLE daily_top20 IS '날짜별 키워드 TOP 20 (refresh_daily_summary로 갱신)';
+COMMENT ON TABLE member_rankings IS '날짜별 우리 회원 순위 (refresh_daily_summary로 갱신)';
@@ -15,6 +15,12 @@ from bs4 import BeautifulSoup
 import pandas as pd
 from dotenv import load_dotenv
 from supabase import create_client
+from report_cache import ReportCache
+from report_exporter import StreamingReportExporter
+from paged_reader import iter_rows, fetch_map
+from run_metrics import RunMetrics
+from keyword_registry import registry
+from daily_summary import refresh_daily_summary
 
 # 환경변수 로드
 env_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
@@ -22,8 +28,22 @@ if os.path.exists(env_path):
     load_dotenv(env_path)
 
 class Adlog500Manager:
-    def __init__(self):
-        """500개 식당 관리자 초기화"""
+    # 리포트 쿼리별 캐시 유효 시간 (초)
+    REPORT_CACHE_TTL = {
+        'today_top20': 600,
+        'top_gainers': 600,
+        'member_rankings': 600,
+        'ranking_statistics': 3600
+    }
+    
+    def __init__(self, metrics=None):
+        """
+        500개 식당 관리자 초기화
+        Args:
+            metrics: 실행 계측 객체 (없으면 새로 생성)
+        """
+        self.metrics = metrics or RunMetrics('adlog_500_manager')
+        
         # ADLOG 로그인 정보
         self.username = os.getenv('ADLOG_USERNAME')
         self.password = os.getenv('ADLOG_PASSWORD')
@@ -39,20 +59,33 @@ class Adlog500Manager:
             self.supabase = None
             print("⚠️ Supabase 연결 실패")
         
-        # 추적할 키워드 목록
-        self.keywords = [
-            "강남 맛집",
-            "강남 치킨",
-            "강남 카페",
-            "서초 맛집",
-            "송파 맛집",
-            "역삼 맛집",
-            "선릉 맛집",
-            "삼성 맛집"
-        ]
+        # 추적할 키워드 목록 (tracking_keywords 테이블, 없으면 공용 기본 목록)
+        self.keywords = [keyword.query for keyword in registry.load_tracked(self.supabase)]
         
         self.all_restaurants = []  # 500개 식당 정보
         self.today_rankings = []   # 오늘의 순위 데이터
+        
+        # 리포트 조회 캐시 (순위 저장 시 무효화, 다른 매니저 인스턴스의 캐시도 함께)
+        self.report_cache = ReportCache(max_entries=256, namespace='adlog_reports')
+    
+    def _cached_query(self, name, params, loader):
+        """
+        리포트 쿼리를 캐시를 거쳐 실행
+        
+        Args:
+            name: 쿼리 이름 (REPORT_CACHE_TTL 키)
+            params: 캐시 키에 포함할 조회 조건
+            loader: 실제 DB 조회 함수 (.data 반환)
+        """
+        def timed_loader():
+            with self.metrics.timer('db_read'):
+                return loader()
+        
+        return self.report_cache.get_or_load(
+            (name,) + tuple(params),
+            timed_loader,
+            ttl=self.REPORT_CACHE_TTL.get(name)
+        )
     
     def sync_restaurants_to_db(self, restaurants_data):
         """
@@ -66,6 +99,7 @@ class Adlog500Manager:
             return False
         
         try:
+            db_started = time.perf_counter()
             for restaurant in restaurants_data:
                 # adlog_restaurants 테이블에 upsert
                 self.supabase.table('adlog_restaurants').upsert({
@@ -79,6 +113,12 @@ class Adlog500Manager:
                     'updated_at': datetime.now().isoformat()
                 }).execute()
             
+            self.metrics.record('db_write', time.perf_counter() - db_started)
+            self.metrics.incr('db_rows_written', len(restaurants_data))
+            
+            # 식당명이 리포트 조인 결과에 포함되므로 캐시 무효화
+            self.report_cache.invalidate()
+            
             print(f"✅ {len(restaurants_data)}개 식당 정보 동기화 완료")
             return True
             
@@ -100,16 +140,16 @@ class Adlog500Manager:
             today = datetime.now().strftime('%Y-%m-%d')
             current_time = datetime.now().strftime('%H:%M:%S')
             
+            # 식당 ID 매핑 한 번에 조회 (place_name -> id)
+            with self.metrics.timer('db_read'):
+                restaurant_ids = fetch_map(self.supabase, 'adlog_restaurants', 'place_name')
+            
+            db_started = time.perf_counter()
+            saved = 0
             for ranking in rankings_data:
-                # 식당 ID 조회
-                restaurant = self.supabase.table('adlog_restaurants')\
-                    .select("id")\
-                    .eq('place_name', ranking['place_name'])\
-                    .execute()
+                restaurant_id = restaurant_ids.get(ranking['place_name'])
                 
-                if restaurant.data:
-                    restaurant_id = restaurant.data[0]['id']
-                    
+                if restaurant_id:
                     # 순위 데이터 저장
                     self.supabase.table('daily_rankings').upsert({
                         'search_date': today,
@@ -118,6 +158,14 @@ class Adlog500Manager:
                         'restaurant_id': restaurant_id,
                         'rank': ranking['rank']
                     }).execute()
+                    saved += 1
+            
+            self.metrics.record('db_write', time.perf_counter() - db_started)
+            self.metrics.incr('db_rows_written', saved)
+            
+            # 오늘 날짜 요약 테이블 갱신 후 리포트 캐시 무효화
+            refresh_daily_summary(self.supabase, today, self.metrics)
+            self.report_cache.invalidate()
             
             print(f"✅ {len(rankings_data)}개 순위 데이터 저장 완료")
             return True
@@ -134,32 +182,36 @@ class Adlog500Manager:
         try:
             today = datetime.now().strftime('%Y-%m-%d')
             
-            # 오늘의 TOP 20 조회
-            top20 = self.supabase.table('today_top20')\
-                .select("*")\
-                .execute()
+            # 오늘의 TOP 20 조회 (수집 후 갱신된 요약 테이블)
+            top20 = self._cached_query('today_top20', (today,), lambda: self.supabase.table('daily_top20')\
+                .select("rank, place_name, category, address, rank_change, search_keyword")\
+                .eq('search_date', today)\
+                .order('search_keyword')\
+                .order('rank')\
+                .execute().data)
             
             # 가장 많이 상승한 식당
-            top_gainers = self.supabase.table('daily_rankings')\
+            top_gainers = self._cached_query('top_gainers', (today,), lambda: self.supabase.table('daily_rankings')\
                 .select("*, adlog_restaurants(place_name)")\
                 .eq('search_date', today)\
                 .order('rank_change', desc=True)\
                 .limit(10)\
-                .execute()
+                .execute().data)
             
-            # 우리 회원 순위
-            member_rankings = self.supabase.table('member_rankings')\
-                .select("*")\
+            # 우리 회원 순위 (요약 테이블)
+            member_rankings = self._cached_query('member_rankings', (today,), lambda: self.supabase.table('member_rankings')\
+                .select("place_name, user_id, rank, rank_change, search_keyword, search_date")\
                 .eq('search_date', today)\
-                .execute()
+                .order('rank')\
+                .execute().data)
             
             report = {
                 'date': today,
                 'total_restaurants': 500,
                 'tracked_keywords': len(self.keywords),
-                'top20': top20.data if top20 else [],
-                'top_gainers': top_gainers.data if top_gainers else [],
-                'member_rankings': member_rankings.data if member_rankings else [],
+                'top20': top20 or [],
+                'top_gainers': top_gainers or [],
+                'member_rankings': member_rankings or [],
                 'summary': {
                     'new_entries': 0,  # 신규 진입
                     'big_movers': 0,   # 큰 변동
@@ -255,26 +307,38 @@ class Adlog500Manager:
             start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
             end_date = datetime.now().strftime('%Y-%m-%d')
             
-            # 기간 내 순위 상승률이 높은 식당
-            trending = self.supabase.table('ranking_statistics')\
+            # 기간 내 순위 상승률이 높은 식당 (요약 작업이 매일 갱신하는 주간 통계 중 가장 최근 기간)
+            # 요약 작업이 하루 빠져도 빈 결과가 되지 않도록 오늘 이전에 끝난 기간까지 읽음
+            trending = self._cached_query('ranking_statistics', (start_date, end_date), lambda: self.supabase.table('ranking_statistics')\
                 .select("*, adlog_restaurants(place_name, category)")\
                 .eq('period_type', 'weekly')\
                 .gte('period_start', start_date)\
                 .lte('period_end', end_date)\
+                .order('period_end', desc=True)\
                 .order('times_in_top10', desc=True)\
                 .limit(20)\
-                .execute()
+                .execute().data)
             
-            return trending.data if trending else []
+            # 가장 최근 기간 행만 (같은 식당의 이전 기간 행 제외)
+            latest = trending[0]['period_end'] if trending else None
+            return [row for row in trending or [] if row['period_end'] == latest]
             
         except Exception as e:
             print(f"❌ 트렌딩 분석 실패: {str(e)}")
             return None
     
-    def export_to_excel(self, filename=None):
+    def export_to_excel(self, filename=None, streaming=False):
         """
         전체 데이터를 엑셀로 내보내기
+        
+        Args:
+            filename: 파일 이름
+            streaming: True면 행 단위 스트리밍 방식 사용 (대용량 권장)
         """
+        if streaming:
+            files = self.export_streaming(filename, fmt='xlsx')
+            return files[0] if files else None
+        
         if not filename:
             filename = f"adlog_500_report_{datetime.now().strftime('%Y%m%d')}.xlsx"
         
@@ -293,7 +357,7 @@ class Adlog500Manager:
                     df_rankings = pd.DataFrame(self.today_rankings)
                     df_rankings.to_excel(writer, sheet_name='오늘순위', index=False)
                 
-                # 3. 일일 리포트
+                # 3. 일일 리포트 (같은 날 이미 조회했다면 캐시에서 읽음)
                 report = self.generate_daily_report()
                 if report:
                     df_report = pd.DataFrame(report['top20'])
@@ -308,6 +372,64 @@ class Adlog500Manager:
         except Exception as e:
             print(f"❌ 엑셀 내보내기 실패: {str(e)}")
             return None
+    
+    def iter_today_rankings(self, page_size=1000):
+        """
+        오늘 순위 데이터를 키셋 페이지 단위로 조회하며 한 행씩 반환
+        (메모리에 수집 데이터가 없을 때 스트리밍 내보내기에서 사용)
+        """
+        if not self.supabase:
+            return iter(())
+        
+        today = datetime.now().strftime('%Y-%m-%d')
+        return iter_rows(self.supabase, 'daily_rankings', "*, adlog_restaurants(place_name)",
+                         filters=[('eq', 'search_date', today)], page_size=page_size)
+    
+    def export_streaming(self, filename=None, fmt='xlsx', engine='openpyxl'):
+        """
+        대용량 리포트 스트리밍 내보내기 (DataFrame 없이 행 단위 기록)
+        
+        Args:
+            filename: 파일 이름 (확장자 포함)
+            fmt: 'xlsx', 'csv', 'parquet'
+            engine: xlsx 엔진 ('openpyxl' 또는 'xlsxwriter')
+        """
+        if not filename:
+            filename = f"adlog_500_report_{datetime.now().strftime('%Y%m%d')}.{fmt}"
+        
+        filepath = f"scraping/reports/{filename}"
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        
+        try:
+            started = time.perf_counter()
+            
+            with StreamingReportExporter(filepath, fmt=fmt, engine=engine) as exporter:
+                # 1. 전체 식당 목록
+                if self.all_restaurants:
+                    exporter.write_sheet('전체식당', self.all_restaurants)
+                
+                # 2. 오늘의 순위 (수집 데이터가 없으면 DB에서 페이지 단위로 읽음)
+                if self.today_rankings:
+                    exporter.write_sheet('오늘순위', self.today_rankings)
+                elif self.supabase:
+                    exporter.write_sheet('오늘순위', self.iter_today_rankings())
+                
+                # 3. 일일 리포트
+                report = self.generate_daily_report()
+                if report:
+                    exporter.write_sheet('TOP20', report['top20'])
+                    exporter.write_sheet('급상승', report['top_gainers'])
+            
+            elapsed = time.perf_counter() - started
+            total_rows = sum(exporter.row_counts.values())
+            print(f"✅ 스트리밍 내보내기 완료: {total_rows:,}행, {elapsed:.2f}초")
+            for path in exporter.files:
+                print(f"  📁 {path}")
+            return exporter.files
+            
+        except Exception as e:
+            print(f"❌ 스트리밍 내보내기 실패: {str(e)}")
+            return None
 
 
 # 사용 예제
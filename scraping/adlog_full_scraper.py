@@ -15,11 +15,45 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 import pandas as pd
 from dotenv import load_dotenv
 from supabase import create_client
+from paged_reader import fetch_map
+from run_metrics import RunMetrics
+from browser_profile import lean_profile_enabled, apply_lean_options, enable_network_blocking
+from driver_resolver import resolve_chromedriver
+from rate_limiter import AdaptiveRateLimiter, looks_blocked
+from driver_watchdog import DriverWatchdog
+from block_detector import CircuitBreaker, classify_page, BLOCKED
+from keyword_registry import registry, parse_keyword
+from models import Restaurant, RankingRow, ValidationError, as_dicts, place_id_from_url
+from dom_extract import extract_table_rows, html_table_rows, find_next_page_element, NEXT_PAGE_TEXTS
+from table_columns import column_map
+from deep_rank import PAGE_SIZE, RankTargets, load_keyword_targets, rank_depth, walk_result_pages
+from daily_summary import refresh_daily_summary
+from supabase_uploader import bulk_save_run
+from locator_cache import LocatorCache
+from tab_pool import TabPool
+from run_deadline import RunDeadline, load_deferred, save_deferred
+from refresh_scheduler import PRIOR_VOLATILITY
+from pagination import PageUrlPattern, PageFetchError, fetch_pages, last_page_number, session_from_driver
+
+# 검색 결과 테이블 선택자 (HTML 파서와 같은 우선순위)
+SEARCH_TABLE_SELECTORS = ['table.ranking', 'table']
+
+RANK_CHECK_URL = "https://adlog.kr/adlog/naver_place_rank_check.php"
+
+# arguments: [검색 입력 요소, 키워드] - 값 넣고 폼 제출 (새 페이지 로딩을 기다리지 않음)
+SUBMIT_SEARCH_JS = """
+const input = arguments[0];
+input.value = arguments[1];
+input.dispatchEvent(new Event('input', {bubbles: true}));
+const form = input.form;
+if (form && form.requestSubmit) { form.requestSubmit(); }
+else if (form) { form.submit(); }
+else { input.dispatchEvent(new KeyboardEvent('keydown', {key: 'Enter', keyCode: 13, bubbles: true})); }
+"""
 
 # 환경변수 로드
 env_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
@@ -28,8 +62,24 @@ if os.path.exists(env_path):
     print(f"✅ .env 파일 로드 완료")
 
 class AdlogFullScraper:
-    def __init__(self, headless=False):
-        """초기화"""
+    def __init__(self, headless=False, metrics=None, lean=None, dom_extraction=True, rate_limiter=None,
+                 locators=None, max_rank=None, breaker=None, watchdog=None, scheduler=None):
+        """
+        초기화
+        Args:
+            headless: True면 브라우저 창 안 보임
+            metrics: 실행 계측 객체 (없으면 새로 생성)
+            lean: 경량 프로필 (이미지/폰트/트래커 차단 + eager 로딩), None이면 ADLOG_LEAN_PROFILE (기본 꺼짐)
+            dom_extraction: True면 execute_script로 결과 행만 추출 (실패 시 HTML 파싱)
+            rate_limiter: 요청 간격 제한기 (없으면 ADLOG 공유 제한기)
+            locators: 선택자 캐시 (없으면 공유 캐시)
+            max_rank: 키워드당 수집할 최대 순위 (None이면 ADLOG_RANK_DEPTH, 20 넘으면 다음 결과 페이지까지)
+            breaker: 서킷 브레이커 (없으면 새로 생성, 차단/로그인 만료/빈 결과가 이어지면 정지·재로그인·중단)
+            watchdog: 브라우저 세션 감시 (없으면 새로 생성, 끊긴 세션 재시작 / 오래 쓴 브라우저 교체)
+            scheduler: 키워드 변동성 기록이 있는 RefreshScheduler (같은 우선순위 키워드 순서에 사용, 없으면 변동성 무시)
+        """
+        self.metrics = metrics or RunMetrics('full_collection')
+        
         # ADLOG 로그인 정보
         self.username = os.getenv('ADLOG_USERNAME')
         self.password = os.getenv('ADLOG_PASSWORD')
@@ -56,8 +106,23 @@ class AdlogFullScraper:
         self.chrome_options.add_experimental_option('useAutomationExtension', False)
         self.chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
         
+        # 경량 프로필 (파싱에 필요 없는 리소스 차단)
+        self.lean = lean_profile_enabled(lean)
+        if self.lean:
+            apply_lean_options(self.chrome_options)
+        
+        self.dom_extraction = dom_extraction
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter.shared()
+        self.locators = locators or LocatorCache.shared()
+        self.max_rank = rank_depth(max_rank)
+        self.breaker = breaker or CircuitBreaker(metrics=self.metrics)
+        self.watchdog = watchdog or DriverWatchdog(self, breaker=self.breaker, metrics=self.metrics)
+        self.scheduler = scheduler
+        self.keyword_targets = None  # 깊은 순위 수집에서 키워드별로 찾을 회원 식당 (None이면 깊이 끝까지)
+        self.last_page_load = None
         self.driver = None
         self.logged_in = False
+        self.owns_driver = True  # False면 close()에서 종료하지 않음 (드라이버 풀)
         
         # 수집 데이터
         self.restaurants = []
@@ -67,70 +132,147 @@ class AdlogFullScraper:
         """드라이버 시작"""
         try:
             print("🚀 Chrome 드라이버 시작...")
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
-            self.driver.implicitly_wait(10)
-            print("✅ 드라이버 시작 완료")
+            started = time.perf_counter()
+            with self.metrics.timer('driver_start'):
+                service = Service(resolve_chromedriver(metrics=self.metrics))
+                self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
+                if self.lean:
+                    enable_network_blocking(self.driver)
+            # 요소 대기는 선택자 캐시가 직접 처리 (없는 후보마다 implicit wait를 기다리지 않도록)
+            self.driver.implicitly_wait(0)
+            print(f"✅ 드라이버 시작 완료 ({time.perf_counter() - started:.1f}초)")
             return True
         except Exception as e:
             print(f"❌ 드라이버 시작 실패: {str(e)}")
             return False
     
+    def open_page(self, url):
+        """페이지 이동 (로딩 시간 계측)"""
+        started = time.perf_counter()
+        with self.metrics.timer('page_load'):
+            self.driver.get(url)
+        self.last_page_load = time.perf_counter() - started
+        self.metrics.incr('page_loads')
+    
+    def locate(self, page, step, candidates, **kwargs):
+        """후보 선택자 중 먼저 찾은 요소 (LocatorCache.find 참고)"""
+        return self.locators.find(self.driver, page, step, candidates, metrics=self.metrics, **kwargs)
+    
+    def page_looks_blocked(self):
+        """현재 페이지가 차단/캡차 화면인지 (본문 앞부분만 확인)"""
+        try:
+            text = self.driver.execute_script(
+                "return document.body ? document.body.innerText.slice(0, 3000) : '';")
+        except Exception:
+            return False
+        return looks_blocked(text)
+    
+    def search_with_limit(self, search, keyword):
+        """
+        공유 속도 제한을 지키며 검색 1회 실행 후 결과를 제한기에 반영
+        
+        Args:
+            search: 검색 함수 (결과 리스트 반환)
+            keyword: 검색 키워드
+        """
+        # 오래 쓴 브라우저는 검색 전에 교체, 검색 중 세션이 끊기면 다시 띄워 같은 키워드 재시도
+        self.watchdog.maybe_recycle()
+        self.rate_limiter.wait(self.metrics)
+        
+        self.last_page_load = None
+        started = time.perf_counter()
+        rankings = self.watchdog.run(search, keyword)
+        
+        # 결과가 없으면 차단 / 로그인 만료 / 빈 결과 구분 → 서킷 브레이커
+        outcome = classify_page(self.driver, bool(rankings))
+        blocked = outcome == BLOCKED
+        if blocked:
+            self.metrics.incr('blocked_responses')
+        self.rate_limiter.record(self.last_page_load, ok=bool(rankings), blocked=blocked)
+        self.respond_to(outcome, time.perf_counter() - started)
+        return rankings
+    
+    def respond_to(self, outcome, elapsed):
+        """
+        분류한 응답을 서킷 브레이커에 반영하고 조치 (일시 정지 / 다시 로그인)
+        
+        Returns:
+            계속해도 되는지 (False면 중단)
+        """
+        action = self.breaker.record(outcome, elapsed)
+        if action == 'pause':
+            self.breaker.pause()
+        elif action == 'relogin':
+            print("🔐 로그인 화면이 나와 다시 로그인")
+            self.logged_in = False
+            if not self.login():
+                self.breaker.abort("다시 로그인 실패")
+        return not self.breaker.aborted
+    
+    def attach_driver(self, driver):
+        """
+        이미 로그인된 드라이버 연결 (드라이버 풀에서 빌린 경우)
+        브라우저 시작/로그인 없이 바로 수집하고, close()해도 브라우저는 종료하지 않음
+        """
+        self.driver = driver
+        self.logged_in = True
+        self.owns_driver = False
+    
     def login(self):
         """ADLOG 로그인"""
+        if self.driver and self.logged_in:
+            return True
+        
         if not self.driver:
             if not self.start_driver():
                 return False
         
+        with self.metrics.timer('login'):
+            return self._login()
+    
+    def _login(self):
+        """로그인 폼 입력 및 결과 확인"""
         try:
             print("\n🔐 ADLOG 로그인 중...")
             
             # 1. 메인 페이지 접속
-            self.driver.get("https://adlog.kr")
-            time.sleep(2)
+            self.open_page("https://adlog.kr")
+            self.metrics.sleep(2)
             
             # 2. 로그인 페이지로 이동
-            try:
-                login_link = self.driver.find_element(By.LINK_TEXT, "로그인")
+            login_link = self.locate('main', 'login_link', [(By.LINK_TEXT, "로그인")], timeout=3, required=False)
+            if login_link:
                 login_link.click()
-            except:
-                self.driver.get("https://adlog.kr/login")
+            else:
+                self.open_page("https://adlog.kr/login")
             
-            time.sleep(2)
+            self.metrics.sleep(2)
             
             # 3. 로그인 정보 입력
-            # ID 입력
-            id_input = None
-            for name in ['userid', 'id', 'username']:
-                try:
-                    id_input = self.driver.find_element(By.NAME, name)
-                    break
-                except:
-                    continue
-            
-            if not id_input:
-                id_input = self.driver.find_element(By.CSS_SELECTOR, "input[type='text']")
+            # ID 입력 (후보 전체를 한 번에 확인, 지난번에 찾은 선택자 우선)
+            id_input = self.locate('login', 'username', [
+                (By.NAME, 'userid'),
+                (By.NAME, 'id'),
+                (By.NAME, 'username'),
+                (By.CSS_SELECTOR, "input[type='text']")
+            ])
             
             id_input.clear()
             id_input.send_keys(self.username)
             
             # PW 입력
-            pw_input = None
-            for name in ['passwd', 'password', 'pw']:
-                try:
-                    pw_input = self.driver.find_element(By.NAME, name)
-                    break
-                except:
-                    continue
-            
-            if not pw_input:
-                pw_input = self.driver.find_element(By.CSS_SELECTOR, "input[type='password']")
+            pw_input = self.locate('login', 'password', [
+                (By.NAME, 'passwd'),
+                (By.NAME, 'password'),
+                (By.NAME, 'pw'),
+                (By.CSS_SELECTOR, "input[type='password']")
+            ])
             
             pw_input.clear()
             pw_input.send_keys(self.password)
             pw_input.send_keys(Keys.RETURN)
             
-            time.sleep(3)
+            self.metrics.sleep(3)
             
             # 4. 로그인 성공 확인
             if "login" not in self.driver.current_url.lower():
@@ -145,6 +287,216 @@ class AdlogFullScraper:
             print(f"❌ 로그인 중 오류: {str(e)}")
             return False
     
+    def parse_restaurant_page(self, page_source, restaurants, seen_ids=None):
+        """
+        식당 목록 페이지 HTML 파싱 (DOM 직접 추출을 못 쓸 때 사용)
+        
+        Args:
+            page_source: 페이지 HTML
+            restaurants: 수집 중인 식당 리스트 (새 식당을 여기에 추가)
+            seen_ids: 이미 수집한 place_id 집합 (없으면 restaurants에서 생성)
+        
+        Returns:
+            이 페이지에서 새로 추가한 식당 수
+        """
+        soup = BeautifulSoup(page_source, 'html.parser')
+        
+        # 테이블에서 행 추출 (헤더 제외, 테이블별 헤더는 행에 같이 전달)
+        rows = []
+        for table in soup.find_all('table'):
+            rows.extend(html_table_rows(table))
+        
+        return self.add_restaurant_rows(rows, restaurants, seen_ids)
+    
+    def add_restaurant_rows(self, rows, restaurants, seen_ids=None):
+        """
+        추출한 테이블 행을 식당 정보로 변환
+        
+        Args:
+            rows: [(셀 텍스트 리스트, 플레이스 링크, 헤더 셀 튜플), ...]
+            restaurants: 수집 중인 식당 리스트 (새 식당을 여기에 추가)
+            seen_ids: 이미 수집한 place_id 집합 (없으면 restaurants에서 생성)
+        
+        Returns:
+            새로 추가한 식당 수
+        """
+        if seen_ids is None:
+            seen_ids = {r['place_id'] for r in restaurants}
+        
+        page_restaurants = 0
+        collected_at = datetime.now().isoformat()
+        
+        for cols, place_url, headers in rows:
+            if not place_url:
+                continue
+            
+            # place_id 추출
+            place_id = place_id_from_url(place_url)
+            
+            # 중복 체크
+            if place_id in seen_ids:
+                continue
+            
+            # 헤더로 찾은 컬럼 위치에서 바로 추출 (같은 헤더 구성은 캐시)
+            columns = column_map(headers)
+            
+            try:
+                restaurant = Restaurant(
+                    place_id=place_id,
+                    place_name=columns.text(cols, 'place_name'),
+                    category=columns.text(cols, 'category'),
+                    address=columns.text(cols, 'address'),
+                    blog_count=columns.int_value(cols, 'blog_count'),
+                    visitor_review_count=columns.int_value(cols, 'visitor_review_count'),
+                    n1_score=columns.float_value(cols, 'n1_score'),
+                    n2_score=columns.float_value(cols, 'n2_score'),
+                    n3_score=columns.float_value(cols, 'n3_score'),
+                    collected_at=collected_at
+                )
+            except ValidationError as e:
+                print(f"  ⚠️ 행 건너뜀: {str(e)}")
+                continue
+            restaurants.append(restaurant)
+            seen_ids.add(place_id)
+            page_restaurants += 1
+            print(f"  📍 {len(restaurants)}. {restaurant.place_name} (ID: {place_id})")
+        
+        return page_restaurants
+    
+    def find_next_page(self, next_page_num, page='restaurant_list'):
+        """
+        다음 페이지 버튼 찾기 (page: 선택자 캐시 키, 식당 목록 / 검색 결과)
+        
+        DOM 직접 추출 모드면 스크립트 한 번으로 찾고,
+        아니면(또는 실패하면) 선택자 캐시로 후보 전체를 한 번에 확인 (지난번에 찾은 후보 우선)
+        """
+        if self.dom_extraction:
+            try:
+                return find_next_page_element(self.driver, next_page_num)
+            except Exception as e:
+                print(f"⚠️ 스크립트로 다음 페이지 찾기 실패: {str(e)}")
+        
+        target = str(next_page_num)
+        
+        # 방법 1: 숫자 버튼
+        candidates = [
+            (By.XPATH, f"//*[(self::a or self::button) and contains(@class, 'page-link') "
+                       f"and normalize-space()='{target}']")
+        ]
+        # 방법 2: "다음" 또는 "더보기" 버튼 (정확히 일치 우선, 그다음 부분 일치)
+        for text in NEXT_PAGE_TEXTS:
+            candidates += [(By.LINK_TEXT, text), (By.PARTIAL_LINK_TEXT, text)]
+        # 방법 3: 페이지네이션 영역
+        candidates.append(
+            (By.XPATH, "//*[contains(@class, 'pagination') or contains(@class, 'paging') "
+                       f"or contains(@class, 'page-navigation')]//a[contains(., '{target}')]")
+        )
+        
+        return self.locate(page, 'next_page', candidates, timeout=0, required=False)
+    
+    def parse_current_page(self, page_num, restaurants, seen_ids):
+        """브라우저에 열린 목록 페이지 파싱 (DOM 직접 추출, 실패 시 HTML 파싱)"""
+        print(f"\n📄 {page_num}페이지 수집 중...")
+        
+        parse_started = time.perf_counter()
+        rows = extract_table_rows(self.driver, all_tables=True) if self.dom_extraction else None
+        if rows is not None:
+            page_restaurants = self.add_restaurant_rows(rows, restaurants, seen_ids)
+        else:
+            page_restaurants = self.parse_restaurant_page(self.driver.page_source, restaurants, seen_ids)
+        
+        self.metrics.record('parse', time.perf_counter() - parse_started)
+        print(f"  ✅ {page_num}페이지: {page_restaurants}개 식당 수집")
+        return page_restaurants
+    
+    def fetch_remaining_pages(self, restaurants, seen_ids, max_pages):
+        """
+        2페이지부터 URL로 동시에 요청해 파싱 (로그인된 브라우저 쿠키 사용)
+        
+        Returns:
+            True면 완료, False면 주소 규칙을 모르거나 요청 실패 (클릭 방식으로 대체, 목록은 그대로)
+        """
+        try:
+            next_page = self.find_next_page(2)
+            href = next_page.get_attribute('href') if next_page else None
+        except Exception:
+            href = None
+        
+        pattern = PageUrlPattern.discover(href, 2)
+        if not pattern:
+            return False
+        
+        last_page = min(max_pages, last_page_number(self.driver) or max_pages)
+        pages = list(range(2, last_page + 1))
+        if not pages:
+            return True
+        
+        print(f"\n⚡ {len(pages)}개 페이지 동시 요청 ({pattern})")
+        self.rate_limiter.wait(self.metrics)
+        started = time.perf_counter()
+        try:
+            with self.metrics.timer('page_fetch_batch'):
+                htmls = fetch_pages(session_from_driver(self.driver), pattern, pages, metrics=self.metrics)
+        except PageFetchError as e:
+            self.rate_limiter.record(ok=False)
+            print(f"⚠️ 페이지 동시 요청 실패, 클릭 방식으로 이동: {str(e)}")
+            return False
+        self.rate_limiter.record((time.perf_counter() - started) / len(pages), ok=True)
+        
+        for page_num, html in zip(pages, htmls):
+            parse_started = time.perf_counter()
+            page_restaurants = self.parse_restaurant_page(html, restaurants, seen_ids)
+            self.metrics.record('parse', time.perf_counter() - parse_started)
+            print(f"  ✅ {page_num}페이지: {page_restaurants}개 식당 수집")
+            
+            if page_restaurants == 0:
+                if page_num == 2:
+                    # 목록이 스크립트로 그려지는 페이지 (HTML에 행이 없음)
+                    print("⚠️ 받은 페이지에 목록이 없어 클릭 방식으로 이동")
+                    return False
+                break
+            if len(restaurants) >= 500:
+                break
+        
+        return True
+    
+    def walk_pages_by_click(self, restaurants, seen_ids, max_pages):
+        """다음 페이지 버튼을 눌러 한 페이지씩 이동하며 파싱 (URL로 열 수 없을 때)"""
+        page_num = 1
+        
+        while page_num < max_pages and len(restaurants) < 500:
+            # 다음 페이지로 이동
+            try:
+                # 페이지 번호 / 다음 버튼 찾기
+                next_page = self.find_next_page(page_num + 1)
+                
+                if next_page:
+                    self.driver.execute_script("arguments[0].scrollIntoView(true);", next_page)
+                    self.metrics.sleep(1)
+                    next_page.click()
+                    self.metrics.sleep(3)
+                    page_num += 1
+                else:
+                    print(f"\n⚠️ 더 이상 페이지가 없습니다. (마지막 페이지: {page_num})")
+                    break
+                    
+            except Exception as e:
+                print(f"\n⚠️ 페이지 이동 실패: {str(e)}")
+                # 더보기 버튼 시도
+                try:
+                    more_btn = self.locate('restaurant_list', 'more_button', [
+                        (By.XPATH, "//button[contains(., '더보기')]"),
+                        (By.XPATH, "//a[contains(., '더보기')]")
+                    ], timeout=0)
+                    more_btn.click()
+                    self.metrics.sleep(3)
+                    page_num += 1
+                except:
+                    print("더 이상 페이지를 불러올 수 없습니다.")
+                    break
+            
+            self.parse_current_page(page_num, restaurants, seen_ids)
+    
     def get_restaurant_list(self):
         """500개 식당 목록 가져오기 (페이지네이션 처리)"""
         if not self.logged_in:
@@ -155,179 +507,32 @@ class AdlogFullScraper:
             print("\n📊 식당 목록 수집 중 (500개 목표)...")
             
             # 순위 체크 페이지로 이동
-            self.driver.get("https://adlog.kr/adlog/naver_place_rank_check.php")
-            time.sleep(3)
+            self.open_page(RANK_CHECK_URL)
+            self.metrics.sleep(3)
             
             restaurants = []
-            page_num = 1
+            seen_ids = set()
             max_pages = 10  # 최대 10페이지까지 확인
             
-            while page_num <= max_pages:
-                print(f"\n📄 {page_num}페이지 수집 중...")
-                
-                # 현재 페이지 파싱
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                
-                # 테이블에서 식당 정보 추출
-                tables = soup.find_all('table')
-                page_restaurants = 0
-                
-                for table in tables:
-                    rows = table.find_all('tr')[1:]  # 헤더 제외
-                    for row in rows:
-                        cols = row.find_all('td')
-                        if len(cols) >= 2:
-                            # place URL 추출
-                            place_link = row.find('a', href=lambda x: x and 'place.naver.com' in x)
-                            if place_link:
-                                place_url = place_link.get('href')
-                                # place_id 추출
-                                if '/restaurant/' in place_url:
-                                    place_id = place_url.split('/restaurant/')[-1].split('?')[0]
-                                else:
-                                    place_id = place_url.split('/')[-1].split('?')[0]
-                                
-                                # 중복 체크
-                                if not any(r['place_id'] == place_id for r in restaurants):
-                                # 블로그 수와 방문자리뷰 수 추출
-                                blog_count = 0
-                                visitor_count = 0
-                                n1_score = 0.0
-                                n2_score = 0.0
-                                n3_score = 0.0
-                                
-                                # 테이블 컴럼에서 데이터 찾기
-                                for idx, col in enumerate(cols):
-                                    col_text = col.get_text(strip=True)
-                                    
-                                    # 블로그/방문자 수 (숫자,숫자 형태)
-                                    if ',' in col_text and col_text.replace(',', '').isdigit():
-                                        try:
-                                            num = int(col_text.replace(',', ''))
-                                            if blog_count == 0:
-                                                blog_count = num
-                                            elif visitor_count == 0:
-                                                visitor_count = num
-                                        except:
-                                            pass
-                                    
-                                    # N1, N2, N3 점수 (0.XXXXXX 형태)
-                                    elif '0.' in col_text:
-                                        try:
-                                            score = float(col_text)
-                                            if 0.56 <= score <= 0.58 and n1_score == 0:  # N1 범위
-                                                n1_score = score
-                                            elif 0.79 <= score <= 0.83 and n2_score == 0:  # N2 범위
-                                                n2_score = score
-                                            elif 0.43 <= score <= 0.44 and n3_score == 0:  # N3 범위
-                                                n3_score = score
-                                        except:
-                                            pass
-                                
-                                restaurant = {
-                                    'place_id': place_id,
-                                    'place_name': cols[1].get_text(strip=True),
-                                    'place_url': f"https://m.place.naver.com/restaurant/{place_id}",
-                                    'category': cols[2].get_text(strip=True) if len(cols) > 2 else '',
-                                    'address': cols[3].get_text(strip=True) if len(cols) > 3 else '',
-                                    'blog_count': blog_count,
-                                    'visitor_review_count': visitor_count,
-                                    'n1_score': n1_score if n1_score > 0 else None,
-                                    'n2_score': n2_score if n2_score > 0 else None,
-                                    'n3_score': n3_score if n3_score > 0 else None,
-                                    'collected_at': datetime.now().isoformat()
-                                }
-                                    restaurants.append(restaurant)
-                                    page_restaurants += 1
-                                    print(f"  📍 {len(restaurants)}. {restaurant['place_name']} (ID: {place_id})")
-                
-                print(f"  ✅ {page_num}페이지: {page_restaurants}개 식당 수집")
-                
-                # 500개 도달 시 중단
-                if len(restaurants) >= 500:
-                    print(f"\n🎯 목표 500개 달성! (현재: {len(restaurants)}개)")
-                    break
-                
-                # 다음 페이지로 이동
-                try:
-                    # 페이지 번호 클릭 시도
-                    next_page = None
-                    
-                    # 방법 1: 숫자 버튼 찾기
-                    page_links = self.driver.find_elements(By.CSS_SELECTOR, "a.page-link, button.page-link")
-                    for link in page_links:
-                        if link.text.strip() == str(page_num + 1):
-                            next_page = link
-                            break
-                    
-                    # 방법 2: "다음" 또는 "더보기" 버튼
-                    if not next_page:
-                        for text in ['다음', '더보기', 'Next', '>', '>>', '다음 페이지']:
-                            try:
-                                next_page = self.driver.find_element(By.LINK_TEXT, text)
-                                break
-                            except:
-                                try:
-                                    next_page = self.driver.find_element(By.PARTIAL_LINK_TEXT, text)
-                                    break
-                                except:
-                                    continue
-                    
-                    # 방법 3: 페이지네이션 영역에서 찾기
-                    if not next_page:
-                        pagination = self.driver.find_element(By.CSS_SELECTOR, ".pagination, .paging, .page-navigation")
-                        links = pagination.find_elements(By.TAG_NAME, "a")
-                        for link in links:
-                            if str(page_num + 1) in link.text:
-                                next_page = link
-                                break
-                    
-                    if next_page:
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", next_page)
-                        time.sleep(1)
-                        next_page.click()
-                        time.sleep(3)
-                        page_num += 1
-                    else:
-                        print(f"\n⚠️ 더 이상 페이지가 없습니다. (마지막 페이지: {page_num})")
-                        break
-                        
-                except Exception as e:
-                    print(f"\n⚠️ 페이지 이동 실패: {str(e)}")
-                    # 더보기 버튼 시도
-                    try:
-                        more_btn = self.driver.find_element(By.CSS_SELECTOR, "button:contains('더보기'), a:contains('더보기')")
-                        more_btn.click()
-                        time.sleep(3)
-                        page_num += 1
-                    except:
-                        print("더 이상 페이지를 불러올 수 없습니다.")
-                        break
+            self.parse_current_page(1, restaurants, seen_ids)
+            
+            if len(restaurants) < 500:
+                # 페이지 주소 규칙을 알면 나머지 페이지를 한 번에 요청, 아니면 클릭으로 한 페이지씩 이동
+                if not self.fetch_remaining_pages(restaurants, seen_ids, max_pages):
+                    self.walk_pages_by_click(restaurants, seen_ids, max_pages)
+            
+            if len(restaurants) >= 500:
+                print(f"\n🎯 목표 500개 달성! (현재: {len(restaurants)}개)")
             
             # 추가 방법: Select 박스나 드롭다운에서 식당 목록 추출
             if len(restaurants) < 500:
                 try:
-                    # select 박스 찾기
-                    select_elements = self.driver.find_elements(By.TAG_NAME, "select")
-                    for select in select_elements:
-                        options = select.find_elements(By.TAG_NAME, "option")
-                        for option in options:
-                            value = option.get_attribute('value')
-                            if value and 'place.naver.com' in value:
-                                if '/restaurant/' in value:
-                                    place_id = value.split('/restaurant/')[-1].split('?')[0]
-                                    if not any(r['place_id'] == place_id for r in restaurants):
-                                        restaurants.append({
-                                            'place_id': place_id,
-                                            'place_name': option.text.strip(),
-                                            'place_url': f"https://m.place.naver.com/restaurant/{place_id}",
-                                            'collected_at': datetime.now().isoformat()
-                                        })
-                                        print(f"  📍 {len(restaurants)}. {option.text.strip()} (ID: {place_id})")
-                except:
-                    pass
+                    self.add_select_options(self.read_select_options(), restaurants, seen_ids)
+                except Exception as e:
+                    print(f"⚠️ 선택 목록에서 식당 추출 실패: {str(e)}")
             
             self.restaurants = restaurants
+            self.metrics.incr('restaurants_collected', len(restaurants))
             print(f"✅ 총 {len(restaurants)}개 식당 발견")
             
             # 로컬 저장
@@ -339,6 +544,178 @@ class AdlogFullScraper:
             print(f"❌ 식당 목록 수집 실패: {str(e)}")
             return []
     
+    def read_select_options(self):
+        """페이지 select 박스의 (value, 표시 텍스트) 리스트"""
+        options = []
+        for select in self.driver.find_elements(By.TAG_NAME, "select"):
+            for option in select.find_elements(By.TAG_NAME, "option"):
+                options.append((option.get_attribute('value'), option.text))
+        return options
+    
+    def add_select_options(self, options, restaurants, seen_ids):
+        """
+        select 박스 옵션 중 플레이스 링크를 식당으로 추가 (테이블에서 못 찾은 식당 보충)
+        
+        Args:
+            options: [(value, 표시 텍스트), ...]
+            restaurants: 수집 중인 식당 리스트 (Restaurant 레코드)
+            seen_ids: 이미 수집한 place_id 집합
+        
+        Returns:
+            새로 추가한 식당 수
+        """
+        added = 0
+        collected_at = datetime.now().isoformat()
+        
+        for value, text in options:
+            if not value or 'place.naver.com' not in value or '/restaurant/' not in value:
+                continue
+            place_id = place_id_from_url(value)
+            if place_id in seen_ids:
+                continue
+            
+            try:
+                restaurant = Restaurant(
+                    place_id=place_id,
+                    place_name=(text or '').strip(),
+                    collected_at=collected_at
+                )
+            except ValidationError as e:
+                print(f"  ⚠️ 옵션 건너뜀: {str(e)}")
+                continue
+            restaurants.append(restaurant)
+            seen_ids.add(place_id)
+            added += 1
+            print(f"  📍 {len(restaurants)}. {restaurant.place_name} (ID: {place_id})")
+        
+        return added
+    
+    def parse_keyword_results(self, page_source, keyword):
+        """
+        키워드 검색 결과 페이지 HTML 파싱 (DOM 직접 추출을 못 쓸 때 사용)
+        
+        Args:
+            page_source: 검색 결과 페이지 HTML
+            keyword: 검색 키워드
+        
+        Returns:
+            순위 데이터 리스트 (상위 20개)
+        """
+        rows = self.result_table_rows(page_source, limit=PAGE_SIZE)  # 상위 20개만
+        return self.build_keyword_rankings(rows, keyword)
+    
+    def result_table_rows(self, page_source, limit=0):
+        """검색 결과 HTML의 순위 테이블 행 (limit: 최대 행 수, 0이면 전체)"""
+        soup = BeautifulSoup(page_source, 'html.parser')
+        result_table = soup.find('table', class_='ranking') or soup.find('table')
+        return html_table_rows(result_table, limit=limit) if result_table else []
+    
+    def build_keyword_rankings(self, rows, keyword):
+        """
+        추출한 검색 결과 행을 순위 데이터로 변환
+        
+        Args:
+            rows: [(셀 텍스트 리스트, 플레이스 링크, 헤더 셀 튜플), ...] (순위 순서)
+            keyword: 검색 키워드
+        """
+        rankings = []
+        search_date = datetime.now().strftime('%Y-%m-%d')
+        search_time = datetime.now().strftime('%H:%M:%S')
+        
+        for rank, (cols, href, headers) in enumerate(rows, 1):
+            columns = column_map(headers)
+            place_name = columns.text(cols, 'place_name')
+            
+            place_id = place_id_from_url(href)
+            
+            try:
+                ranking_data = RankingRow(
+                    search_keyword=keyword,
+                    rank=rank,
+                    place_name=place_name,
+                    place_id=place_id,
+                    blog_count=columns.int_value(cols, 'blog_count'),
+                    visitor_review_count=columns.int_value(cols, 'visitor_review_count'),
+                    search_date=search_date,
+                    search_time=search_time
+                )
+            except ValidationError as e:
+                print(f"    ⚠️ {rank}번째 행 건너뜀: {str(e)}")
+                continue
+            rankings.append(ranking_data)
+            print(f"    {rank}위: {place_name}")
+        
+        return rankings
+    
+    def find_search_input(self):
+        """검색어 입력 필드 (보이는 후보 중 먼저 찾은 것, 없으면 None)"""
+        return self.locate('rank_check', 'search_input', [
+            (By.CSS_SELECTOR, "input[name='keyword']"),
+            (By.CSS_SELECTOR, "input[name='search']"),
+            (By.CSS_SELECTOR, "input[name='query']"),
+            (By.CSS_SELECTOR, "input[type='text']")
+        ], required=False)
+    
+    def submit_search(self, keyword):
+        """
+        현재 탭의 검색 폼에 키워드를 넣고 제출만 함 (결과 로딩을 기다리지 않음, 탭 풀용)
+        
+        Returns:
+            제출 여부 (검색 입력 필드가 없으면 False)
+        """
+        search_input = self.find_search_input()
+        if not search_input:
+            return False
+        
+        self.driver.execute_script(SUBMIT_SEARCH_JS, search_input, keyword)
+        return True
+    
+    def read_search_rows(self, limit=PAGE_SIZE):
+        """현재 페이지의 검색 결과 행 (DOM 직접 추출, 실패 시 HTML 파싱)"""
+        rows = None
+        if self.dom_extraction:
+            rows = extract_table_rows(self.driver, SEARCH_TABLE_SELECTORS, limit=limit)
+        if rows is None:
+            rows = self.result_table_rows(self.driver.page_source, limit=limit)
+        return rows
+    
+    def open_result_page(self, page_num):
+        """검색 결과 다음 페이지로 이동 (버튼이 없으면 False)"""
+        next_page = self.find_next_page(page_num, page='rank_check')
+        if not next_page:
+            return False
+        
+        self.rate_limiter.wait(self.metrics)
+        next_page.click()
+        self.metrics.sleep(2)
+        
+        blocked = self.page_looks_blocked()
+        if blocked:
+            self.metrics.incr('blocked_responses')
+        self.rate_limiter.record(ok=not blocked, blocked=blocked)
+        return not blocked
+    
+    def collect_search_results(self, keyword, targets=None):
+        """
+        현재 페이지의 검색 결과 파싱
+        
+        max_rank가 20보다 크면 찾을 식당(targets, 없으면 그 키워드에 나온 적 있는 회원 식당)이
+        모두 나올 때까지만 다음 결과 페이지로 이동
+        """
+        parse_started = time.perf_counter()
+        if targets is None and self.keyword_targets is not None:
+            places = self.keyword_targets.get(parse_keyword(keyword).id)
+            if places is not None:
+                targets = RankTargets(places)
+        
+        rows = walk_result_pages(self.read_search_rows, self.open_result_page,
+                                 depth=self.max_rank, targets=targets, metrics=self.metrics)
+        rankings = self.build_keyword_rankings(rows, keyword)
+        
+        self.metrics.record('parse', time.perf_counter() - parse_started)
+        self.metrics.incr('keywords_searched')
+        return rankings
+    
     def search_keyword_ranking(self, keyword):
         """특정 키워드로 순위 검색"""
         if not self.logged_in:
@@ -349,25 +726,10 @@ class AdlogFullScraper:
             print(f"\n🔍 '{keyword}' 검색 중...")
             
             # 순위 체크 페이지로 이동
-            self.driver.get("https://adlog.kr/adlog/naver_place_rank_check.php")
-            time.sleep(2)
-            
-            # 검색어 입력
-            search_input = None
-            
-            # 여러 방법으로 검색 입력 필드 찾기
-            for selector in [
-                "input[name='keyword']",
-                "input[name='search']",
-                "input[name='query']",
-                "input[type='text']"
-            ]:
-                try:
-                    search_input = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if search_input.is_displayed():
-                        break
-                except:
-                    continue
+            self.open_page(RANK_CHECK_URL)
+            self.metrics.sleep(2)
+            
+            search_input = self.find_search_input()
             
             if search_input:
                 search_input.clear()
@@ -379,106 +741,205 @@ class AdlogFullScraper:
                     search_input.send_keys(Keys.RETURN)
                 except:
                     # 버튼 클릭
-                    submit_btn = self.driver.find_element(By.CSS_SELECTOR, "input[type='submit']")
+                    submit_btn = self.locate('rank_check', 'submit', [(By.CSS_SELECTOR, "input[type='submit']")],
+                                             timeout=0)
                     submit_btn.click()
                 
-                time.sleep(3)
-                
-                # 결과 파싱
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                
-                rankings = []
-                rank = 1
+                self.metrics.sleep(3)
                 
-                # 순위 테이블 파싱
-                result_table = soup.find('table', class_='ranking') or soup.find('table')
-                if result_table:
-                    rows = result_table.find_all('tr')[1:]
-                    for row in rows[:20]:  # 상위 20개만
-                        cols = row.find_all('td')
-                        if len(cols) >= 2:
-                            place_name = cols[1].get_text(strip=True)
-                            
-                            # place_id 찾기
-                            place_link = row.find('a', href=lambda x: x and 'place.naver.com' in x)
-                            place_id = None
-                            if place_link:
-                                href = place_link.get('href')
-                                if '/restaurant/' in href:
-                                    place_id = href.split('/restaurant/')[-1].split('?')[0]
-                            
-                            # 블로그 수와 방문자리뷰 수 추출
-                            blog_count = 0
-                            visitor_count = 0
-                            
-                            # 컴럼에서 숫자 데이터 찾기
-                            for idx, col in enumerate(cols):
-                                if idx > 2:  # 순위, 이름 이후 컴럼
-                                    col_text = col.get_text(strip=True)
-                                    if ',' in col_text:
-                                        try:
-                                            num = int(col_text.replace(',', ''))
-                                            if blog_count == 0:
-                                                blog_count = num
-                                            elif visitor_count == 0:
-                                                visitor_count = num
-                                        except:
-                                            pass
-                            
-                            ranking_data = {
-                                'search_keyword': keyword,
-                                'rank': rank,
-                                'place_name': place_name,
-                                'place_id': place_id,
-                                'blog_count': blog_count,
-                                'visitor_review_count': visitor_count,
-                                'search_date': datetime.now().strftime('%Y-%m-%d'),
-                                'search_time': datetime.now().strftime('%H:%M:%S')
-                            }
-                            rankings.append(ranking_data)
-                            print(f"    {rank}위: {place_name}")
-                            rank += 1
-                
-                return rankings
+                return self.collect_search_results(keyword)
             else:
                 print("❌ 검색 입력 필드를 찾을 수 없음")
                 return []
                 
         except Exception as e:
+            self.metrics.incr('keyword_failures')
             print(f"❌ 키워드 검색 실패: {str(e)}")
             return []
     
-    def collect_all_rankings(self):
-        """모든 키워드로 순위 수집"""
-        # Supabase에서 키워드 목록 가져오기
-        keywords = []
+    def search_keywords_in_tabs(self, keywords, tabs, deadline=None, deferred=None):
+        """
+        브라우저 하나의 여러 탭에서 키워드 검색 (탭마다 제출해 두고 결과가 그려진 탭부터 수집)
         
-        if self.supabase:
-            try:
-                result = self.supabase.table('tracking_keywords').select("keyword").eq('is_active', True).execute()
-                keywords = [item['keyword'] for item in result.data]
-                print(f"📋 {len(keywords)}개 키워드 로드")
-            except:
-                pass
-        
-        # 기본 키워드
-        if not keywords:
-            keywords = [
-                "강남 맛집", "강남 치킨", "강남 카페",
-                "해운대 맛집", "해운대 고기집",
-                "서초 맛집", "송파 맛집"
-            ]
+        Args:
+            keywords: 검색 키워드 리스트
+            tabs: 탭 수
+            deadline: RunDeadline (마감 전에 끝낼 수 없으면 새 검색을 제출하지 않음)
+            deferred: 제출하지 않은 키워드를 담을 리스트
+        
+        Returns:
+            전체 순위 리스트 (탭 완료 순서)
+        """
+        if not self.logged_in:
+            if not self.login():
+                return []
+        
+        def submit(keyword):
+            # 제출 간격은 공유 속도 제한을 따르고, 기다리는 동안 다른 탭은 계속 렌더링
+            self.rate_limiter.wait(self.metrics)
+            print(f"\n🔍 '{keyword}' 검색 제출...")
+            return self.submit_search(keyword)
+        
+        def stop():
+            # 서킷 브레이커가 중단했거나 마감 전에 끝낼 수 없거나 브라우저 교체 주기면 새 검색을 제출하지 않음
+            return (self.breaker.aborted or bool(deadline and not deadline.can_start())
+                    or bool(self.watchdog.recycle_due()))
         
         all_rankings = []
+        remaining = list(keywords)
+        while remaining:
+            handled = set()
+            carried = []  # 브라우저를 새로 띄운 뒤 이어서 검색할 키워드
+            reason = None
+            pool = None
+            try:
+                pool = TabPool(self.driver, min(tabs, len(remaining)), metrics=self.metrics).open(RANK_CHECK_URL)
+                for keyword, elapsed, status in pool.run(remaining, submit, stop):
+                    handled.add(keyword)
+                    if status == 'deferred':
+                        if self.breaker.aborted or (deadline and not deadline.can_start()):
+                            if deferred is not None:
+                                deferred.append(keyword)
+                        else:
+                            carried.append(keyword)
+                        continue
+                    
+                    rankings = []
+                    if status == 'failed':
+                        self.metrics.incr('keyword_failures')
+                        print(f"❌ '{keyword}' 검색 입력 필드를 찾을 수 없음")
+                    else:
+                        try:
+                            rankings = self.collect_search_results(keyword)
+                        except Exception as e:
+                            self.metrics.incr('keyword_failures')
+                            print(f"❌ '{keyword}' 결과 파싱 실패: {str(e)}")
+                    
+                    outcome = classify_page(self.driver, bool(rankings))
+                    blocked = outcome == BLOCKED
+                    if blocked:
+                        self.metrics.incr('blocked_responses')
+                    self.rate_limiter.record(elapsed if status == 'ready' else None, ok=bool(rankings), blocked=blocked)
+                    self.respond_to(outcome, elapsed)
+                    self.watchdog.completed()
+                    
+                    print(f"  ✅ '{keyword}': {len(rankings)}개 ({elapsed:.1f}초)")
+                    all_rankings.extend(rankings)
+                    if deadline:
+                        deadline.done()
+                reason = self.watchdog.recycle_due() if carried else None
+            except Exception as e:
+                if self.watchdog.alive():
+                    raise
+                # 브라우저가 죽음 → 결과를 못 받은 키워드(제출만 한 것 포함)는 새 브라우저에서 다시
+                print(f"💥 탭 검색 중 브라우저 세션이 끊김: {str(e)[:100]}")
+                carried += [keyword for keyword in remaining if keyword not in handled]
+                reason = "세션 끊김"
+            finally:
+                if pool:
+                    pool.close()
+            
+            if carried:
+                if reason == "세션 끊김":
+                    restarted = self.watchdog.recover(reason)
+                    self.metrics.incr('keyword_retries', len(carried))
+                else:
+                    self.metrics.incr('driver_recycles')
+                    restarted = self.watchdog.restart(reason or "브라우저 교체")
+                if not restarted:
+                    if deferred is not None:
+                        deferred.extend(carried)
+                    break
+            remaining = carried
+        
+        return all_rankings
+    
+    def prioritize_keywords(self, keywords):
+        """
+        검색 순서 (마감에 걸리면 뒤쪽 키워드부터 미뤄짐)
+        tracking_keywords.priority 순, 같은 우선순위면 지난 실행에서 미룬 키워드 먼저, 그다음 변동성 x 회원 수 순
+        (변동성은 넘겨받은 스케줄러의 기록을 그대로 사용, 스케줄러가 없으면 원래 순서)
+        
+        Args:
+            keywords: Keyword 리스트
+        """
+        deferred = {query: i for i, query in enumerate(load_deferred())}
+        stats = self.scheduler.stats if self.scheduler else {}
+        
+        def volatility_score(keyword):
+            keyword_stats = stats.get(keyword.id)
+            return keyword_stats.score if keyword_stats else PRIOR_VOLATILITY
+        
+        return sorted(keywords, key=lambda keyword: (
+            registry.priority(keyword),
+            keyword.query not in deferred,
+            deferred.get(keyword.query, 0),
+            -volatility_score(keyword)
+        ))
+    
+    def collect_all_rankings(self, tabs=None, deadline=None):
+        """
+        모든 키워드로 순위 수집
+        
+        Args:
+            tabs: 검색 탭 수 (None이면 ADLOG_SEARCH_TABS, 1이면 한 탭에서 순서대로)
+            deadline: 마감 시각 (RunDeadline / datetime / 'HH:MM' / 남은 초, None이면 ADLOG_RUN_DEADLINE)
+                마감 전에 끝낼 수 없는 키워드는 시작하지 않고 다음 실행으로 미룸
+        """
+        # Supabase 추적 키워드 (없으면 기본 목록), 공용 레지스트리로 정규화 + 중복 제거
+        tracked = registry.load_tracked(self.supabase)
+        print(f"📋 {len(tracked)}개 키워드 로드")
         
-        for keyword in keywords:
-            rankings = self.search_keyword_ranking(keyword)
-            all_rankings.extend(rankings)
-            time.sleep(3)  # API 부하 방지
+        if not isinstance(deadline, RunDeadline):
+            deadline = RunDeadline(deadline)
+        # 우선순위 순 (마감에 걸리면 낮은 우선순위부터 미뤄짐)
+        tracked = self.prioritize_keywords(tracked)
+        if deadline:
+            print(f"⏰ 마감 {deadline.deadline:%H:%M} (남은 시간 {deadline.time_left() / 60:.0f}분)")
+        deadline.start()
+        keywords = [keyword.query for keyword in tracked]
+        deferred = []
+        
+        # 깊은 순위 수집이면 키워드마다 그 키워드의 회원 식당이 모두 나오는 페이지까지만 이동
+        if self.max_rank > PAGE_SIZE:
+            self.keyword_targets = load_keyword_targets(self.supabase, tracked)
+            if self.keyword_targets is None:
+                print(f"🔎 최대 {self.max_rank}위까지 수집 (전체 깊이)")
+            else:
+                print(f"🔎 최대 {self.max_rank}위까지 수집 (기록 있는 키워드 {len(self.keyword_targets)}개는 "
+                      f"회원 식당을 모두 찾으면 중단)")
+        
+        tabs = tabs or int(os.getenv('ADLOG_SEARCH_TABS', '1'))
+        
+        if tabs > 1 and len(keywords) > 1:
+            all_rankings = self.search_keywords_in_tabs(keywords, min(tabs, len(keywords)),
+                                                        deadline if deadline else None, deferred)
+        else:
+            all_rankings = []
+            for index, keyword in enumerate(keywords):
+                if self.breaker.aborted or (deadline and not deadline.can_start()):
+                    deferred = keywords[index:]
+                    break
+                # 공유 속도 제한 (사이트 상태에 따라 간격 자동 조절)
+                rankings = self.search_with_limit(self.search_keyword_ranking, keyword)
+                all_rankings.extend(rankings)
+                deadline.done()
         
         self.rankings = all_rankings
+        self.metrics.incr('rankings_collected', len(all_rankings))
         print(f"\n✅ 총 {len(all_rankings)}개 순위 데이터 수집 완료")
         
+        self.breaker.report()
+        
+        # 미룬 키워드 기록 (다음 실행에서 먼저 검색, 다 끝났으면 비움)
+        if deferred:
+            self.metrics.incr('keywords_deferred', len(deferred))
+            reason = "서킷 브레이커 중단으로" if self.breaker.aborted else "마감 전에 끝낼 수 없어"
+            print(f"⏰ {reason} {len(deferred)}개 키워드를 다음 실행으로 미룸 "
+                  f"(키워드당 약 {deadline.estimate:.1f}초)")
+        if deadline or deferred or load_deferred():
+            save_deferred(deferred, deadline=deadline.deadline)
+        
         # 로컬 저장
         self.save_to_json(all_rankings, "rankings_data.json")
         
@@ -492,88 +953,110 @@ class AdlogFullScraper:
         
         try:
             print("\n💾 데이터베이스 저장 중...")
+            today = datetime.now().strftime('%Y-%m-%d')
+            current_time = datetime.now().strftime('%H:%M:%S')
+            
+            # DB 함수 adlog_bulk_save가 있으면 식당 + 순위를 RPC 한 번(한 트랜잭션)에 저장
+            counts = None
+            if self.restaurants or self.rankings:
+                counts = bulk_save_run(self.supabase, self.restaurants, self.rankings,
+                                       today, current_time, self.metrics)
+            if counts is None:
+                self.save_rows(today, current_time)
             
-            # 1. 식당 정보 저장
-            if self.restaurants:
-                for restaurant in self.restaurants:
-                    self.supabase.table('adlog_restaurants').upsert({
-                        'place_id': restaurant['place_id'],
-                        'place_name': restaurant.get('place_name', ''),
-                        'category': restaurant.get('category', ''),
-                        'address': restaurant.get('address', ''),
-                        'place_url': restaurant.get('place_url', ''),
-                        'is_active': True,
-                        'updated_at': datetime.now().isoformat()
-                    }).execute()
-                print(f"  ✅ {len(self.restaurants)}개 식당 저장")
-            
-            # 2. 순위 데이터 저장
+            # 오늘 날짜 요약 테이블 갱신
             if self.rankings:
-                today = datetime.now().strftime('%Y-%m-%d')
-                current_time = datetime.now().strftime('%H:%M:%S')
-                
-                for ranking in self.rankings:
-                    # 식당 ID 조회
-                    if ranking.get('place_id'):
-                        restaurant = self.supabase.table('adlog_restaurants')\
-                            .select("id")\
-                            .eq('place_id', ranking['place_id'])\
-                            .execute()
-                        
-                        if restaurant.data:
-                            restaurant_id = restaurant.data[0]['id']
-                            
-                            self.supabase.table('daily_rankings').upsert({
-                                'search_date': today,
-                                'search_time': current_time,
-                                'search_keyword': ranking['search_keyword'],
-                                'restaurant_id': restaurant_id,
-                                'rank': ranking['rank'],
-                                'blog_count': ranking.get('blog_count', 0),
-                                'visitor_review_count': ranking.get('visitor_review_count', 0),
-                                'reservation_count': ranking.get('reservation_count', 0),
-                                'n1_score': ranking.get('n1_score'),
-                                'n2_score': ranking.get('n2_score'),
-                                'n3_score': ranking.get('n3_score')
-                            }).execute()
-                
-                print(f"  ✅ {len(self.rankings)}개 순위 저장")
+                refresh_daily_summary(self.supabase, today, self.metrics)
             
             print("✅ 데이터베이스 저장 완료!")
             
         except Exception as e:
+            self.metrics.incr('db_failures')
             print(f"❌ DB 저장 실패: {str(e)}")
     
+    def save_rows(self, today, current_time):
+        """식당 / 순위를 테이블별로 저장 (adlog_bulk_save 함수가 없을 때)"""
+        # 1. 식당 정보 저장
+        if self.restaurants:
+            db_started = time.perf_counter()
+            for restaurant in self.restaurants:
+                self.supabase.table('adlog_restaurants').upsert(restaurant.to_db_row()).execute()
+            self.metrics.record('db_write', time.perf_counter() - db_started)
+            self.metrics.incr('db_rows_written', len(self.restaurants))
+            print(f"  ✅ {len(self.restaurants)}개 식당 저장")
+        
+        # 2. 순위 데이터 저장
+        if self.rankings:
+            # 식당 ID 매핑 한 번에 조회 (place_id -> id)
+            with self.metrics.timer('db_read'):
+                restaurant_ids = fetch_map(self.supabase, 'adlog_restaurants', 'place_id')
+            
+            db_started = time.perf_counter()
+            saved = 0
+            # 저장 시각 기준 날짜/시간 + 순위 행에 없는 컬럼 기본값
+            extra = {
+                'search_date': today,
+                'search_time': current_time,
+                'reservation_count': 0,
+                'n1_score': None,
+                'n2_score': None,
+                'n3_score': None
+            }
+            for ranking in self.rankings:
+                if ranking.place_id:
+                    restaurant_id = restaurant_ids.get(ranking.place_id)
+                    
+                    if restaurant_id:
+                        self.supabase.table('daily_rankings').upsert(
+                            ranking.to_daily_row(restaurant_id, extra)
+                        ).execute()
+                        saved += 1
+            
+            self.metrics.record('db_write', time.perf_counter() - db_started)
+            self.metrics.incr('db_rows_written', saved)
+            print(f"  ✅ {len(self.rankings)}개 순위 저장")
+    
     def save_to_json(self, data, filename):
         """JSON 파일로 저장"""
         filepath = f"data/{filename}"
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            json.dump(as_dicts(data), f, ensure_ascii=False, indent=2)
         
         print(f"  💾 로컬 저장: {filepath}")
     
     def save_to_csv(self):
         """CSV 파일로 저장"""
         if self.restaurants:
-            df_restaurants = pd.DataFrame(self.restaurants)
+            df_restaurants = pd.DataFrame(as_dicts(self.restaurants))
             df_restaurants.to_csv('data/restaurants.csv', index=False, encoding='utf-8-sig')
             print(f"  💾 식당 CSV 저장: data/restaurants.csv")
         
         if self.rankings:
-            df_rankings = pd.DataFrame(self.rankings)
+            df_rankings = pd.DataFrame(as_dicts(self.rankings))
             df_rankings.to_csv('data/rankings.csv', index=False, encoding='utf-8-sig')
             print(f"  💾 순위 CSV 저장: data/rankings.csv")
     
     def close(self):
         """브라우저 종료"""
+        if self.driver and not self.owns_driver:
+            # 풀에서 빌린 드라이버는 반납만 (종료는 풀이 관리)
+            self.driver = None
+            self.logged_in = False
+            return
+        
         if self.driver:
             self.driver.quit()
             print("✅ 브라우저 종료")
     
-    def run_full_collection(self):
-        """전체 수집 프로세스 실행"""
+    def run_full_collection(self, deadline=None):
+        """
+        전체 수집 프로세스 실행
+        
+        Args:
+            deadline: 순위 수집 마감 시각 (collect_all_rankings 참고, 못 끝낸 키워드는 미루고 모은 것만 저장)
+        """
         print("\n" + "="*60)
         print("🚀 ADLOG 전체 데이터 수집 시작")
         print("="*60)
@@ -581,13 +1064,15 @@ class AdlogFullScraper:
         # 1. 로그인
         if not self.login():
             print("❌ 로그인 실패로 중단")
+            self.metrics.incr('login_failures')
+            self.metrics.finish()
             return
         
         # 2. 식당 목록 수집
         self.get_restaurant_list()
         
         # 3. 순위 데이터 수집
-        self.collect_all_rankings()
+        self.collect_all_rankings(deadline=deadline)
         
         # 4. 데이터 저장
         self.save_to_database()
@@ -601,6 +1086,9 @@ class AdlogFullScraper:
         print(f"  • 순위 데이터: {len(self.rankings)}개")
         print(f"  • 수집 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("="*60)
+        
+        # 6. 단계별 계측 결과 기록 (JSON Lines / Prometheus textfile)
+        self.metrics.finish()
 
 
 # 실행
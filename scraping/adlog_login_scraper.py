@@ -14,10 +14,23 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 import pandas as pd
 from dotenv import load_dotenv
+from run_metrics import RunMetrics
+from browser_profile import lean_profile_enabled, apply_lean_options, enable_network_blocking
+from driver_resolver import resolve_chromedriver
+from rate_limiter import AdaptiveRateLimiter, looks_blocked
+from driver_watchdog import DriverWatchdog
+from block_detector import CircuitBreaker, classify_page, classify_response, BLOCKED
+from models import RankingRow, ValidationError, as_dicts, place_id_from_url
+from dom_extract import extract_table_rows, html_table_rows, find_next_page_element
+from table_columns import column_map
+from deep_rank import PAGE_SIZE, RankTargets, rank_depth, walk_result_pages
+from locator_cache import LocatorCache
+
+# 검색 결과 테이블 선택자 (HTML 파서와 같은 우선순위)
+RANKING_TABLE_SELECTORS = ['table.ranking-table', '#ranking-result', 'table']
 
 # 환경변수 로드
 env_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
@@ -25,12 +38,23 @@ if os.path.exists(env_path):
     load_dotenv(env_path)
 
 class AdlogLoginScraper:
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, metrics=None, lean=None, dom_extraction=True, rate_limiter=None,
+                 locators=None, max_rank=None, breaker=None, watchdog=None):
         """
         초기화
         Args:
             headless: True면 브라우저 창 안 보임 (백그라운드 실행)
+            metrics: 실행 계측 객체 (없으면 새로 생성)
+            lean: 경량 프로필 (이미지/폰트/트래커 차단 + eager 로딩), None이면 ADLOG_LEAN_PROFILE (기본 꺼짐)
+            dom_extraction: True면 execute_script로 결과 행만 추출 (실패 시 HTML 파싱)
+            rate_limiter: 요청 간격 제한기 (없으면 ADLOG 공유 제한기)
+            locators: 선택자 캐시 (없으면 공유 캐시)
+            max_rank: 키워드당 수집할 최대 순위 (None이면 ADLOG_RANK_DEPTH, 20 넘으면 다음 결과 페이지까지)
+            breaker: 서킷 브레이커 (없으면 새로 생성, 차단/로그인 만료/빈 결과가 이어지면 정지·재로그인·중단)
+            watchdog: 브라우저 세션 감시 (없으면 새로 생성, 끊긴 세션 재시작 / 오래 쓴 브라우저 교체)
         """
+        self.metrics = metrics or RunMetrics('login_scraper')
+        
         self.base_url = "https://adlog.kr"
         self.login_url = "https://adlog.kr/login"
         self.rank_check_url = "https://adlog.kr/adlog/naver_place_rank_check.php"
@@ -57,75 +81,167 @@ class AdlogLoginScraper:
         # User-Agent 설정 (봇 감지 방지)
         self.chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
+        # 경량 프로필 (파싱에 필요 없는 리소스 차단)
+        self.lean = lean_profile_enabled(lean)
+        if self.lean:
+            apply_lean_options(self.chrome_options)
+        
+        self.dom_extraction = dom_extraction
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter.shared()
+        self.locators = locators or LocatorCache.shared()
+        self.max_rank = rank_depth(max_rank)
+        self.breaker = breaker or CircuitBreaker(metrics=self.metrics)
+        self.watchdog = watchdog or DriverWatchdog(self, breaker=self.breaker, metrics=self.metrics)
+        self.last_page_load = None
         self.driver = None
         self.logged_in = False
+        self.owns_driver = True  # False면 close()에서 종료하지 않음 (드라이버 풀)
     
     def start_driver(self):
         """웹드라이버 시작"""
         try:
-            # ChromeDriver 자동 설치 및 실행
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
-            self.driver.implicitly_wait(10)
-            print("✅ Chrome 드라이버 시작 완료")
+            # ChromeDriver 캐시에서 찾아 실행 (없을 때만 다운로드)
+            started = time.perf_counter()
+            with self.metrics.timer('driver_start'):
+                service = Service(resolve_chromedriver(metrics=self.metrics))
+                self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
+                if self.lean:
+                    enable_network_blocking(self.driver)
+            # 요소 대기는 선택자 캐시가 직접 처리 (없는 후보마다 implicit wait를 기다리지 않도록)
+            self.driver.implicitly_wait(0)
+            print(f"✅ Chrome 드라이버 시작 완료 ({time.perf_counter() - started:.1f}초)")
             return True
         except Exception as e:
             print(f"❌ 드라이버 시작 실패: {str(e)}")
             return False
     
+    def open_page(self, url):
+        """페이지 이동 (로딩 시간 계측)"""
+        started = time.perf_counter()
+        with self.metrics.timer('page_load'):
+            self.driver.get(url)
+        self.last_page_load = time.perf_counter() - started
+        self.metrics.incr('page_loads')
+    
+    def locate(self, page, step, candidates, **kwargs):
+        """후보 선택자 중 먼저 찾은 요소 (LocatorCache.find 참고)"""
+        return self.locators.find(self.driver, page, step, candidates, metrics=self.metrics, **kwargs)
+    
+    def page_looks_blocked(self):
+        """현재 페이지가 차단/캡차 화면인지 (본문 앞부분만 확인)"""
+        try:
+            text = self.driver.execute_script(
+                "return document.body ? document.body.innerText.slice(0, 3000) : '';")
+        except Exception:
+            return False
+        return looks_blocked(text)
+    
+    def search_with_limit(self, search, keyword):
+        """
+        공유 속도 제한을 지키며 검색 1회 실행 후 결과를 제한기에 반영
+        
+        Args:
+            search: 검색 함수 (결과 리스트 반환)
+            keyword: 검색 키워드
+        """
+        # 오래 쓴 브라우저는 검색 전에 교체, 검색 중 세션이 끊기면 다시 띄워 같은 키워드 재시도
+        self.watchdog.maybe_recycle()
+        self.rate_limiter.wait(self.metrics)
+        
+        self.last_page_load = None
+        started = time.perf_counter()
+        rankings = self.watchdog.run(search, keyword)
+        
+        # 결과가 없으면 차단 / 로그인 만료 / 빈 결과 구분 → 서킷 브레이커
+        outcome = classify_page(self.driver, bool(rankings))
+        blocked = outcome == BLOCKED
+        if blocked:
+            self.metrics.incr('blocked_responses')
+        self.rate_limiter.record(self.last_page_load, ok=bool(rankings), blocked=blocked)
+        self.respond_to(outcome, time.perf_counter() - started)
+        return rankings
+    
+    def respond_to(self, outcome, elapsed):
+        """
+        분류한 응답을 서킷 브레이커에 반영하고 조치 (일시 정지 / 다시 로그인)
+        
+        Returns:
+            계속해도 되는지 (False면 중단)
+        """
+        action = self.breaker.record(outcome, elapsed)
+        if action == 'pause':
+            self.breaker.pause()
+        elif action == 'relogin':
+            print("🔐 로그인 화면이 나와 다시 로그인")
+            self.logged_in = False
+            if not self.login():
+                self.breaker.abort("다시 로그인 실패")
+        return not self.breaker.aborted
+    
+    def attach_driver(self, driver):
+        """
+        이미 로그인된 드라이버 연결 (드라이버 풀에서 빌린 경우)
+        브라우저 시작/로그인 없이 바로 수집하고, close()해도 브라우저는 종료하지 않음
+        """
+        self.driver = driver
+        self.logged_in = True
+        self.owns_driver = False
+    
     def login(self):
         """ADLOG 자동 로그인"""
+        if self.driver and self.logged_in:
+            return True
+        
         if not self.driver:
             if not self.start_driver():
                 return False
         
+        with self.metrics.timer('login'):
+            return self._login()
+    
+    def _login(self):
+        """로그인 폼 입력 및 결과 확인"""
         try:
             print(f"🔐 ADLOG 로그인 시도...")
-            self.driver.get(self.login_url)
-            time.sleep(2)
+            self.open_page(self.login_url)
+            self.metrics.sleep(2)
             
-            # 로그인 폼 찾기 (실제 HTML 구조에 맞게 수정 필요)
-            # 방법 1: ID/PW 입력 필드의 name 속성 사용
-            try:
-                username_input = self.driver.find_element(By.NAME, "userid")  # 또는 "id", "username" 등
-                password_input = self.driver.find_element(By.NAME, "passwd")  # 또는 "password", "pw" 등
-            except:
-                # 방법 2: ID/PW 입력 필드의 id 속성 사용
-                try:
-                    username_input = self.driver.find_element(By.ID, "userid")
-                    password_input = self.driver.find_element(By.ID, "passwd")
-                except:
-                    # 방법 3: 클래스나 타입으로 찾기
-                    username_input = self.driver.find_element(By.CSS_SELECTOR, "input[type='text']")
-                    password_input = self.driver.find_element(By.CSS_SELECTOR, "input[type='password']")
+            # 로그인 폼 찾기 (name → id → 타입 순, 지난번에 찾은 선택자 우선)
+            username_input = self.locate('login', 'username', [
+                (By.NAME, "userid"),
+                (By.ID, "userid"),
+                (By.CSS_SELECTOR, "input[type='text']")
+            ])
+            password_input = self.locate('login', 'password', [
+                (By.NAME, "passwd"),
+                (By.ID, "passwd"),
+                (By.CSS_SELECTOR, "input[type='password']")
+            ])
             
             # ID/PW 입력
             username_input.clear()
             username_input.send_keys(self.username)
-            time.sleep(1)
+            self.metrics.sleep(1)
             
             password_input.clear()
             password_input.send_keys(self.password)
-            time.sleep(1)
+            self.metrics.sleep(1)
             
-            # 로그인 버튼 클릭
-            try:
-                # 방법 1: 버튼 텍스트로 찾기
-                login_button = self.driver.find_element(By.XPATH, "//button[contains(text(), '로그인')]")
-            except:
-                try:
-                    # 방법 2: input type=submit 찾기
-                    login_button = self.driver.find_element(By.CSS_SELECTOR, "input[type='submit']")
-                except:
-                    # 방법 3: Enter 키 누르기
-                    password_input.send_keys(Keys.RETURN)
-                    time.sleep(3)
-                    self.logged_in = True
-                    print("✅ 로그인 성공!")
-                    return True
+            # 로그인 버튼 클릭 (버튼 텍스트 → submit, 폼이 이미 있으므로 다시 기다리지 않음)
+            login_button = self.locate('login', 'submit', [
+                (By.XPATH, "//button[contains(text(), '로그인')]"),
+                (By.CSS_SELECTOR, "input[type='submit']")
+            ], timeout=0, required=False)
+            if not login_button:
+                # 버튼이 없으면 Enter 키 누르기
+                password_input.send_keys(Keys.RETURN)
+                self.metrics.sleep(3)
+                self.logged_in = True
+                print("✅ 로그인 성공!")
+                return True
             
             login_button.click()
-            time.sleep(3)
+            self.metrics.sleep(3)
             
             # 로그인 성공 확인 (URL 변경 또는 특정 요소 확인)
             if "login" not in self.driver.current_url.lower():
@@ -156,24 +272,25 @@ class AdlogLoginScraper:
             print(f"🔍 검색 중: {keyword}")
             
             # 순위 체크 페이지로 이동
-            self.driver.get(self.rank_check_url)
-            time.sleep(2)
+            self.open_page(self.rank_check_url)
+            self.metrics.sleep(2)
             
             # 검색 폼 입력 (실제 HTML 구조에 맞게 수정 필요)
             try:
                 # 키워드 입력
-                keyword_input = self.driver.find_element(By.NAME, "keyword")
+                keyword_input = self.locate('rank_check', 'keyword', [(By.NAME, "keyword")])
                 keyword_input.clear()
                 keyword_input.send_keys(keyword)
                 
                 # 플레이스 URL 입력 (있는 경우)
                 if place_url:
-                    url_input = self.driver.find_element(By.NAME, "place_url")
+                    url_input = self.locate('rank_check', 'place_url', [(By.NAME, "place_url")], timeout=0)
                     url_input.clear()
                     url_input.send_keys(place_url)
                 
                 # 검색 버튼 클릭
-                search_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+                search_button = self.locate('rank_check', 'submit', [(By.CSS_SELECTOR, "button[type='submit']")],
+                                            timeout=0)
                 search_button.click()
                 
             except Exception as e:
@@ -182,74 +299,141 @@ class AdlogLoginScraper:
                 search_url = f"{self.rank_check_url}?keyword={keyword}"
                 if place_url:
                     search_url += f"&place_url={place_url}"
-                self.driver.get(search_url)
+                self.open_page(search_url)
             
-            time.sleep(3)
+            self.metrics.sleep(3)
             
-            # 결과 파싱
-            return self.parse_ranking_results()
+            # 결과 파싱 (place_url이 있으면 그 식당이 나오는 페이지까지만 더 봄)
+            targets = RankTargets([{'place_id': place_id_from_url(place_url)}]) if place_url else None
+            with self.metrics.timer('parse'):
+                rankings = self.parse_ranking_results(keyword=keyword, targets=targets)
+            self.metrics.incr('keywords_searched')
+            return rankings
             
         except Exception as e:
+            self.metrics.incr('keyword_failures')
             print(f"❌ 검색 중 오류: {str(e)}")
             return []
     
-    def parse_ranking_results(self):
-        """검색 결과 파싱"""
+    def parse_ranking_results(self, page_source=None, keyword=None, targets=None):
+        """
+        검색 결과 파싱
+        
+        Args:
+            page_source: 파싱할 HTML (없으면 현재 브라우저 페이지)
+            keyword: 검색 키워드 (순위 행에 기록)
+            targets: 찾을 식당 RankTargets (max_rank가 20보다 크면 모두 나올 때까지만 다음 결과 페이지로 이동)
+        """
         try:
-            # 페이지 소스 가져오기
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            rankings = []
+            # 현재 브라우저 페이지 (DOM 직접 추출, 깊은 순위면 다음 결과 페이지까지)
+            if page_source is None:
+                rows = walk_result_pages(self.read_result_rows, self.open_result_page,
+                                         depth=self.max_rank, targets=targets, metrics=self.metrics)
+                if rows:
+                    return self.build_rankings(rows, keyword)
+                page_source = self.driver.page_source
             
-            # 테이블 찾기 (실제 HTML 구조에 맞게 수정)
-            # 방법 1: 클래스명으로 찾기
-            table = soup.find('table', class_='ranking-table')
-            if not table:
-                # 방법 2: ID로 찾기
-                table = soup.find('table', id='ranking-result')
-            if not table:
-                # 방법 3: 첫 번째 테이블
-                table = soup.find('table')
+            soup = BeautifulSoup(page_source, 'html.parser')
+            table = self.find_ranking_table(soup)
             
             if table:
-                rows = table.find_all('tr')[1:]  # 헤더 제외
+                rows = html_table_rows(table, limit=PAGE_SIZE)  # 헤더 제외, 상위 20개
                 
-                for idx, row in enumerate(rows[:20], 1):
-                    cols = row.find_all('td')
-                    
-                    if len(cols) >= 2:
-                        # 데이터 추출 (실제 구조에 맞게 수정)
-                        ranking_data = {
-                            'rank': idx,
-                            'place_name': cols[1].get_text(strip=True),
-                            'place_id': cols[0].get_text(strip=True) if len(cols) > 0 else '',
-                            'category': cols[2].get_text(strip=True) if len(cols) > 2 else '',
-                            'address': cols[3].get_text(strip=True) if len(cols) > 3 else '',
-                            'phone': cols[4].get_text(strip=True) if len(cols) > 4 else '',
-                            'search_date': datetime.now().strftime('%Y-%m-%d'),
-                            'search_time': datetime.now().strftime('%H:%M:%S')
-                        }
-                        rankings.append(ranking_data)
-                        print(f"  {idx}위: {ranking_data['place_name']}")
+                return self.build_rankings(rows, keyword)
             else:
-                print("⚠️ 순위 테이블을 찾을 수 없습니다")
-                
-                # 디버깅: 페이지 내용 일부 출력
-                print("페이지 내용 (처음 500자):")
-                print(soup.get_text()[:500])
+                # 로그인 화면 / 차단 / 빈 결과 구분 (서킷 브레이커는 search_with_limit에서 반영)
+                print(f"⚠️ 순위 테이블을 찾을 수 없습니다 ({classify_response(text=page_source)})")
             
-            return rankings
+            return []
             
         except Exception as e:
             print(f"❌ 결과 파싱 오류: {str(e)}")
             return []
     
+    def find_ranking_table(self, soup):
+        """순위 테이블 찾기 (실제 HTML 구조에 맞게 수정)"""
+        # 방법 1: 클래스명으로 찾기
+        table = soup.find('table', class_='ranking-table')
+        if not table:
+            # 방법 2: ID로 찾기
+            table = soup.find('table', id='ranking-result')
+        if not table:
+            # 방법 3: 첫 번째 테이블
+            table = soup.find('table')
+        return table
+    
+    def read_result_rows(self, limit=PAGE_SIZE):
+        """현재 페이지의 결과 행 (DOM 직접 추출, 실패 시 HTML 파싱)"""
+        if self.dom_extraction:
+            rows = extract_table_rows(self.driver, RANKING_TABLE_SELECTORS, limit=limit)
+            if rows is not None:
+                return rows
+        
+        table = self.find_ranking_table(BeautifulSoup(self.driver.page_source, 'html.parser'))
+        return html_table_rows(table, limit=limit) if table else []
+    
+    def open_result_page(self, page_num):
+        """검색 결과 다음 페이지로 이동 (버튼이 없거나 차단 화면이면 False)"""
+        try:
+            next_page = find_next_page_element(self.driver, page_num)
+        except Exception:
+            next_page = None
+        if not next_page:
+            return False
+        
+        self.rate_limiter.wait(self.metrics)
+        next_page.click()
+        self.metrics.sleep(2)
+        
+        blocked = self.page_looks_blocked()
+        if blocked:
+            self.metrics.incr('blocked_responses')
+        self.rate_limiter.record(ok=not blocked, blocked=blocked)
+        return not blocked
+    
+    def build_rankings(self, rows, keyword):
+        """
+        추출한 결과 행을 순위 데이터로 변환
+        
+        Args:
+            rows: [(셀 텍스트 리스트, 플레이스 링크, 헤더 셀 튜플), ...] (순위 순서)
+            keyword: 검색 키워드
+        """
+        rankings = []
+        search_date = datetime.now().strftime('%Y-%m-%d')
+        search_time = datetime.now().strftime('%H:%M:%S')
+        
+        for idx, (cols, href, headers) in enumerate(rows, 1):
+            # 데이터 추출 (헤더로 찾은 컬럼 위치, place_id는 플레이스 링크 우선, 없으면 첫 컬럼)
+            columns = column_map(headers)
+            try:
+                ranking_data = RankingRow(
+                    search_keyword=keyword,
+                    rank=idx,
+                    place_name=columns.text(cols, 'place_name'),
+                    place_id=place_id_from_url(href) or cols[0],
+                    category=columns.text(cols, 'category'),
+                    address=columns.text(cols, 'address'),
+                    phone=columns.text(cols, 'phone'),
+                    search_date=search_date,
+                    search_time=search_time
+                )
+            except ValidationError as e:
+                print(f"  ⚠️ {idx}번째 행 건너뜀: {str(e)}")
+                continue
+            rankings.append(ranking_data)
+            print(f"  {idx}위: {ranking_data.place_name}")
+        
+        return rankings
+    
     def track_multiple_keywords(self, keywords_list):
         """여러 키워드 추적"""
         all_rankings = []
         
-        for item in keywords_list:
+        for index, item in enumerate(keywords_list):
+            if self.breaker.aborted:
+                print(f"🛑 남은 키워드 {len(keywords_list) - index}개 건너뜀")
+                break
             if isinstance(item, dict):
                 keyword = item.get('keyword', '')
                 place_url = item.get('place_url', None)
@@ -257,17 +441,12 @@ class AdlogLoginScraper:
                 keyword = item
                 place_url = None
             
-            rankings = self.search_place_ranking(keyword, place_url)
-            
-            # 키워드 정보 추가
-            for ranking in rankings:
-                ranking['search_keyword'] = keyword
-            
+            # 공유 속도 제한 (사이트 상태에 따라 간격 자동 조절)
+            rankings = self.search_with_limit(lambda k: self.search_place_ranking(k, place_url), keyword)
             all_rankings.extend(rankings)
-            
-            # 과도한 요청 방지
-            time.sleep(3)
         
+        self.metrics.incr('rankings_collected', len(all_rankings))
+        self.breaker.report()
         return all_rankings
     
     def save_screenshot(self, filename=None):
@@ -293,7 +472,7 @@ class AdlogLoginScraper:
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            json.dump(as_dicts(data), f, ensure_ascii=False, indent=2)
         
         print(f"✅ JSON 저장: {filepath}")
         return filepath
@@ -306,7 +485,7 @@ class AdlogLoginScraper:
         filepath = f"scraping/data/{filename}"
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
-        df = pd.DataFrame(data)
+        df = pd.DataFrame(as_dicts(data))
         df.to_csv(filepath, index=False, encoding='utf-8-sig')
         
         print(f"✅ CSV 저장: {filepath}")
@@ -314,6 +493,12 @@ class AdlogLoginScraper:
     
     def close(self):
         """브라우저 종료"""
+        if self.driver and not self.owns_driver:
+            # 풀에서 빌린 드라이버는 반납만 (종료는 풀이 관리)
+            self.driver = None
+            self.logged_in = False
+            return
+        
         if self.driver:
             self.driver.quit()
             print("✅ 브라우저 종료")
@@ -361,5 +546,8 @@ if __name__ == "__main__":
             scraper.save_to_json(all_rankings, "all_rankings.json")
             print(f"\n✅ 전체 {len(all_rankings)}개 데이터 수집 완료!")
     
+    # 단계별 계측 결과 기록
+    scraper.metrics.finish()
+    
     # 브라우저 종료
     scraper.close()
@@ -11,12 +11,34 @@ from datetime import datetime
 from dotenv import load_dotenv
 import time
 import pandas as pd
+from run_metrics import RunMetrics
+from rate_limiter import AdaptiveRateLimiter
+from block_detector import CircuitBreaker, classify_response, has_place_links, BLOCKED, ERROR
+from models import RankingRow, ValidationError, as_dicts, place_id_from_url
+from keyword_registry import make_keyword
+from name_matcher import NameIndex
+from dom_extract import html_table_rows
+from table_columns import column_map
+from deep_rank import RankTargets, rank_depth, walk_result_pages
 
 # 환경변수 로드
 load_dotenv()
 
 class AdlogScraper:
-    def __init__(self):
+    def __init__(self, metrics=None, rate_limiter=None, max_rank=None, breaker=None):
+        """
+        초기화
+        Args:
+            metrics: 실행 계측 객체 (없으면 새로 생성)
+            rate_limiter: 요청 간격 제한기 (없으면 ADLOG 공유 제한기)
+            max_rank: 키워드당 수집할 최대 순위 (None이면 ADLOG_RANK_DEPTH, 20 넘으면 다음 페이지까지)
+            breaker: 서킷 브레이커 (없으면 새로 생성, 로그인 세션이 없어 로그인 화면이 나오면 바로 중단)
+        """
+        self.metrics = metrics or RunMetrics('adlog_scraper')
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter.shared()
+        self.max_rank = rank_depth(max_rank)
+        self.breaker = breaker or CircuitBreaker(max_relogins=0, metrics=self.metrics)
+        self.last_response = None
         self.base_url = "https://m.place.naver.com/"
         self.adlog_url = "https://adlog.kr/adlog/naver_place_rank_check.php"
         self.headers = {
@@ -28,20 +50,22 @@ class AdlogScraper:
             'Upgrade-Insecure-Requests': '1'
         }
         
-    def search_place_ranking(self, keyword, location=""):
+    def search_place_ranking(self, keyword, location="", targets=None):
         """
         특정 키워드로 네이버 플레이스 순위 검색
         
         Args:
             keyword: 검색 키워드 (예: "치킨", "카페")
             location: 지역 (예: "강남", "홍대")
+            targets: 찾을 식당 RankTargets (max_rank가 20보다 크면 모두 나올 때까지만 다음 페이지 요청)
         
         Returns:
             순위 데이터 리스트
         """
         try:
-            # ADLOG 검색 파라미터
-            search_query = f"{location} {keyword}" if location else keyword
+            # ADLOG 검색 파라미터 (키워드/지역 정규화는 공용 레지스트리에서 한 번만)
+            parsed = make_keyword(keyword, location)
+            search_query = parsed.query
             
             params = {
                 'keyword': search_query,
@@ -51,51 +75,101 @@ class AdlogScraper:
             print(f"🔍 검색중: {search_query}")
             
             # ADLOG API 호출 (실제 URL과 파라미터는 사이트 분석 후 수정 필요)
-            response = requests.get(
-                self.adlog_url,
-                params=params,
-                headers=self.headers,
-                timeout=10
-            )
+            response = self.request_results(params)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                parse_started = time.perf_counter()
+                pages = {'html': response.text}
                 
-                # 순위 데이터 파싱 (실제 HTML 구조에 맞게 수정 필요)
-                rankings = []
+                def read_rows(limit):
+                    # 테이블 찾기 (ADLOG 실제 구조에 맞게 수정)
+                    soup = BeautifulSoup(pages['html'], 'html.parser')
+                    ranking_table = soup.find('table', class_='ranking-table')
+                    if not ranking_table:
+                        ranking_table = soup.find('table')  # 클래스명 없을 경우
+                    return html_table_rows(ranking_table, limit=limit) if ranking_table else []
                 
-                # 테이블 찾기 (ADLOG 실제 구조에 맞게 수정)
-                ranking_table = soup.find('table', class_='ranking-table')
-                if not ranking_table:
-                    ranking_table = soup.find('table')  # 클래스명 없을 경우
+                def open_page(page_num):
+                    # 다음 결과 페이지 (페이지 파라미터 이름은 사이트 분석 후 수정 필요)
+                    next_response = self.request_results({**params, 'page': page_num})
+                    if next_response.status_code != 200:
+                        return False
+                    pages['html'] = next_response.text
+                    return True
+                
+                # 순위 데이터 파싱 (기본 상위 20개, 깊은 순위면 찾을 식당이 나올 때까지)
+                rows = walk_result_pages(read_rows, open_page, depth=self.max_rank,
+                                         targets=targets, metrics=self.metrics)
+                
+                rankings = []
+                search_date = datetime.now().strftime('%Y-%m-%d')
+                search_time = datetime.now().strftime('%H:%M:%S')
                 
-                if ranking_table:
-                    rows = ranking_table.find_all('tr')[1:]  # 헤더 제외
-                    
-                    for idx, row in enumerate(rows[:20], 1):  # 상위 20개만
-                        cols = row.find_all('td')
-                        if len(cols) >= 3:
-                            ranking_data = {
-                                'rank': idx,
-                                'place_name': cols[1].get_text(strip=True),
-                                'place_id': cols[0].get_text(strip=True),  # 플레이스 ID
-                                'category': cols[2].get_text(strip=True) if len(cols) > 2 else '',
-                                'keyword': search_query,
-                                'search_date': datetime.now().strftime('%Y-%m-%d'),
-                                'search_time': datetime.now().strftime('%H:%M:%S')
-                            }
-                            rankings.append(ranking_data)
-                            print(f"  {idx}위: {ranking_data['place_name']}")
+                for idx, (cols, href, headers) in enumerate(rows, 1):
+                    if len(cols) >= 3:
+                        columns = column_map(headers)
+                        try:
+                            ranking_data = RankingRow(
+                                search_keyword=parsed.term,
+                                search_location=parsed.location,
+                                rank=idx,
+                                place_name=columns.text(cols, 'place_name'),
+                                place_id=place_id_from_url(href) or cols[0],  # 플레이스 ID
+                                category=columns.text(cols, 'category'),
+                                search_date=search_date,
+                                search_time=search_time
+                            )
+                        except ValidationError as e:
+                            print(f"  ⚠️ {idx}번째 행 건너뜀: {str(e)}")
+                            continue
+                        rankings.append(ranking_data)
+                        print(f"  {idx}위: {ranking_data.place_name}")
                 
+                self.metrics.record('parse', time.perf_counter() - parse_started)
+                self.metrics.incr('keywords_searched')
                 return rankings
             else:
+                self.metrics.incr('keyword_failures')
                 print(f"❌ 요청 실패: {response.status_code}")
                 return []
                 
         except Exception as e:
+            self.metrics.incr('keyword_failures')
             print(f"❌ 스크래핑 오류: {str(e)}")
             return []
     
+    def request_results(self, params):
+        """
+        순위 조회 요청 1회 (공유 속도 제한 + 응답 상태 반영)
+        
+        Returns:
+            requests 응답
+        """
+        self.rate_limiter.wait(self.metrics)
+        started = time.perf_counter()
+        try:
+            with self.metrics.timer('page_load'):
+                response = requests.get(
+                    self.adlog_url,
+                    params=params,
+                    headers=self.headers,
+                    timeout=10
+                )
+        except requests.RequestException:
+            self.rate_limiter.record(time.perf_counter() - started, ok=False)
+            raise
+        self.metrics.incr('page_loads')
+        self.last_response = response
+        
+        # 응답 상태를 공유 속도 제한에 반영 (429/403/캡차면 크게 늦춤)
+        blocked = classify_response(response.status_code, response.text, response.url,
+                                    has_place_links(response.text), logged_in=False) == BLOCKED
+        if blocked:
+            self.metrics.incr('blocked_responses')
+        self.rate_limiter.record(time.perf_counter() - started,
+                                 ok=response.status_code == 200 and not blocked, blocked=blocked)
+        return response
+    
     def save_to_json(self, data, filename=None):
         """
         데이터를 JSON 파일로 저장
@@ -107,7 +181,7 @@ class AdlogScraper:
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            json.dump(as_dicts(data), f, ensure_ascii=False, indent=2)
         
         print(f"✅ 저장 완료: {filepath}")
         return filepath
@@ -122,13 +196,13 @@ class AdlogScraper:
         filepath = f"scraping/data/{filename}"
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
-        df = pd.DataFrame(data)
+        df = pd.DataFrame(as_dicts(data))
         df.to_csv(filepath, index=False, encoding='utf-8-sig')
         
         print(f"✅ CSV 저장 완료: {filepath}")
         return filepath
     
-    def track_multiple_keywords(self, keywords_list):
+    def track_multiple_keywords(self, keywords_list, my_restaurants=None):
         """
         여러 키워드의 순위를 한번에 추적
         
@@ -139,43 +213,60 @@ class AdlogScraper:
                 {'keyword': '카페', 'location': '홍대'},
                 {'keyword': '한식', 'location': '서초'}
             ]
+            my_restaurants: 찾을 내 식당 이름 / {'name', 'place_id'} 리스트
+                (깊은 순위 수집에서 키워드마다 모두 나오면 다음 페이지를 더 요청하지 않음)
         """
         all_rankings = []
         
-        for item in keywords_list:
+        for index, item in enumerate(keywords_list):
+            if self.breaker.aborted:
+                print(f"🛑 남은 키워드 {len(keywords_list) - index}개 건너뜀")
+                break
             keyword = item.get('keyword', '')
             location = item.get('location', '')
             
-            # 각 키워드 검색
-            rankings = self.search_place_ranking(keyword, location)
+            # 각 키워드 검색 (요청 간격은 search_place_ranking 안에서 공유 제한기로 조절)
+            targets = RankTargets(my_restaurants) if my_restaurants is not None else None
+            self.last_response = None
+            started = time.perf_counter()
+            rankings = self.search_place_ranking(keyword, location, targets)
             all_rankings.extend(rankings)
             
-            # API 부하 방지를 위한 딜레이
-            time.sleep(2)
+            # 차단 / 로그인 화면 / 빈 결과가 이어지면 일시 정지 또는 중단
+            response = self.last_response
+            outcome = ERROR if response is None else classify_response(
+                response.status_code, response.text, response.url, has_results=bool(rankings), logged_in=False)
+            if self.breaker.record(outcome, time.perf_counter() - started) == 'pause':
+                self.breaker.pause()
         
+        self.metrics.incr('rankings_collected', len(all_rankings))
+        self.breaker.report()
         return all_rankings
     
-    def find_my_restaurant(self, restaurant_name, rankings):
+    def find_my_restaurant(self, restaurant_name, rankings, place_id=None, index=None):
         """
         내 식당의 순위 찾기
         
         Args:
-            restaurant_name: 내 식당 이름
+            restaurant_name: 내 식당 이름 (지점명 변형 허용, 예: "BBQ치킨 강남점")
             rankings: 전체 순위 데이터
+            place_id: 네이버 플레이스 ID (있으면 이름보다 우선)
+            index: 미리 만든 NameIndex (여러 식당을 찾을 때 재사용)
         
         Returns:
             내 식당의 순위 정보
         """
         my_rankings = []
+        if index is None:
+            index = NameIndex(rankings)
         
-        for ranking in rankings:
-            if restaurant_name in ranking['place_name']:
-                my_rankings.append({
-                    'keyword': ranking['keyword'],
-                    'rank': ranking['rank'],
-                    'date': ranking['search_date']
-                })
-                print(f"🎯 '{ranking['keyword']}' 검색 시 {ranking['rank']}위!")
+        for ranking in index.match(restaurant_name, place_id):
+            my_rankings.append({
+                'keyword': ranking['query'],
+                'rank': ranking['rank'],
+                'date': ranking['search_date']
+            })
+            print(f"🎯 '{ranking['query']}' 검색 시 {ranking['rank']}위!")
         
         if not my_rankings:
             print(f"😢 '{restaurant_name}'을(를) 순위에서 찾을 수 없습니다.")
@@ -0,0 +1,89 @@
+"""
+경량 브라우저 프로필 효과 측정 (실제 adlog.kr 접속 필요)
+키워드 검색 1회당 페이지 로딩 시간과 전송량을 경량 프로필 사용/미사용으로 비교
+
+사용법:
+    python scraping/benchmarks/browser_profile_benchmark.py
+    python scraping/benchmarks/browser_profile_benchmark.py 강남 맛집, 서초 카페
+"""
+
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from adlog_full_scraper import AdlogFullScraper
+from browser_profile import enable_transfer_logging, collect_transferred_bytes
+
+DEFAULT_KEYWORDS = ["강남 맛집", "강남 치킨", "서초 맛집"]
+
+
+def measure_profile(lean, keywords):
+    """한 가지 프로필로 로그인 후 키워드 검색 측정"""
+    scraper = AdlogFullScraper(headless=True, lean=lean)
+    enable_transfer_logging(scraper.chrome_options)
+
+    try:
+        if not scraper.login():
+            return None
+
+        collect_transferred_bytes(scraper.driver)  # 로그인 트래픽 제외
+
+        searches = []
+        for keyword in keywords:
+            page_load_before = scraper.metrics.stages.get('page_load', {}).get('total', 0.0)
+            started = time.perf_counter()
+            rankings = scraper.search_keyword_ranking(keyword)
+            elapsed = time.perf_counter() - started
+            page_load = scraper.metrics.stages.get('page_load', {}).get('total', 0.0) - page_load_before
+            transferred, requests_done, requests_failed = collect_transferred_bytes(scraper.driver)
+
+            searches.append({
+                'keyword': keyword,
+                'rows': len(rankings),
+                'page_load_sec': page_load,
+                'search_sec': elapsed,
+                'bytes': transferred,
+                'requests': requests_done,
+                'blocked_or_failed': requests_failed
+            })
+
+        return searches
+
+    finally:
+        scraper.close()
+
+
+def summarize(searches):
+    count = len(searches)
+    return {
+        'page_load_sec': sum(s['page_load_sec'] for s in searches) / count,
+        'search_sec': sum(s['search_sec'] for s in searches) / count,
+        'kb': sum(s['bytes'] for s in searches) / count / 1024,
+        'requests': sum(s['requests'] for s in searches) / count,
+        'blocked': sum(s['blocked_or_failed'] for s in searches) / count
+    }
+
+
+if __name__ == "__main__":
+    keywords = ' '.join(sys.argv[1:]).split(',') if len(sys.argv) > 1 else DEFAULT_KEYWORDS
+    keywords = [k.strip() for k in keywords if k.strip()]
+
+    results = {}
+    for label, lean in [('기본 프로필', False), ('경량 프로필', True)]:
+        print(f"\n🧪 {label} 측정 중...")
+        searches = measure_profile(lean, keywords)
+        if not searches:
+            print(f"❌ {label} 측정 실패 (로그인 확인)")
+            continue
+        results[label] = summarize(searches)
+
+    print("\n" + "=" * 72)
+    print(f"📊 키워드 검색 1회 평균 ({len(keywords)}개 키워드)")
+    print("=" * 72)
+    print(f"{'프로필':<10}{'페이지 로딩':>12}{'검색 전체':>12}{'전송량':>12}{'요청 수':>10}{'차단/실패':>10}")
+    for label, summary in results.items():
+        print(f"{label:<10}{summary['page_load_sec']:>11.2f}s{summary['search_sec']:>11.2f}s"
+              f"{summary['kb']:>10.1f}KB{summary['requests']:>10.1f}{summary['blocked']:>10.1f}")
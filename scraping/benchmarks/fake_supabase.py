@@ -0,0 +1,176 @@
+"""
+벤치마크용 가짜 Supabase 클라이언트
+네트워크 없이 테이블 조회/저장 흐름을 재현 (호출 수와 가상 지연 시간 기록)
+"""
+
+import itertools
+
+
+class FakeResponse:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    """postgrest 쿼리 빌더에서 스크래퍼가 쓰는 메서드만 흉내"""
+
+    def __init__(self, client, table):
+        self.client = client
+        self.table_name = table
+        self.columns = '*'
+        self.count = None
+        self.filters = []
+        self.orders = []  # [(컬럼, 내림차순 여부)], 앞쪽이 우선
+        self.limit_count = None
+        self.offset = 0
+        self.payload = None
+        self.action = 'select'
+
+    # 조회
+    def select(self, *columns, count=None):
+        self.columns = ','.join(columns) if columns else '*'
+        self.count = count
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def neq(self, column, value):
+        self.filters.append(lambda row: row.get(column) != value)
+        return self
+
+    def gt(self, column, value):
+        self.filters.append(lambda row: row.get(column) is not None and row.get(column) > value)
+        return self
+
+    def gte(self, column, value):
+        self.filters.append(lambda row: row.get(column) is not None and row.get(column) >= value)
+        return self
+
+    def lte(self, column, value):
+        self.filters.append(lambda row: row.get(column) is not None and row.get(column) <= value)
+        return self
+
+    def in_(self, column, values):
+        values = set(values)
+        self.filters.append(lambda row: row.get(column) in values)
+        return self
+
+    def is_(self, column, value):
+        expected = None if value in (None, 'null') else value
+        self.filters.append(lambda row: row.get(column) is expected)
+        return self
+
+    def ilike(self, column, pattern):
+        needle = pattern.strip('%').lower()
+        self.filters.append(lambda row: needle in str(row.get(column, '')).lower())
+        return self
+
+    def order(self, column, desc=False):
+        self.orders.append((column, desc))
+        return self
+
+    def limit(self, count):
+        self.limit_count = count
+        return self
+
+    def range(self, start, end):
+        self.offset = start
+        self.limit_count = end - start + 1
+        return self
+
+    # 저장
+    def insert(self, payload):
+        self.action = 'insert'
+        self.payload = payload
+        return self
+
+    def upsert(self, payload, on_conflict=None):
+        self.action = 'upsert'
+        self.payload = payload
+        return self
+
+    def delete(self):
+        self.action = 'delete'
+        return self
+
+    def execute(self):
+        return self.client._execute(self)
+
+
+class FakeSupabase:
+    def __init__(self, tables=None, latency=0.0, max_rows=1000):
+        """
+        초기화
+
+        Args:
+            tables: 초기 데이터 {테이블 이름: 행 리스트}
+            latency: 호출마다 더할 가상 왕복 지연 (초, 실제로 sleep하지 않고 합산만)
+            max_rows: PostgREST max-rows 제한 흉내
+        """
+        self.tables = {name: list(rows) for name, rows in (tables or {}).items()}
+        self.latency = latency
+        self.max_rows = max_rows
+
+        self.calls = 0
+        self.rows_written = 0
+        self.rpc_calls = {}
+        self.rpc_handlers = {}
+        self._ids = itertools.count(1)
+
+    @property
+    def simulated_latency(self):
+        """지금까지 호출 수 × 가상 지연"""
+        return self.calls * self.latency
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def rpc(self, name, params=None):
+        """등록한 핸들러로 RPC 흉내 (rpc_handlers[name] = func(client, params))"""
+        client = self
+
+        class _Rpc:
+            def execute(self_inner):
+                client.calls += 1
+                client.rpc_calls[name] = client.rpc_calls.get(name, 0) + 1
+                handler = client.rpc_handlers.get(name)
+                return FakeResponse(handler(client, params or {}) if handler else None)
+
+        return _Rpc()
+
+    def _execute(self, query):
+        self.calls += 1
+        rows = self.tables.setdefault(query.table_name, [])
+
+        if query.action in ('insert', 'upsert'):
+            payload = query.payload if isinstance(query.payload, list) else [query.payload]
+            for row in payload:
+                row = dict(row)
+                row.setdefault('id', next(self._ids))
+                rows.append(row)
+            self.rows_written += len(payload)
+            return FakeResponse(payload)
+
+        result = [row for row in rows if all(f(row) for f in query.filters)]
+        total = len(result)
+
+        if query.action == 'delete':
+            self.tables[query.table_name] = [row for row in rows if not all(f(row) for f in query.filters)]
+            return FakeResponse(result)
+
+        # 뒤쪽 정렬부터 안정 정렬 → 앞쪽 정렬이 우선
+        for column, descending in reversed(query.orders):
+            result.sort(key=lambda row: (row.get(column) is None, row.get(column)), reverse=descending)
+
+        limit = min(query.limit_count or self.max_rows, self.max_rows)
+        result = result[query.offset:query.offset + limit]
+
+        if query.columns.strip() != '*' and '(' not in query.columns:
+            columns = [c.strip() for c in query.columns.split(',')]
+            result = [{c: row.get(c) for c in columns} for row in result]
+
+        return FakeResponse(result, total if query.count else None)
+
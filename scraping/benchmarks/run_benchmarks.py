@@ -0,0 +1,318 @@
+"""
+ADLOG 오프라인 벤치마크
+저장된 결과 테이블 HTML과 가짜 Supabase로 파싱 / DB 저장 / 리포트 처리량 측정
+(adlog.kr 접속 없이 성능 개선 효과 확인용)
+
+사용법:
+    python scraping/benchmarks/run_benchmarks.py
+    python scraping/benchmarks/run_benchmarks.py --sizes 500 5000 --save before.json
+    python scraping/benchmarks/run_benchmarks.py --sizes 500 5000 --compare before.json
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import tempfile
+import contextlib
+from datetime import datetime, timedelta
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(BENCH_DIR, 'fixtures')
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from fake_supabase import FakeSupabase
+from adlog_full_scraper import AdlogFullScraper
+from adlog_login_scraper import AdlogLoginScraper
+from adlog_500_manager import Adlog500Manager
+from models import Restaurant, RankingRow
+
+DEFAULT_SIZES = [500, 5000, 50000]
+
+ROW_PATTERN = re.compile(r'(\s*<tr>\s*<td class="rank">.*?</tr>)', re.S)
+PLACE_ID_PATTERN = re.compile(r'/restaurant/\d+')
+RANK_PATTERN = re.compile(r'<td class="rank">\d+</td>')
+
+
+def load_fixture(name):
+    """저장된 HTML 픽스처 읽기"""
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def build_page(fixture_name, row_count):
+    """
+    픽스처의 결과 행을 반복해 원하는 행 수의 페이지 생성
+    (place_id와 순위는 행마다 고유하게 바꿈)
+    """
+    html = load_fixture(fixture_name)
+    templates = ROW_PATTERN.findall(html)
+    if not templates:
+        raise ValueError(f"{fixture_name}에서 결과 행을 찾을 수 없습니다")
+
+    rows = []
+    for i in range(row_count):
+        row = templates[i % len(templates)]
+        row = PLACE_ID_PATTERN.sub(f"/restaurant/{2000000000 + i}", row, count=1)
+        row = RANK_PATTERN.sub(f'<td class="rank">{i + 1}</td>', row, count=1)
+        rows.append(row)
+
+    start = html.index(templates[0])
+    end = html.index(templates[-1]) + len(templates[-1])
+    return html[:start] + ''.join(rows) + html[end:]
+
+
+def sample_restaurants(count):
+    """DB 저장 벤치마크용 식당 데이터"""
+    now = datetime.now().isoformat()
+    return [
+        Restaurant(
+            place_id=str(2000000000 + i),
+            place_name=f"벤치마크 식당 {i}",
+            place_url=f"https://m.place.naver.com/restaurant/{2000000000 + i}",
+            category='한식',
+            address='서울 강남구 테헤란로 1',
+            blog_count=i % 3000,
+            visitor_review_count=i % 9000,
+            collected_at=now
+        )
+        for i in range(count)
+    ]
+
+
+def sample_rankings(count, keywords=20):
+    """DB 저장 벤치마크용 순위 데이터 (키워드 × 순위)"""
+    today = datetime.now().strftime('%Y-%m-%d')
+    return [
+        RankingRow(
+            search_keyword=f"벤치마크 키워드 {i % keywords}",
+            rank=i // keywords + 1,
+            place_name=f"벤치마크 식당 {i}",
+            place_id=str(2000000000 + i),
+            blog_count=i % 3000,
+            visitor_review_count=i % 9000,
+            search_date=today,
+            search_time='06:00:00'
+        )
+        for i in range(count)
+    ]
+
+
+def report_tables(count):
+    """리포트 벤치마크용 요약 테이블 데이터"""
+    today = datetime.now().strftime('%Y-%m-%d')
+    week_start = (datetime.now() - timedelta(days=6)).strftime('%Y-%m-%d')
+    restaurants = [{'id': i + 1, 'place_id': str(2000000000 + i), 'place_name': f"벤치마크 식당 {i}",
+                    'category': '한식'} for i in range(count)]
+    daily = [{'id': i + 1, 'search_date': today, 'search_keyword': f"벤치마크 키워드 {i % 20}",
+              'restaurant_id': i + 1, 'rank': i // 20 + 1, 'rank_change': (i * 7) % 21 - 10,
+              'adlog_restaurants': {'place_name': f"벤치마크 식당 {i}"}} for i in range(count)]
+    return {
+        'adlog_restaurants': restaurants,
+        'daily_rankings': daily,
+        'daily_top20': [row for row in daily if row['rank'] <= 20],
+        'member_rankings': [dict(row) for row in daily[::10]],
+        'ranking_statistics': [{'id': i + 1, 'restaurant_id': i + 1, 'period_type': 'weekly',
+                                'period_start': week_start, 'period_end': today,
+                                'times_in_top10': i % 7,
+                                'adlog_restaurants': {'place_name': f"벤치마크 식당 {i}", 'category': '한식'}}
+                               for i in range(count)]
+    }
+
+
+@contextlib.contextmanager
+def quiet():
+    """행마다 출력되는 로그 숨기기 (출력 비용은 그대로 포함)"""
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def measure(func):
+    """실행 시간 측정 (초)"""
+    with quiet():
+        started = time.perf_counter()
+        extra = func()
+        elapsed = time.perf_counter() - started
+    return elapsed, extra or {}
+
+
+def bench_restaurant_list_parse(size):
+    html = build_page('restaurant_list_page.html', size)
+    scraper = AdlogFullScraper(headless=True)
+
+    def run():
+        restaurants = []
+        scraper.parse_restaurant_page(html, restaurants, set())
+        return {'rows': len(restaurants)}
+
+    return measure(run)
+
+
+def bench_keyword_ranking_parse(size):
+    html = build_page('keyword_result_page.html', size)
+    scraper = AdlogFullScraper(headless=True)
+    return measure(lambda: {'rows': len(scraper.parse_keyword_results(html, '강남 치킨'))})
+
+
+def bench_login_ranking_parse(size):
+    html = build_page('keyword_result_page.html', size)
+    scraper = AdlogLoginScraper(headless=True)
+    return measure(lambda: {'rows': len(scraper.parse_ranking_results(html, '강남 치킨'))})
+
+
+def bench_save_to_database(size):
+    scraper = AdlogFullScraper(headless=True)
+    scraper.supabase = FakeSupabase()
+    scraper.restaurants = sample_restaurants(size)
+    scraper.rankings = sample_rankings(size)
+
+    def run():
+        scraper.save_to_database()
+        return {'db_calls': scraper.supabase.calls}
+
+    return measure(run)
+
+
+def fake_bulk_save(client, params):
+    """DB 함수 adlog_bulk_save 흉내 (식당 upsert → place_id로 id 연결 → 순위 저장)"""
+    payload = params['payload']
+    restaurants = client.tables.setdefault('adlog_restaurants', [])
+    ids = {row['place_id']: row['id'] for row in restaurants}
+    for row in payload['restaurants']:
+        if row['place_id'] not in ids:
+            ids[row['place_id']] = len(restaurants) + 1
+            restaurants.append(dict(row, id=ids[row['place_id']]))
+
+    daily = client.tables.setdefault('daily_rankings', [])
+    saved = 0
+    for row in payload['rankings']:
+        restaurant_id = ids.get(row['place_id'])
+        if restaurant_id:
+            daily.append(dict(row, restaurant_id=restaurant_id))
+            saved += 1
+    return {'restaurants': len(payload['restaurants']), 'rankings': saved,
+            'skipped': len(payload['rankings']) - saved}
+
+
+def bench_bulk_save(size):
+    scraper = AdlogFullScraper(headless=True)
+    scraper.supabase = FakeSupabase()
+    scraper.supabase.rpc_handlers['adlog_bulk_save'] = fake_bulk_save
+    scraper.restaurants = sample_restaurants(size)
+    scraper.rankings = sample_rankings(size)
+
+    def run():
+        scraper.save_to_database()
+        return {'db_calls': scraper.supabase.calls}
+
+    return measure(run)
+
+
+def bench_reports(size):
+    manager = Adlog500Manager()
+    manager.supabase = FakeSupabase(report_tables(size))
+    workdir = tempfile.mkdtemp(prefix='adlog_bench_')
+
+    def run():
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            manager.report_cache.invalidate()
+            manager.generate_daily_report()
+            manager.get_trending_restaurants()
+            manager.export_streaming(fmt='csv')
+        finally:
+            os.chdir(cwd)
+        return {'db_calls': manager.supabase.calls}
+
+    return measure(run)
+
+
+BENCHMARKS = [
+    ('get_restaurant_list 파싱', bench_restaurant_list_parse),
+    ('search_keyword_ranking 파싱', bench_keyword_ranking_parse),
+    ('parse_ranking_results 파싱', bench_login_ranking_parse),
+    ('save_to_database', bench_save_to_database),
+    ('save_to_database (adlog_bulk_save)', bench_bulk_save),
+    ('리포트 (report + trending + export)', bench_reports),
+]
+
+
+def run_all(sizes, only=None):
+    """전체 벤치마크 실행 → {이름: {행 수: {'seconds', ...}}}"""
+    results = {}
+    for name, func in BENCHMARKS:
+        if only and not any(key in name for key in only):
+            continue
+        results[name] = {}
+        for size in sizes:
+            with quiet():
+                elapsed, extra = func(size)
+            results[name][str(size)] = {'seconds': round(elapsed, 4), **extra}
+            print(f"  ⏱️ {name} @ {size:,}행: {elapsed:.3f}초", file=sys.stderr)
+    return results
+
+
+def _display_width(text):
+    """터미널 표시 폭 (한글은 2칸)"""
+    return sum(2 if ord(ch) >= 0x1100 else 1 for ch in text)
+
+
+def _pad(text, width):
+    return text + ' ' * max(0, width - _display_width(text))
+
+
+def print_table(results, sizes, baseline=None):
+    """행 수별 비교 표 출력 (baseline이 있으면 변화율 함께 표시)"""
+    name_width = max(_display_width(name) for name in results) + 2
+    header = _pad("벤치마크", name_width) + ''.join(f"{f'{size:,}행':>14}" for size in sizes)
+    print("\n" + header)
+    print("-" * (_display_width(header) + len(sizes)))
+
+    for name, by_size in results.items():
+        line = _pad(name, name_width)
+        for size in sizes:
+            current = by_size.get(str(size), {}).get('seconds')
+            cell = f"{current:.3f}s" if current is not None else '-'
+            before = (baseline or {}).get(name, {}).get(str(size), {}).get('seconds')
+            if before and current is not None:
+                cell += f" ({(current - before) / before * 100:+.0f}%)"
+            line += f"{cell:>15}"
+        print(line)
+
+    db_rows = {name: by_size for name, by_size in results.items()
+               if any('db_calls' in r for r in by_size.values())}
+    if db_rows:
+        print("\nDB 호출 수")
+        for name, by_size in db_rows.items():
+            print(_pad(name, name_width) + ''.join(
+                f"{by_size.get(str(size), {}).get('db_calls', '-'):>15}" for size in sizes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ADLOG 오프라인 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="행 수 목록")
+    parser.add_argument('--only', nargs='+', help="이름에 포함된 벤치마크만 실행")
+    parser.add_argument('--save', help="결과 JSON 저장 경로")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = run_all(args.sizes, args.only)
+    print_table(results, args.sizes, baseline)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+응답 상태 분류 + 서킷 브레이커
+ADLOG가 로그인 화면 / 빈 결과 / 캡차를 돌려주기 시작해도 스크래퍼는 남은 키워드를 끝까지 요청했음
+→ 검색마다 결과를 ok / empty / login / blocked / error로 분류하고,
+  같은 실패가 연속으로 쌓이면 잠시 멈추거나(pause) 다시 로그인하거나(relogin) 중단(abort)
+실패한 요청에 쓴 시간은 종류별로 모아 실행 계측(lost_<종류> 단계)과 요약으로 남김
+"""
+
+import re
+import time
+from html import unescape
+
+from models import PLACE_ID_PATTERN
+from rate_limiter import looks_blocked
+
+OK = 'ok'
+EMPTY = 'empty'      # 결과 테이블이 없거나 비어 있음 (검색 결과가 정말 없는 키워드일 수도 있음)
+LOGIN = 'login'      # 로그인 화면으로 돌아감 (세션 만료)
+BLOCKED = 'blocked'  # 캡차 / 429 / 403 / 접근 제한 문구
+ERROR = 'error'      # 요청 / 드라이버 오류
+
+# 로그인 페이지로 돌려보내졌는지 (세션 쿠키가 통하지 않음)
+LOGIN_FORM_PATTERN = re.compile(r'<input[^>]+type=["\']?password', re.IGNORECASE)
+LOGIN_URL_PATTERN = re.compile(r'/(?:login|signin)\b', re.IGNORECASE)
+# 로그인된 화면에만 나오는 문구 (있으면 헤더의 로그인 위젯 등 비밀번호 칸은 무시)
+LOGGED_IN_PATTERN = re.compile(r'로그아웃|log\s?out|sign\s?out', re.IGNORECASE)
+
+# 화면에 보이지 않는 부분 (스크립트 / 스타일 / 주석) → 차단 문구는 보이는 텍스트에서만 찾음
+INVISIBLE_PATTERN = re.compile(r'<(script|style|noscript|template)\b[^>]*>.*?</\1\s*>|<!--.*?-->',
+                               re.IGNORECASE | re.DOTALL)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# arguments: 없음 / 반환: {url, text(보이는 본문 앞부분), password(보이는 비밀번호 입력 여부)}
+PAGE_STATE_JS = """
+const passwords = Array.from(document.querySelectorAll('input[type="password"]'));
+return {
+    url: location.href,
+    text: document.body ? document.body.innerText.slice(0, 3000) : '',
+    password: passwords.some(el => el.offsetParent !== null)
+};
+"""
+
+# 종류별 기본 연속 실패 허용 수 (이만큼 연속이면 조치)
+DEFAULT_THRESHOLDS = {LOGIN: 1, BLOCKED: 2, ERROR: 3, EMPTY: 5}
+
+
+def visible_text(html, limit=3000):
+    """HTML에서 화면에 보이는 텍스트 앞부분 (스크립트 / 스타일 / 주석 / 태그 제거, innerText와 비슷하게)"""
+    text = TAG_PATTERN.sub(' ', INVISIBLE_PATTERN.sub(' ', html or ''))
+    return ' '.join(unescape(text).split())[:limit]
+
+
+def has_place_links(html):
+    """응답에 플레이스 링크(결과 행)가 있는지"""
+    return bool(PLACE_ID_PATTERN.search(html or ''))
+
+
+def _login_page(url, text, password, logged_in):
+    """로그인 화면인지 (로그인 URL로 이동했거나, 로그인 상태여야 하는데 보이는 비밀번호 칸만 있고 로그아웃 메뉴가 없음)"""
+    if LOGIN_URL_PATTERN.search(url or ''):
+        return True
+    return logged_in and password and not LOGGED_IN_PATTERN.search(text)
+
+
+def classify_response(status_code=200, text='', url='', has_results=False, logged_in=True):
+    """
+    HTTP 응답 분류 (requests / 세션 요청용)
+
+    Args:
+        status_code: HTTP 상태 코드
+        text: 응답 HTML
+        url: 최종 URL (리다이렉트 후)
+        has_results: 결과 행을 하나라도 읽었는지 (읽었으면 다른 문구와 관계없이 ok)
+        logged_in: 로그인 세션으로 요청했는지 (False면 비밀번호 칸은 보지 않고 로그인 URL 이동만 확인)
+    """
+    if status_code in (403, 429):
+        return BLOCKED
+    if has_results:
+        return OK
+
+    shown = visible_text(text)
+    if looks_blocked(shown):
+        return BLOCKED
+    if _login_page(url, shown, bool(LOGIN_FORM_PATTERN.search(text or '')), logged_in):
+        return LOGIN
+    if status_code != 200:
+        return ERROR
+    return EMPTY
+
+
+def classify_page(driver, has_results=False):
+    """
+    브라우저에 열린 페이지 분류 (WebDriver 왕복 1회, 결과가 있으면 확인 없이 ok)
+
+    Args:
+        driver: Selenium 드라이버 (로그인 세션)
+        has_results: 결과 행을 하나라도 읽었는지
+    """
+    if has_results:
+        return OK
+
+    try:
+        state = driver.execute_script(PAGE_STATE_JS) or {}
+    except Exception:
+        return ERROR
+
+    text = state.get('text') or ''
+    if looks_blocked(text):
+        return BLOCKED
+    if _login_page(state.get('url'), text, bool(state.get('password')), True):
+        return LOGIN
+    return EMPTY
+
+
+class CircuitOpen(RuntimeError):
+    """서킷 브레이커가 중단을 결정함"""
+
+
+class CircuitBreaker:
+    def __init__(self, thresholds=None, cooldown=60.0, max_pauses=3, max_relogins=2, metrics=None):
+        """
+        초기화
+
+        Args:
+            thresholds: {종류: 연속 실패 허용 수} (DEFAULT_THRESHOLDS에 덮어씀)
+            cooldown: 첫 일시 정지 시간 (초, 정지할 때마다 2배)
+            max_pauses: 성공 없이 연속으로 일시 정지할 수 있는 횟수 (넘으면 중단)
+            max_relogins: 성공 없이 연속으로 다시 로그인할 수 있는 횟수 (넘으면 중단)
+            metrics: 실행 계측 객체 (lost_<종류> 단계 / failed_requests / breaker_* 카운터)
+        """
+        self.thresholds = dict(DEFAULT_THRESHOLDS, **(thresholds or {}))
+        self.cooldown = cooldown
+        self.max_pauses = max_pauses
+        self.max_relogins = max_relogins
+        self.metrics = metrics
+
+        self.streaks = {}   # 종류 -> 연속 횟수
+        self.lost = {}      # 종류 -> [횟수, 잃은 시간(초)]
+        self.pauses = 0
+        self.relogins = 0
+        self.aborted = False
+
+    def record(self, kind, elapsed=0.0):
+        """
+        요청 결과 반영
+
+        Args:
+            kind: classify_response / classify_page 결과
+            elapsed: 그 요청에 쓴 시간 (초)
+
+        Returns:
+            None(계속) / 'pause'(pause() 호출 후 계속) / 'relogin'(다시 로그인 후 계속) / 'abort'(중단)
+        """
+        if self.aborted:
+            return 'abort'
+
+        if kind == OK:
+            self.streaks.clear()
+            self.pauses = 0
+            self.relogins = 0
+            return None
+
+        lost = self.lost.setdefault(kind, [0, 0.0])
+        lost[0] += 1
+        lost[1] += elapsed or 0.0
+        if self.metrics:
+            self.metrics.record(f'lost_{kind}', elapsed or 0.0)
+            self.metrics.incr('failed_requests')
+
+        # 종류가 바뀌어도 다른 실패 연속 기록은 유지 (성공해야 초기화)
+        streak = self.streaks.get(kind, 0) + 1
+        if streak < self.thresholds.get(kind, 1):
+            self.streaks[kind] = streak
+            return None
+        self.streaks[kind] = 0
+
+        if kind == LOGIN and self.relogins < self.max_relogins:
+            self.relogins += 1
+            self._count('breaker_relogins')
+            return 'relogin'
+        if kind != LOGIN and self.pauses < self.max_pauses:
+            self.pauses += 1
+            return 'pause'
+
+        self.abort(f"{kind} 응답이 계속됨")
+        return 'abort'
+
+    def pause(self):
+        """일시 정지 (정지할 때마다 2배로 길게)"""
+        seconds = self.cooldown * 2 ** max(self.pauses - 1, 0)
+        print(f"⏸️ 실패 응답이 이어져 {seconds:.0f}초 대기")
+        self._count('breaker_pauses')
+        if self.metrics:
+            self.metrics.sleep(seconds, stage='breaker_pause')
+        else:
+            time.sleep(seconds)
+
+    def abort(self, reason=''):
+        """중단 (이후 record는 항상 'abort')"""
+        if not self.aborted:
+            self.aborted = True
+            self._count('breaker_aborts')
+            print(f"🛑 서킷 브레이커 중단: {reason}")
+
+    def check(self):
+        """중단된 상태면 CircuitOpen"""
+        if self.aborted:
+            raise CircuitOpen("서킷 브레이커가 열려 있음")
+
+    def _count(self, name):
+        if self.metrics:
+            self.metrics.incr(name)
+
+    def report(self):
+        """
+        실패 요청으로 잃은 시간 요약 출력
+
+        Returns:
+            {종류: {'count', 'seconds'}}
+        """
+        summary = {kind: {'count': count, 'seconds': round(seconds, 3)}
+                   for kind, (count, seconds) in sorted(self.lost.items())}
+        if summary:
+            total = sum(item['seconds'] for item in summary.values())
+            details = ', '.join(f"{kind} {item['count']}회 {item['seconds']:.1f}초" for kind, item in summary.items())
+            print(f"⏱️ 실패 요청으로 잃은 시간 {total:.1f}초 ({details})")
+        return summary
@@ -0,0 +1,133 @@
+"""
+Selenium 경량 브라우저 프로필
+이미지/폰트/트래커 등 파싱에 쓰지 않는 리소스를 막고 eager 로딩으로 페이지 대기 시간 단축
+"""
+
+import os
+import json
+
+# CDP Network.setBlockedURLs 패턴 (파싱에 쓰지 않는 리소스)
+BLOCKED_RESOURCE_PATTERNS = [
+    # 이미지
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp',
+    # 폰트
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    # 동영상/오디오
+    '*.mp4', '*.webm', '*.mp3',
+]
+
+BLOCKED_TRACKER_PATTERNS = [
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*doubleclick.net*',
+    '*googlesyndication.com*',
+    '*facebook.net*',
+    '*connect.facebook.com*',
+    '*wcs.naver.net*',
+    '*analytics.naver.com*',
+    '*kakao.com/v1/pixel*',
+    '*hotjar.com*',
+    '*clarity.ms*',
+]
+
+# 스타일시트는 기본으로 막지 않음: CSS가 없으면 숨겨진 요소도 is_displayed()가 참이 되고
+# 레이아웃이 바뀌어 선택자 / 클릭 위치가 달라질 수 있음 (ADLOG_LEAN_BLOCK_CSS=1이면 함께 차단)
+BLOCKED_CSS_PATTERNS = ['*.css']
+
+FALSE_VALUES = ('0', 'false', 'no', 'off', '')
+
+
+def lean_profile_enabled(lean=None):
+    """
+    경량 프로필 사용 여부
+
+    Args:
+        lean: True/False로 직접 지정, None이면 ADLOG_LEAN_PROFILE 환경변수 (기본 사용 안 함)
+    """
+    if lean is not None:
+        return lean
+    return os.getenv('ADLOG_LEAN_PROFILE', '0').lower() not in FALSE_VALUES
+
+
+def blocked_url_patterns(block_css=None):
+    """
+    차단할 URL 패턴 목록
+
+    Args:
+        block_css: 스타일시트도 차단할지 (None이면 ADLOG_LEAN_BLOCK_CSS 환경변수, 기본 차단 안 함)
+    """
+    if block_css is None:
+        block_css = os.getenv('ADLOG_LEAN_BLOCK_CSS', '0').lower() not in FALSE_VALUES
+    patterns = BLOCKED_RESOURCE_PATTERNS + BLOCKED_TRACKER_PATTERNS
+    if block_css:
+        patterns = patterns + BLOCKED_CSS_PATTERNS
+    return patterns
+
+
+def apply_lean_options(chrome_options):
+    """
+    드라이버 시작 전 Chrome 옵션에 경량 설정 적용
+
+    - eager 로딩: DOMContentLoaded 시점에 driver.get() 반환 (이미지/광고 로딩 대기 안 함)
+    - 이미지/알림 비활성화 환경설정
+    """
+    chrome_options.page_load_strategy = 'eager'
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-background-networking')
+    chrome_options.add_argument('--disable-component-update')
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2,
+        'profile.managed_default_content_settings.media_stream': 2,
+    })
+    return chrome_options
+
+
+def enable_network_blocking(driver, block_css=None):
+    """
+    드라이버 시작 후 CDP로 불필요한 요청 차단
+
+    Returns:
+        적용 성공 여부 (CDP 미지원 드라이버면 False)
+    """
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_url_patterns(block_css)})
+        return True
+    except Exception as e:
+        print(f"⚠️ 네트워크 차단 설정 실패: {str(e)}")
+        return False
+
+
+def enable_transfer_logging(chrome_options):
+    """전송량 측정을 위해 성능 로그 수집 활성화 (벤치마크용)"""
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return chrome_options
+
+
+def collect_transferred_bytes(driver):
+    """
+    마지막 호출 이후 네트워크 전송량 합계 (성능 로그 기준)
+
+    Returns:
+        (전송 바이트, 완료된 요청 수, 차단/실패한 요청 수)
+    """
+    total_bytes = 0
+    finished = 0
+    failed = 0
+
+    for entry in driver.get_log('performance'):
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError):
+            continue
+
+        method = message.get('method')
+        if method == 'Network.loadingFinished':
+            total_bytes += message['params'].get('encodedDataLength', 0)
+            finished += 1
+        elif method == 'Network.loadingFailed':
+            failed += 1
+
+    return total_bytes, finished, failed
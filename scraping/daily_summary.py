@@ -0,0 +1,47 @@
+"""
+일일 요약 테이블 갱신
+수집이 끝난 날짜만 DB 함수 refresh_daily_summary로 다시 계산
+(전일 대비 변동, TOP 20, 회원 순위, 일간/주간 통계 → daily_top20 / member_rankings / ranking_statistics)
+
+DB 함수는 database/schemas/features/ranking/daily-summary-tables.sql에 있음
+"""
+
+from datetime import datetime
+
+SUMMARY_SQL_PATH = 'database/schemas/features/ranking/daily-summary-tables.sql'
+
+
+def refresh_daily_summary(client, date=None, metrics=None):
+    """
+    하루치 요약 갱신 (RPC 한 번)
+
+    Args:
+        client: Supabase 클라이언트
+        date: 갱신할 날짜 'YYYY-MM-DD' (None이면 오늘)
+        metrics: 실행 계측 객체
+
+    Returns:
+        갱신 결과 dict (실패 시 None)
+    """
+    if not client:
+        return None
+
+    date = date or datetime.now().strftime('%Y-%m-%d')
+
+    try:
+        if metrics:
+            with metrics.timer('summary_refresh'):
+                result = client.rpc('refresh_daily_summary', {'p_date': date}).execute()
+        else:
+            result = client.rpc('refresh_daily_summary', {'p_date': date}).execute()
+    except Exception as e:
+        if metrics:
+            metrics.incr('summary_failures')
+        print(f"⚠️ 일일 요약 갱신 실패 ({SUMMARY_SQL_PATH} 실행 여부 확인): {str(e)}")
+        return None
+
+    summary = result.data or {}
+    if summary:
+        print(f"📊 {date} 요약 갱신: TOP20 {summary.get('top20', 0)}개, "
+              f"회원 {summary.get('member_rankings', 0)}개, 통계 {summary.get('statistics', 0)}개")
+    return summary
@@ -7,7 +7,12 @@ import schedule
 import time
 from datetime import datetime
 from adlog_scraper import AdlogScraper
+from adlog_full_scraper import AdlogFullScraper
+from driver_pool import DriverPool
 from supabase_uploader import SupabaseUploader
+from run_metrics import RunMetrics
+from keyword_registry import make_keyword
+from refresh_scheduler import RefreshScheduler
 import os
 from dotenv import load_dotenv
 
@@ -30,34 +35,49 @@ KEYWORDS_TO_TRACK = [
 # 내 식당 이름 (환경변수에서 가져오기)
 MY_RESTAURANT_NAME = os.getenv('MY_RESTAURANT_NAME', 'BBQ치킨')
 
-def daily_scraping_job():
-    """매일 실행할 스크래핑 작업"""
+def daily_scraping_job(scheduler=None):
+    """
+    매일 실행할 스크래핑 작업
+    
+    Args:
+        scheduler: 변동성 기반 갱신 스케줄러 (있으면 이번 수집을 키워드별 갱신으로 기록)
+    """
     print("=" * 60)
     print(f"🚀 일일 스크래핑 시작: {datetime.now()}")
     print("=" * 60)
     
+    # 단계별 계측 (스크래퍼/업로더가 같은 객체에 기록)
+    metrics = RunMetrics('daily_scraping_job')
+    
     try:
         # 1. 스크래퍼 초기화
-        scraper = AdlogScraper()
-        uploader = SupabaseUploader()
+        scraper = AdlogScraper(metrics=metrics)
+        uploader = SupabaseUploader(metrics=metrics)
         
         # 2. 키워드별 순위 수집
         print("\n📊 순위 데이터 수집 중...")
-        all_rankings = scraper.track_multiple_keywords(KEYWORDS_TO_TRACK)
+        all_rankings = scraper.track_multiple_keywords(KEYWORDS_TO_TRACK, [MY_RESTAURANT_NAME])
         
         if not all_rankings:
             print("⚠️ 수집된 데이터가 없습니다.")
+            if scheduler:
+                record_refreshes(scheduler, KEYWORDS_TO_TRACK, [])
             return
         
         # 3. 데이터 저장 (로컬 백업)
         print("\n💾 로컬 백업 저장 중...")
-        json_file = scraper.save_to_json(all_rankings)
-        csv_file = scraper.save_to_csv(all_rankings)
+        with metrics.timer('local_save'):
+            json_file = scraper.save_to_json(all_rankings)
+            csv_file = scraper.save_to_csv(all_rankings)
         
         # 4. Supabase 업로드
         print("\n☁️ Supabase 업로드 중...")
         upload_success = uploader.upload_rankings(all_rankings)
         
+        # 저장까지 끝난 수집만 갱신으로 기록 (업로드 실패는 실패한 갱신)
+        if scheduler:
+            record_refreshes(scheduler, KEYWORDS_TO_TRACK, all_rankings if upload_success else [])
+        
         if upload_success:
             # 5. 내 식당 순위 추적
             print(f"\n🎯 '{MY_RESTAURANT_NAME}' 순위 확인 중...")
@@ -66,7 +86,7 @@ def daily_scraping_job():
             if my_rankings:
                 print(f"\n✅ {MY_RESTAURANT_NAME} 오늘의 순위:")
                 for rank in my_rankings:
-                    keyword = f"{rank['location']} {rank['keyword']}" if rank['location'] else rank['keyword']
+                    keyword = make_keyword(rank['keyword'], rank['location']).query
                     change = ""
                     if rank['rank_change']:
                         if rank['rank_change'] > 0:
@@ -92,8 +112,102 @@ def daily_scraping_job():
         print("=" * 60)
         
     except Exception as e:
+        metrics.incr('job_failures')
         print(f"\n❌ 스크래핑 실패: {str(e)}")
         print("=" * 60)
+    
+    finally:
+        # 실행 요약 기록 (JSON Lines / Prometheus textfile)
+        metrics.finish()
+
+def ranking_collection_job(pool=None, scheduler=None):
+    """
+    로그인 기반(Selenium) 키워드 순위 수집 작업
+    
+    Args:
+        pool: 드라이버 풀 (있으면 로그인된 드라이버를 빌려 바로 시작, 없으면 새로 시작)
+        scheduler: RefreshScheduler (있으면 같은 우선순위 키워드를 변동성 순으로 검색)
+    """
+    print("=" * 60)
+    print(f"🚀 로그인 순위 수집 시작: {datetime.now()}")
+    print("=" * 60)
+    
+    metrics = RunMetrics('ranking_collection_job')
+    scraper = AdlogFullScraper(headless=True, metrics=metrics, scheduler=scheduler)
+    
+    try:
+        if pool:
+            with pool.acquire(metrics) as driver:
+                scraper.attach_driver(driver)
+                scraper.collect_all_rankings()
+                scraper.save_to_database()
+        else:
+            if not scraper.login():
+                metrics.incr('login_failures')
+                print("❌ 로그인 실패로 중단")
+                return
+            scraper.collect_all_rankings()
+            scraper.save_to_database()
+        
+        print(f"\n✅ 로그인 순위 수집 완료: {len(scraper.rankings)}개")
+        
+    except Exception as e:
+        metrics.incr('job_failures')
+        print(f"\n❌ 로그인 순위 수집 실패: {str(e)}")
+    
+    finally:
+        scraper.close()
+        metrics.finish()
+
+def record_refreshes(scheduler, keywords_list, rankings):
+    """키워드별로 나눠 스케줄러에 갱신 결과 기록"""
+    by_keyword = {}
+    for ranking in rankings:
+        keyword = make_keyword(ranking['search_keyword'], ranking['search_location'])
+        by_keyword.setdefault(keyword.id, []).append(ranking)
+    
+    for item in keywords_list:
+        keyword = make_keyword(item['keyword'], item.get('location'))
+        scheduler.record(keyword, by_keyword.get(keyword.id, []))
+
+def adaptive_refresh_job(scheduler, limit=None):
+    """
+    변동성 기반 키워드 갱신 (간격이 지난 키워드만 우선순위 순으로 다시 검색)
+    
+    Args:
+        scheduler: RefreshScheduler
+        limit: 이번에 갱신할 최대 키워드 수
+    """
+    keywords = scheduler.due(limit=limit)
+    if not keywords:
+        return
+    
+    print(f"\n🔄 키워드 갱신 {len(keywords)}개: {', '.join(keyword.query for keyword in keywords)}")
+    metrics = RunMetrics('adaptive_refresh_job')
+    
+    try:
+        scraper = AdlogScraper(metrics=metrics)
+        uploader = SupabaseUploader(metrics=metrics)
+        
+        results = [(keyword, scraper.search_place_ranking(keyword.term, keyword.location or ''))
+                   for keyword in keywords]
+        all_rankings = [ranking for _, rankings in results for ranking in rankings]
+        
+        metrics.incr('rankings_collected', len(all_rankings))
+        uploaded = bool(all_rankings) and uploader.upload_rankings(all_rankings)
+        
+        # 저장까지 끝난 갱신만 변동성에 반영 (업로드 실패는 실패한 갱신으로 간격만 다시 시작)
+        for keyword, rankings in results:
+            scheduler.record(keyword, rankings if uploaded else [])
+        if uploaded:
+            metrics.incr('keywords_refreshed', len(keywords))
+        
+    except Exception as e:
+        metrics.incr('job_failures')
+        print(f"\n❌ 키워드 갱신 실패: {str(e)}")
+    
+    finally:
+        metrics.finish()
 
 def test_run():
     """테스트 실행"""
@@ -102,20 +216,56 @@ def test_run():
 
 def start_scheduler():
     """스케줄러 시작"""
-    # 매일 오전 6시에 실행
-    schedule.every().day.at("06:00").do(daily_scraping_job)
+    # 로그인된 헤드리스 드라이버를 미리 띄워 두고 작업 사이에도 유지
+    # (ADLOG_DRIVER_POOL_SIZE=0이면 사용 안 함, 로그인 순위 수집도 예약하지 않음)
+    pool = DriverPool.from_env()
+    
+    # ADLOG_ADAPTIVE_REFRESH=1이면 오후 6시 일괄 실행 대신 키워드별 변동성에 따라 갱신
+    # (하루 요청 예산 ADLOG_REFRESH_BUDGET, 기본은 기존과 같은 키워드 수 x 2)
+    scheduler = None
+    if os.getenv('ADLOG_ADAPTIVE_REFRESH', '').lower() in ('1', 'true', 'yes'):
+        budget = os.getenv('ADLOG_REFRESH_BUDGET')
+        scheduler = RefreshScheduler.from_history(
+            SupabaseUploader().supabase,
+            [make_keyword(item['keyword'], item.get('location')) for item in KEYWORDS_TO_TRACK],
+            budget=int(budget) if budget else None
+        )
+        scheduler.print_plan()
+    
+    # 매일 오전 6시에 실행 (리포트 포함)
+    schedule.every().day.at("06:00").do(daily_scraping_job, scheduler)
     
-    # 매일 오후 6시에도 실행 (선택사항)
-    schedule.every().day.at("18:00").do(daily_scraping_job)
+    if scheduler:
+        tick_minutes = int(os.getenv('ADLOG_REFRESH_TICK_MINUTES', '30'))
+        schedule.every(tick_minutes).minutes.do(adaptive_refresh_job, scheduler)
+    else:
+        # 매일 오후 6시에도 실행 (선택사항)
+        schedule.every().day.at("18:00").do(daily_scraping_job)
+    
+    if pool:
+        schedule.every().day.at("06:00").do(ranking_collection_job, pool, scheduler)
+        schedule.every().day.at("18:00").do(ranking_collection_job, pool, scheduler)
     
     print("🕐 스케줄러 시작")
     print("  • 오전 6시 실행 예약")
-    print("  • 오후 6시 실행 예약")
+    if scheduler:
+        print(f"  • {tick_minutes}분마다 변동성 기반 키워드 갱신")
+    else:
+        print("  • 오후 6시 실행 예약")
+    if pool:
+        print(f"  • 드라이버 풀 {pool.size}개 유지 (로그인 순위 수집)")
+        pool.warm()
     print("\n대기 중... (Ctrl+C로 종료)")
     
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # 1분마다 체크
+    try:
+        while True:
+            schedule.run_pending()
+            if pool:
+                pool.maintain()  # 유휴 드라이버 상태 확인 / 교체
+            time.sleep(60)  # 1분마다 체크
+    finally:
+        if pool:
+            pool.close()
 
 if __name__ == "__main__":
     import sys
@@ -123,6 +273,9 @@ if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "test":
         # 테스트 실행
         test_run()
+    elif len(sys.argv) > 1 and sys.argv[1] == "rankings":
+        # 로그인 순위 수집만 바로 실행
+        ranking_collection_job()
     else:
         # 스케줄러 실행
         start_scheduler()
@@ -0,0 +1,178 @@
+"""
+상위 20위 너머 순위 수집 (필요한 만큼만 다음 결과 페이지로 이동)
+키워드마다 찾을 식당(그 키워드에 나온 적 있는 우리 회원 / 추적 중인 플레이스)이 모두 나오면 바로 멈추고,
+못 찾으면 설정한 깊이(ADLOG_RANK_DEPTH)까지만 이동
+→ 깊은 순위 추적 비용이 고정 최대 깊이가 아니라 회원이 실제로 있는 순위에 비례
+"""
+
+import os
+from datetime import datetime, timedelta
+
+from keyword_registry import parse_keyword
+from models import place_id_from_url
+from name_matcher import NameIndex
+from paged_reader import iter_rows
+from table_columns import column_map
+
+PAGE_SIZE = 20  # 결과 한 페이지 행 수 (기존 수집 깊이)
+DEFAULT_DEPTH = int(os.getenv('ADLOG_RANK_DEPTH', str(PAGE_SIZE)))
+MAX_DEPTH = 300
+
+
+def rank_depth(depth=None):
+    """수집할 최대 순위 (None이면 ADLOG_RANK_DEPTH, 20~300)"""
+    depth = DEFAULT_DEPTH if depth is None else int(depth)
+    return max(PAGE_SIZE, min(depth, MAX_DEPTH))
+
+
+class RankTargets:
+    """한 키워드에서 찾아야 하는 식당 (다 찾으면 더 깊이 볼 필요 없음)"""
+
+    def __init__(self, restaurants=()):
+        """
+        Args:
+            restaurants: 식당 이름 문자열 또는 {'name', 'place_id'} dict 리스트 (NameIndex.match_many와 같은 형태)
+        """
+        self.pending = []
+        for restaurant in restaurants:
+            if isinstance(restaurant, str):
+                self.pending.append((restaurant, None))
+            else:
+                self.pending.append((restaurant.get('name'), restaurant.get('place_id')))
+        self.found = []
+        self._index = NameIndex()
+
+    def __len__(self):
+        return len(self.pending) + len(self.found)
+
+    @property
+    def done(self):
+        return not self.pending
+
+    def add_rows(self, rows):
+        """
+        결과 행을 색인에 추가하고 이번에 찾은 식당을 pending에서 제거
+
+        Args:
+            rows: [(셀 텍스트 리스트, 플레이스 링크, 헤더 셀 튜플), ...]
+
+        Returns:
+            모두 찾았는지 여부
+        """
+        for cols, href, headers in rows:
+            self._index.add({
+                'place_name': column_map(headers).text(cols, 'place_name'),
+                'place_id': place_id_from_url(href)
+            })
+
+        still_pending = []
+        for name, place_id in self.pending:
+            if self._index.match(name, place_id):
+                self.found.append((name, place_id))
+            else:
+                still_pending.append((name, place_id))
+        self.pending = still_pending
+        return self.done
+
+
+def load_keyword_targets(client, keywords, days=14):
+    """
+    키워드별로 찾을 회원 식당 (그 키워드에 나온 적 있는 회원만)
+    - keyword_restaurant_mapping에 연결된 회원 식당
+    - 최근 daily_rankings에서 그 키워드 순위에 나온 회원 식당
+
+    Args:
+        client: Supabase 클라이언트
+        keywords: 수집할 Keyword 리스트
+        days: 읽을 순위 기록 기간 (일)
+
+    Returns:
+        {Keyword id: [{'name', 'place_id'}, ...]}
+        기록이 있는데 회원이 없으면 빈 리스트(첫 페이지만), 기록이 전혀 없는 키워드는 빠짐(깊이 끝까지 한 번 수집해 기록을 만듦)
+        연결 없음 / 조회 실패 시 None (모든 키워드 깊이 끝까지)
+    """
+    if not client:
+        return None
+
+    wanted = {keyword.id for keyword in keywords}
+    found = {}  # Keyword id -> {restaurant id: 찾을 식당}
+
+    try:
+        members = {
+            row['id']: {'name': row.get('place_name'), 'place_id': row.get('place_id')}
+            for row in iter_rows(client, 'adlog_restaurants', ('id', 'place_id', 'place_name'),
+                                 filters=[('eq', 'is_our_member', True)])
+        }
+
+        def add(text, restaurant_id):
+            keyword = parse_keyword(text)
+            if keyword.id not in wanted:
+                return
+            places = found.setdefault(keyword.id, {})
+            if restaurant_id in members:
+                places[restaurant_id] = members[restaurant_id]
+
+        keyword_texts = {row['id']: row['keyword'] for row in iter_rows(client, 'tracking_keywords', ('id', 'keyword'))
+                         if row.get('keyword')}
+        for row in iter_rows(client, 'keyword_restaurant_mapping', ('keyword_id', 'restaurant_id')):
+            if row.get('keyword_id') in keyword_texts:
+                add(keyword_texts[row['keyword_id']], row.get('restaurant_id'))
+
+        since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        for row in iter_rows(client, 'daily_rankings', ('search_keyword', 'restaurant_id'),
+                             filters=[('gte', 'search_date', since)]):
+            if row.get('search_keyword'):
+                add(row['search_keyword'], row.get('restaurant_id'))
+    except Exception as e:
+        print(f"⚠️ 키워드별 회원 식당 조회 실패, 설정 깊이까지 수집: {str(e)}")
+        return None
+
+    return {keyword_id: list(places.values()) for keyword_id, places in found.items()}
+
+
+def _row_key(row):
+    cols, href, _ = row
+    return href or tuple(cols)
+
+
+def walk_result_pages(read_rows, open_page, depth=None, targets=None, metrics=None):
+    """
+    결과 페이지를 필요한 만큼만 넘기며 행 수집
+
+    Args:
+        read_rows: read_rows(limit) -> 현재 페이지 결과 행 [(셀, 링크, 헤더), ...]
+        open_page: open_page(페이지 번호) -> 다음 결과 페이지로 이동했는지 여부
+        depth: 최대 순위 (None이면 ADLOG_RANK_DEPTH, 20이면 첫 페이지만)
+        targets: RankTargets (None이면 깊이 끝까지, 모두 찾으면 바로 중단)
+        metrics: 실행 계측 객체 (deep_rank_pages / deep_rank_early_stops 카운터)
+
+    Returns:
+        순위 순서의 결과 행 (최대 depth개)
+    """
+    depth = rank_depth(depth)
+    rows = []
+    seen = set()
+    page_num = 1
+
+    while True:
+        # '더보기'처럼 앞 페이지 행이 다시 오는 경우도 있어 이미 본 행은 건너뜀
+        page_rows = [row for row in read_rows(depth) or [] if _row_key(row) not in seen]
+        page_rows = page_rows[:depth - len(rows)]
+        seen.update(_row_key(row) for row in page_rows)
+        rows.extend(page_rows)
+
+        if len(rows) >= depth or not page_rows or depth <= PAGE_SIZE:
+            break
+        if targets is not None and targets.add_rows(page_rows):
+            print(f"  🎯 추적 식당 {len(targets)}곳 모두 확인 ({len(rows)}위까지)")
+            if metrics:
+                metrics.incr('deep_rank_early_stops')
+            break
+
+        page_num += 1
+        if not open_page(page_num):
+            break
+        if metrics:
+            metrics.incr('deep_rank_pages')
+
+    return rows
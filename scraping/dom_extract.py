@@ -0,0 +1,154 @@
+"""
+브라우저 안에서 순위 테이블 직접 추출
+page_source 전체를 가져와 BeautifulSoup로 다시 파싱하는 대신,
+execute_script 한 번으로 필요한 행(셀 텍스트 + 플레이스 링크)만 JSON으로 받음
+"""
+
+import json
+
+# 검색 결과 테이블 후보 (앞에서부터 먼저 찾은 테이블 사용)
+RANKING_TABLE_SELECTORS = ['table.ranking-table', '#ranking-result', 'table.ranking', 'table']
+
+# arguments: [selectors, allTables, limit]
+# 반환: JSON 문자열 {headers: [테이블별 헤더 셀 텍스트 배열], rows: [[셀 텍스트 배열, 플레이스 링크 또는 null, 테이블 번호], ...]}
+#       테이블이 없으면 null
+EXTRACT_ROWS_JS = """
+const selectors = arguments[0];
+const allTables = arguments[1];
+const limit = arguments[2];
+
+let tables = [];
+if (allTables) {
+    tables = Array.from(document.querySelectorAll('table'));
+} else {
+    for (const selector of selectors) {
+        const table = document.querySelector(selector);
+        if (table) { tables = [table]; break; }
+    }
+}
+if (!tables.length) return null;
+
+// 셀 텍스트: 하위 요소 텍스트를 이어 붙이고 공백을 한 칸으로 (html_table_rows의 cell_text와 같은 규칙)
+const cellText = cell => (cell.textContent || '').replace(/\s+/g, ' ').trim();
+
+const headers = [];
+const out = [];
+tables.forEach((table, tableIndex) => {
+    const allRows = Array.from(table.querySelectorAll('tr'));
+    headers.push(allRows.length
+        ? Array.from(allRows[0].querySelectorAll('th, td')).map(cellText)
+        : []);
+    let rows = allRows.slice(1);
+    if (limit) rows = rows.slice(0, limit);
+    for (const row of rows) {
+        const cells = Array.from(row.querySelectorAll('td')).map(cellText);
+        if (cells.length < 2) continue;
+        const link = row.querySelector('a[href*="place.naver.com"]');
+        out.push([cells, link ? link.getAttribute('href') : null, tableIndex]);
+    }
+});
+return JSON.stringify({headers: headers, rows: out});
+"""
+
+# arguments: [다음 페이지 번호 텍스트, 다음 버튼 텍스트 목록]
+# 반환: 클릭할 요소 또는 null
+FIND_NEXT_PAGE_JS = """
+const target = arguments[0];
+const nextTexts = arguments[1];
+const text = el => (el.textContent || '').trim();
+
+// 방법 1: 숫자 버튼
+for (const el of document.querySelectorAll('a.page-link, button.page-link')) {
+    if (text(el) === target) return el;
+}
+
+// 방법 2: "다음" / "더보기" 링크 (정확히 일치 우선, 그다음 부분 일치)
+const anchors = Array.from(document.querySelectorAll('a'));
+for (const label of nextTexts) {
+    const exact = anchors.find(el => text(el) === label);
+    if (exact) return exact;
+    const partial = anchors.find(el => text(el).includes(label));
+    if (partial) return partial;
+}
+
+// 방법 3: 페이지네이션 영역
+const area = document.querySelector('.pagination, .paging, .page-navigation');
+if (area) {
+    for (const el of area.querySelectorAll('a')) {
+        if (text(el).includes(target)) return el;
+    }
+}
+return null;
+"""
+
+NEXT_PAGE_TEXTS = ['다음', '더보기', 'Next', '>', '>>', '다음 페이지']
+
+
+def extract_table_rows(driver, selectors=None, all_tables=False, limit=0):
+    """
+    결과 테이블 행 추출 (WebDriver 왕복 1회)
+
+    Args:
+        driver: Selenium 드라이버
+        selectors: 테이블 CSS 선택자 후보 (all_tables=False일 때)
+        all_tables: True면 페이지의 모든 테이블에서 행 추출
+        limit: 테이블당 최대 행 수 (0이면 전체)
+
+    Returns:
+        [(셀 텍스트 리스트, 플레이스 링크, 그 테이블의 헤더 튜플), ...] / 테이블이 없거나 실패하면 None (HTML 파서로 대체)
+    """
+    try:
+        raw = driver.execute_script(EXTRACT_ROWS_JS, selectors or RANKING_TABLE_SELECTORS, all_tables, limit)
+    except Exception as e:
+        print(f"⚠️ DOM 직접 추출 실패, HTML 파싱으로 대체: {str(e)}")
+        return None
+
+    if raw is None:
+        return None
+
+    data = json.loads(raw)
+    headers = [tuple(header) for header in data['headers']]
+    return [(cells, href, headers[table_index]) for cells, href, table_index in data['rows']]
+
+
+def cell_text(cell):
+    """셀 텍스트 (하위 요소 텍스트를 이어 붙이고 공백을 한 칸으로, EXTRACT_ROWS_JS의 cellText와 같은 규칙)"""
+    return ' '.join(cell.get_text().split())
+
+
+def html_table_rows(table, limit=0):
+    """
+    BeautifulSoup 테이블에서 extract_table_rows와 같은 형태로 행 추출
+
+    Args:
+        table: BeautifulSoup table 태그
+        limit: 최대 행 수 (0이면 전체)
+    """
+    all_rows = table.find_all('tr')
+    if not all_rows:
+        return []
+
+    headers = tuple(cell_text(cell) for cell in all_rows[0].find_all(['th', 'td']))
+    body = all_rows[1:limit + 1] if limit else all_rows[1:]  # 헤더 제외
+
+    rows = []
+    for row in body:
+        cols = row.find_all('td')
+        if len(cols) >= 2:
+            place_link = row.find('a', href=lambda x: x and 'place.naver.com' in x)
+            rows.append((
+                [cell_text(col) for col in cols],
+                place_link.get('href') if place_link else None,
+                headers
+            ))
+    return rows
+
+
+def find_next_page_element(driver, next_page_num):
+    """
+    다음 페이지 버튼 찾기 (WebDriver 왕복 1회)
+
+    Returns:
+        클릭할 WebElement 또는 None
+    """
+    return driver.execute_script(FIND_NEXT_PAGE_JS, str(next_page_num), NEXT_PAGE_TEXTS)
@@ -0,0 +1,218 @@
+"""
+로그인된 헤드리스 Chrome 드라이버 풀
+스케줄러처럼 오래 도는 프로세스에서 드라이버를 미리 띄워 로그인해 두고,
+작업마다 브라우저 시작/로그인 비용 없이 바로 수집 시작
+(N회 사용 또는 메모리 증가 시 교체, 유휴 중 상태 확인)
+"""
+
+import os
+import time
+import threading
+from contextlib import contextmanager
+
+from adlog_login_scraper import AdlogLoginScraper
+from driver_watchdog import driver_rss_mb
+
+
+class PooledDriver:
+    """풀에 들어 있는 드라이버 한 개 (사용 횟수 / 메모리 기준값)"""
+
+    def __init__(self, scraper):
+        self.scraper = scraper
+        self.driver = scraper.driver
+        self.uses = 0
+        self.created_at = time.monotonic()
+        self.base_rss_mb = self.rss_mb()
+
+    def rss_mb(self):
+        return driver_rss_mb(self.driver)
+
+
+class DriverPool:
+    def __init__(self, size=1, max_uses=20, max_rss_growth_mb=500, max_idle_check=600,
+                 headless=True, metrics=None):
+        """
+        초기화
+
+        Args:
+            size: 미리 띄워 둘 드라이버 수
+            max_uses: 이 횟수만큼 쓰면 교체
+            max_rss_growth_mb: 시작 시점 대비 메모리(브라우저 전체 RSS)가 이만큼 늘면 교체
+            max_idle_check: 유휴 드라이버 상태 확인 간격 (초)
+            headless: 헤드리스 실행 여부
+            metrics: 드라이버 시작/로그인 계측 객체 (없으면 드라이버마다 새로 생성)
+        """
+        self.size = size
+        self.max_uses = max_uses
+        self.max_rss_growth_mb = max_rss_growth_mb
+        self.max_idle_check = max_idle_check
+        self.headless = headless
+        self.metrics = metrics
+
+        self._idle = []
+        self._lock = threading.Lock()
+        self._last_check = time.monotonic()
+        self.stats = {'launched': 0, 'hits': 0, 'misses': 0, 'recycled': 0, 'unhealthy': 0}
+
+    @classmethod
+    def from_env(cls, metrics=None):
+        """환경변수로 풀 생성 (ADLOG_DRIVER_POOL_SIZE=0이면 None)"""
+        size = int(os.getenv('ADLOG_DRIVER_POOL_SIZE', '1'))
+        if size <= 0:
+            return None
+        return cls(
+            size=size,
+            max_uses=int(os.getenv('ADLOG_DRIVER_MAX_USES', '20')),
+            max_rss_growth_mb=int(os.getenv('ADLOG_DRIVER_MAX_RSS_GROWTH_MB', '500')),
+            metrics=metrics
+        )
+
+    def _launch(self):
+        """드라이버 시작 + 로그인 (실패하면 None)"""
+        scraper = AdlogLoginScraper(headless=self.headless, metrics=self.metrics)
+        if not scraper.login():
+            scraper.close()
+            return None
+
+        self.stats['launched'] += 1
+        return PooledDriver(scraper)
+
+    def _retire(self, entry, reason):
+        """드라이버 종료"""
+        print(f"♻️ 드라이버 교체 ({reason}, {entry.uses}회 사용)")
+        try:
+            entry.scraper.close()
+        except Exception as e:
+            print(f"⚠️ 드라이버 종료 실패: {str(e)}")
+
+    def is_healthy(self, entry):
+        """브라우저 응답 + 로그인 유지 여부"""
+        try:
+            entry.driver.execute_script("return document.readyState")
+            return "login" not in entry.driver.current_url.lower()
+        except Exception:
+            return False
+
+    def recycle_reason(self, entry):
+        """교체가 필요하면 이유, 아니면 None"""
+        if entry.uses >= self.max_uses:
+            return f"사용 {self.max_uses}회 도달"
+
+        rss = entry.rss_mb()
+        if rss is not None and entry.base_rss_mb is not None:
+            growth = rss - entry.base_rss_mb
+            if growth >= self.max_rss_growth_mb:
+                return f"메모리 {growth:.0f}MB 증가"
+
+        return None
+
+    def warm(self):
+        """풀을 size만큼 채움"""
+        while True:
+            with self._lock:
+                if len(self._idle) >= self.size:
+                    return
+            entry = self._launch()
+            if not entry:
+                print("⚠️ 드라이버 풀 준비 실패 (로그인 확인)")
+                return
+            with self._lock:
+                self._idle.append(entry)
+            print(f"🔥 드라이버 풀 준비: {len(self._idle)}/{self.size}")
+
+    def maintain(self):
+        """
+        유휴 드라이버 상태 확인 후 다시 채움
+        스케줄러 대기 루프에서 주기적으로 호출 (max_idle_check 간격으로만 실제 확인)
+        """
+        if time.monotonic() - self._last_check < self.max_idle_check:
+            return
+        self._last_check = time.monotonic()
+
+        with self._lock:
+            entries, self._idle = self._idle, []
+
+        healthy = []
+        for entry in entries:
+            if not self.is_healthy(entry):
+                self.stats['unhealthy'] += 1
+                self._retire(entry, "응답 없음/로그아웃")
+                continue
+
+            reason = self.recycle_reason(entry)
+            if reason:
+                self.stats['recycled'] += 1
+                self._retire(entry, reason)
+            else:
+                healthy.append(entry)
+
+        with self._lock:
+            self._idle.extend(healthy)
+
+        self.warm()
+
+    @contextmanager
+    def acquire(self, metrics=None):
+        """
+        로그인된 드라이버 빌려 쓰기
+
+        사용 예:
+            with pool.acquire(metrics) as driver:
+                scraper.attach_driver(driver)
+                scraper.collect_all_rankings()
+
+        Args:
+            metrics: 작업 계측 객체 (pool_hit / pool_miss / pool_acquire 기록)
+        """
+        started = time.perf_counter()
+        entry = None
+
+        # 잠금은 꺼낼 때만 (상태 확인 / 종료는 느리거나 멈출 수 있어 잠금 밖에서, 다른 스레드의 대여/반납을 막지 않음)
+        while entry is None:
+            with self._lock:
+                if not self._idle:
+                    break
+                candidate = self._idle.pop()
+            if self.is_healthy(candidate):
+                entry = candidate
+            else:
+                self.stats['unhealthy'] += 1
+                self._retire(candidate, "응답 없음/로그아웃")
+
+        if entry:
+            self.stats['hits'] += 1
+            if metrics:
+                metrics.incr('pool_hit')
+        else:
+            # 풀이 비었으면 바로 새로 띄움 (콜드 스타트)
+            self.stats['misses'] += 1
+            if metrics:
+                metrics.incr('pool_miss')
+            entry = self._launch()
+            if not entry:
+                raise RuntimeError("드라이버 시작/로그인 실패")
+
+        if metrics:
+            metrics.record('pool_acquire', time.perf_counter() - started)
+
+        try:
+            yield entry.driver
+        finally:
+            entry.uses += 1
+            reason = self.recycle_reason(entry)
+            if reason:
+                self.stats['recycled'] += 1
+                self._retire(entry, reason)
+            else:
+                with self._lock:
+                    self._idle.append(entry)
+
+    def close(self):
+        """모든 드라이버 종료"""
+        with self._lock:
+            entries, self._idle = self._idle, []
+        for entry in entries:
+            try:
+                entry.scraper.close()
+            except Exception:
+                pass
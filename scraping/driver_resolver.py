@@ -0,0 +1,212 @@
+"""
+ChromeDriver 경로 결정 (로컬 캐시 + 오프라인 버전 확인)
+매 시작마다 ChromeDriverManager().install()로 네트워크 확인/다운로드하지 않고,
+설치된 Chrome 메이저 버전에 맞는 드라이버를 캐시에 고정해 재사용
+"""
+
+import os
+import re
+import json
+import time
+import shutil
+import subprocess
+import threading
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'drivers')
+MANIFEST_NAME = 'manifest.json'
+
+# Chrome 실행 파일 후보 (ADLOG_CHROME_BINARY가 있으면 그것만 사용)
+CHROME_BINARIES = [
+    'google-chrome',
+    'google-chrome-stable',
+    'chromium',
+    'chromium-browser',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+    r'C:\Program Files\Google\Chrome\Application\chrome.exe',
+    r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe',
+]
+
+VERSION_PATTERN = re.compile(r'(\d+)\.(\d+)\.(\d+)\.(\d+)')
+
+# 같은 프로세스에서 드라이버를 여러 번 시작할 때 재확인하지 않도록 기억
+_resolved = {}
+_lock = threading.Lock()
+
+
+class DriverResolveError(RuntimeError):
+    """사용할 수 있는 ChromeDriver를 찾지 못함"""
+
+
+def _read_version(command):
+    """`<command> --version` 출력에서 버전 문자열 추출 (실패하면 None)"""
+    try:
+        output = subprocess.run(
+            [command, '--version'], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    match = VERSION_PATTERN.search(output or '')
+    return match.group(0) if match else None
+
+
+def _major(version):
+    return version.split('.')[0] if version else None
+
+
+def detect_chrome_version():
+    """설치된 Chrome 버전 (네트워크 없이 실행 파일로 확인, 못 찾으면 None)"""
+    binary = os.getenv('ADLOG_CHROME_BINARY')
+    for candidate in ([binary] if binary else CHROME_BINARIES):
+        path = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if path:
+            version = _read_version(path)
+            if version:
+                return version
+    return None
+
+
+def driver_version(driver_path):
+    """ChromeDriver 바이너리 버전 (실행 실패 시 None)"""
+    return _read_version(driver_path)
+
+
+def _load_manifest(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(cache_dir, manifest):
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, MANIFEST_NAME)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _pin_driver(source_path, version, cache_dir):
+    """드라이버 바이너리를 캐시 폴더에 버전별 이름으로 복사"""
+    os.makedirs(cache_dir, exist_ok=True)
+    suffix = '.exe' if source_path.lower().endswith('.exe') else ''
+    pinned = os.path.join(cache_dir, f"chromedriver-{version}{suffix}")
+    if os.path.abspath(source_path) != os.path.abspath(pinned):
+        shutil.copy2(source_path, pinned)
+    os.chmod(pinned, 0o755)
+    return pinned
+
+
+def _matches(driver_path, chrome_major):
+    """드라이버 메이저 버전이 Chrome과 맞는지 (Chrome 버전을 모르면 실행 가능 여부만 확인)"""
+    version = driver_version(driver_path)
+    if not version:
+        return None
+    if chrome_major and _major(version) != chrome_major:
+        return None
+    return version
+
+
+def _download(chrome_version):
+    """webdriver-manager로 Chrome 버전에 맞는 드라이버 다운로드 (네트워크 필요)"""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager(driver_version=chrome_version).install()
+
+
+def resolve_chromedriver(cache_dir=None, offline=None, metrics=None):
+    """
+    사용할 ChromeDriver 경로 결정
+
+    순서:
+        1. ADLOG_CHROMEDRIVER 환경변수 (버전 확인 없이 그대로 사용)
+        2. 캐시에 고정한 드라이버 (Chrome 메이저 버전 일치)
+        3. PATH의 chromedriver (일치하면 캐시에 고정)
+        4. 네트워크 다운로드 후 캐시에 고정 (offline이면 건너뜀)
+
+    Args:
+        cache_dir: 드라이버 캐시 폴더 (None이면 ADLOG_DRIVER_CACHE 또는 scraping/data/drivers)
+        offline: True면 다운로드하지 않음 (None이면 ADLOG_DRIVER_OFFLINE 환경변수)
+        metrics: 실행 계측 객체 (driver_resolve 단계로 기록)
+
+    Returns:
+        드라이버 경로
+
+    Raises:
+        DriverResolveError: 사용할 수 있는 드라이버가 없을 때
+    """
+    started = time.perf_counter()
+    try:
+        path, source = _resolve(cache_dir, offline)
+    finally:
+        elapsed = time.perf_counter() - started
+        if metrics:
+            metrics.record('driver_resolve', elapsed)
+
+    print(f"🔧 ChromeDriver ({source}): {path} [{elapsed:.2f}초]")
+    return path
+
+
+def _resolve(cache_dir, offline):
+    explicit = os.getenv('ADLOG_CHROMEDRIVER')
+    if explicit:
+        if not os.path.isfile(explicit):
+            raise DriverResolveError(f"ADLOG_CHROMEDRIVER 파일이 없습니다: {explicit}")
+        return explicit, '환경변수'
+
+    cache_dir = cache_dir or os.getenv('ADLOG_DRIVER_CACHE') or DEFAULT_CACHE_DIR
+    if offline is None:
+        offline = os.getenv('ADLOG_DRIVER_OFFLINE', '0').lower() in ('1', 'true', 'yes', 'on')
+
+    with _lock:
+        if cache_dir in _resolved:
+            return _resolved[cache_dir], '메모리'
+
+        chrome_version = detect_chrome_version()
+        chrome_major = _major(chrome_version)
+        manifest = _load_manifest(cache_dir)
+
+        # 캐시에 고정한 드라이버
+        entry = manifest.get(chrome_major or 'unknown')
+        if entry and os.path.isfile(entry['path']) and _matches(entry['path'], chrome_major):
+            _resolved[cache_dir] = entry['path']
+            return entry['path'], '캐시'
+
+        # PATH에 있는 드라이버, 없으면 다운로드
+        candidate, source = shutil.which('chromedriver'), 'PATH'
+        version = _matches(candidate, chrome_major) if candidate else None
+
+        if not version:
+            if offline:
+                raise DriverResolveError(
+                    f"Chrome {chrome_version or '(버전 확인 불가)'}에 맞는 ChromeDriver가 캐시/PATH에 없습니다 (오프라인 모드)"
+                )
+            if not chrome_version:
+                raise DriverResolveError("Chrome 버전을 확인할 수 없습니다 (ADLOG_CHROME_BINARY 확인)")
+            candidate, source = _download(chrome_version), '다운로드'
+            version = _matches(candidate, chrome_major)
+            if not version:
+                raise DriverResolveError(f"다운로드한 드라이버가 Chrome {chrome_version}과 맞지 않습니다: {candidate}")
+
+        pinned = _pin_driver(candidate, version, cache_dir)
+        manifest[chrome_major or 'unknown'] = {
+            'path': pinned,
+            'driver_version': version,
+            'chrome_version': chrome_version,
+            'pinned_at': time.strftime('%Y-%m-%dT%H:%M:%S')
+        }
+        _save_manifest(cache_dir, manifest)
+        _resolved[cache_dir] = pinned
+        return pinned, source
+
+
+if __name__ == "__main__":
+    # 배포 시 미리 실행해 두면 스케줄 작업은 캐시만 사용
+    chrome = detect_chrome_version()
+    print(f"🌐 Chrome: {chrome or '찾을 수 없음'}")
+    try:
+        resolved = resolve_chromedriver()
+        print(f"✅ 드라이버 {driver_version(resolved)} 고정 완료")
+    except DriverResolveError as e:
+        print(f"❌ {str(e)}")
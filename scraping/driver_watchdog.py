@@ -0,0 +1,257 @@
+"""
+브라우저 세션 감시 (끊긴 세션 재시작 + 주기적 교체)
+Chrome / chromedriver가 수집 도중 죽으면 이후 검색이 모두 예외 → 빈 결과로 끝나 나머지 실행을 잃었음
+→ 검색이 실패하면 세션이 살아 있는지 확인해 죽었으면 브라우저를 다시 띄워 로그인하고 그 키워드를 다시 검색,
+  오래 쓴 브라우저는 N번 검색하거나 메모리(RSS)가 기준을 넘으면 키워드 사이에서 미리 교체
+"""
+
+import os
+import re
+import time
+
+# 선택 의존성 (없으면 Linux /proc에서 직접 읽음)
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# 세션이 사라졌을 때 Selenium / chromedriver가 내는 오류 문구
+SESSION_LOST_PATTERN = re.compile(
+    r'invalid session id|session deleted|chrome not reachable|disconnected|no such window'
+    r'|target window already closed|target crashed|tab crashed|connection refused|max retries exceeded',
+    re.IGNORECASE
+)
+
+
+def _proc_children():
+    """Linux /proc에서 {부모 pid: [자식 pid]} 맵 생성"""
+    children = {}
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{name}/stat', encoding='utf-8') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # comm에 공백/괄호가 있을 수 있어 마지막 ')' 뒤에서 분리
+        ppid = int(stat.rsplit(')', 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(name))
+    return children
+
+
+def _proc_rss(pid):
+    """Linux /proc에서 프로세스 RSS (바이트)"""
+    try:
+        with open(f'/proc/{pid}/status', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def process_tree_rss_mb(pid):
+    """
+    프로세스와 모든 하위 프로세스 RSS 합계 (MB)
+    chromedriver pid를 넣으면 Chrome 브라우저/렌더러까지 포함
+
+    Returns:
+        MB 또는 측정할 수 없으면 None
+    """
+    if not pid:
+        return None
+
+    if psutil:
+        try:
+            root = psutil.Process(pid)
+            processes = [root] + root.children(recursive=True)
+            total = 0
+            for process in processes:
+                try:
+                    total += process.memory_info().rss
+                except psutil.Error:
+                    continue
+            return total / 1024 / 1024
+        except psutil.Error:
+            return None
+
+    if not os.path.isdir('/proc'):
+        return None
+
+    children = _proc_children()
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        total += _proc_rss(current)
+        stack.extend(children.get(current, []))
+    return total / 1024 / 1024
+
+
+def driver_rss_mb(driver):
+    """드라이버가 띄운 브라우저 전체 RSS (MB, 측정할 수 없으면 None)"""
+    try:
+        pid = driver.service.process.pid
+    except AttributeError:
+        return None
+    return process_tree_rss_mb(pid)
+
+
+def is_session_lost(error):
+    """브라우저 세션이 사라져 생긴 예외인지 (드라이버 프로세스 종료 / 탭 크래시 / 연결 끊김)"""
+    if isinstance(error, ConnectionError):
+        return True
+    return type(error).__name__ == 'InvalidSessionIdException' or bool(SESSION_LOST_PATTERN.search(str(error)))
+
+
+class DriverWatchdog:
+    def __init__(self, scraper, max_pages=None, max_rss_mb=None, max_restarts=5, retries=1,
+                 rss_check_every=5, breaker=None, metrics=None):
+        """
+        초기화
+
+        Args:
+            scraper: 감시할 스크래퍼 (driver / logged_in / owns_driver / login() / close())
+            max_pages: 이 횟수만큼 검색하면 브라우저 교체 (None이면 ADLOG_BROWSER_MAX_PAGES, 0이면 교체 안 함)
+            max_rss_mb: 브라우저 전체 RSS가 이 값(MB)을 넘으면 교체 (None이면 ADLOG_BROWSER_MAX_RSS_MB, 0이면 확인 안 함)
+            max_restarts: 한 실행에서 끊긴 세션을 다시 띄우는 최대 횟수 (넘으면 중단)
+            retries: 세션이 끊긴 키워드를 다시 검색하는 횟수
+            rss_check_every: RSS 확인 간격 (검색 수)
+            breaker: 재시작에 실패하면 중단시킬 서킷 브레이커
+            metrics: 실행 계측 객체 (driver_restart 단계 / driver_restarts / driver_recycles / keyword_retries 카운터)
+        """
+        self.scraper = scraper
+        self.max_pages = int(os.getenv('ADLOG_BROWSER_MAX_PAGES', '150')) if max_pages is None else max_pages
+        self.max_rss_mb = int(os.getenv('ADLOG_BROWSER_MAX_RSS_MB', '1500')) if max_rss_mb is None else max_rss_mb
+        self.max_restarts = max_restarts
+        self.retries = retries
+        self.rss_check_every = rss_check_every
+        self.breaker = breaker
+        self.metrics = metrics
+
+        self.pages = 0          # 지금 브라우저로 검색한 수
+        self.restarts = 0       # 끊긴 세션 재시작 수
+        self._rss_checked_at = 0
+        self._rss_over = None   # 마지막 확인에서 기준을 넘은 RSS (MB)
+
+    def _count(self, name):
+        if self.metrics:
+            self.metrics.incr(name)
+
+    def alive(self):
+        """브라우저 세션이 응답하는지 (WebDriver 왕복 1회)"""
+        driver = self.scraper.driver
+        if driver is None:
+            return False
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def completed(self, count=1):
+        """검색 완료 기록 (교체 주기 계산용)"""
+        self.pages += count
+
+    def recycle_due(self):
+        """
+        미리 교체해야 하면 이유, 아니면 None
+        풀에서 빌린 드라이버는 풀이 사용 횟수 / 메모리로 교체하므로 확인하지 않음
+        """
+        if not getattr(self.scraper, 'owns_driver', True):
+            return None
+        if self.max_pages and self.pages >= self.max_pages:
+            return f"검색 {self.pages}회"
+
+        if self.max_rss_mb and self.pages - self._rss_checked_at >= self.rss_check_every:
+            self._rss_checked_at = self.pages
+            rss = driver_rss_mb(self.scraper.driver)
+            self._rss_over = rss if rss is not None and rss >= self.max_rss_mb else None
+        if self._rss_over is not None:
+            return f"메모리 {self._rss_over:.0f}MB"
+        return None
+
+    def restart(self, reason):
+        """
+        브라우저를 닫고 새로 띄워 다시 로그인
+
+        Returns:
+            성공 여부 (실패하면 서킷 브레이커 중단)
+        """
+        print(f"♻️ 브라우저 재시작 ({reason})")
+        scraper = self.scraper
+        try:
+            scraper.close()
+        except Exception:
+            pass  # 이미 죽은 세션은 종료도 실패할 수 있음
+
+        # 풀에서 빌린 드라이버였어도 새 브라우저는 직접 띄워 소유 (죽은 드라이버는 풀이 상태 확인 때 정리)
+        scraper.driver = None
+        scraper.logged_in = False
+        scraper.owns_driver = True
+
+        started = time.perf_counter()
+        ok = scraper.login()
+        if self.metrics:
+            self.metrics.record('driver_restart', time.perf_counter() - started)
+
+        self.pages = 0
+        self._rss_checked_at = 0
+        self._rss_over = None
+        if not ok:
+            print("❌ 브라우저 재시작 / 로그인 실패")
+            if self.breaker:
+                self.breaker.abort("브라우저 재시작 실패")
+        return ok
+
+    def recover(self, reason="세션 끊김"):
+        """끊긴 세션 재시작 (한 실행에서 max_restarts번까지)"""
+        if self.restarts >= self.max_restarts:
+            if self.breaker:
+                self.breaker.abort(f"브라우저 재시작 {self.max_restarts}회 초과")
+            return False
+        self.restarts += 1
+        self._count('driver_restarts')
+        return self.restart(reason)
+
+    def maybe_recycle(self):
+        """교체 주기가 됐으면 키워드 사이에서 브라우저 교체"""
+        reason = self.recycle_due()
+        if not reason:
+            return True
+        self._count('driver_recycles')
+        return self.restart(reason)
+
+    def run(self, search, keyword):
+        """
+        검색 1회 실행, 세션이 끊겨 실패했으면 브라우저를 다시 띄워 같은 키워드 재시도
+
+        Args:
+            search: 검색 함수 (결과 리스트 반환, 내부에서 예외를 잡아 빈 리스트를 돌려줘도 됨)
+            keyword: 검색 키워드
+
+        Returns:
+            결과 리스트 (끝내 실패하면 빈 리스트)
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                result = search(keyword)
+            except Exception as e:
+                if not is_session_lost(e) and self.alive():
+                    raise
+                result = None
+
+            # 결과가 있거나 세션이 살아 있으면 (정말 빈 결과 / 차단은 서킷 브레이커가 판단)
+            if result or self.alive():
+                self.completed()
+                return result or []
+
+            print(f"💥 '{keyword}' 검색 중 브라우저 세션이 끊김")
+            if attempt == self.retries or not self.recover():
+                break
+            self._count('keyword_retries')
+            print(f"🔁 '{keyword}' 다시 검색")
+
+        return []
@@ -0,0 +1,192 @@
+"""
+검색 키워드 정규화 / 공용 레지스트리
+"강남 치킨" ↔ (지역='강남', 키워드='치킨') 변환을 한 곳에서 한 번만 하고 결과를 캐시
+(행마다 split으로 지역을 추측하거나 f-string으로 다시 조합하지 않음)
+"""
+
+import re
+import threading
+import unicodedata
+
+from paged_reader import iter_rows
+
+# 지역 사전 (첫 단어가 여기 있으면 지역으로 분리)
+LOCATIONS = frozenset([
+    # 서울 구
+    '강남', '강동', '강북', '강서', '관악', '광진', '구로', '금천', '노원', '도봉', '동대문', '동작',
+    '마포', '서대문', '서초', '성동', '성북', '송파', '양천', '영등포', '용산', '은평', '종로', '중구', '중랑',
+    # 서울 주요 상권
+    '역삼', '선릉', '삼성', '신사', '압구정', '청담', '논현', '잠실', '방이', '홍대', '합정', '연남', '망원',
+    '신촌', '이태원', '한남', '성수', '건대', '을지로', '명동', '여의도', '목동', '사당', '노량진', '왕십리',
+    '익선동', '서촌', '북촌', '대학로', '가로수길',
+    # 수도권 / 광역시
+    '판교', '분당', '일산', '수원', '인천', '송도', '부산', '해운대', '서면', '광안리', '대구', '대전',
+    '광주', '울산', '제주',
+])
+
+# 사전의 지역 뒤에 붙어도 같은 지역으로 보는 접미사 (예: 강남역, 성수동, 해운대구)
+# 사전에 없는 단어는 접미사만으로 지역으로 보지 않음 (우동 / 규동 / 텐동 같은 메뉴가 지역이 됨)
+LOCATION_SUFFIXES = ('역', '동', '구')
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# tracking_keywords.priority 기본값 (1=높음, 5=낮음)
+DEFAULT_PRIORITY = 1
+
+# 기본 추적 키워드 (tracking_keywords 테이블이 비었거나 연결이 없을 때)
+DEFAULT_TRACKED_KEYWORDS = [
+    "강남 맛집", "강남 치킨", "강남 카페",
+    "서초 맛집", "송파 맛집",
+    "역삼 맛집", "선릉 맛집", "삼성 맛집",
+    "해운대 맛집", "해운대 고기집",
+]
+
+
+def normalize_text(text):
+    """
+    키워드 문자열 정리
+    - NFC 정규화 (macOS 등에서 들어온 자모 분리 한글을 완성형으로)
+    - 공백 정리
+    """
+    text = unicodedata.normalize('NFC', text or '')
+    return WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+class Keyword:
+    """정규화된 검색 키워드"""
+
+    __slots__ = ('id', 'term', 'location', 'query')
+
+    def __init__(self, term, location=None):
+        self.term = term
+        self.location = location or None
+        self.query = f"{location} {term}" if location else term
+        # 지역/키워드 안의 공백 차이("강남 맛집" vs "강남  맛집")와 영문 대소문자는 같은 id
+        self.id = f"{(location or '').lower()}:{term.replace(' ', '').lower()}"
+
+    def __repr__(self):
+        return f"Keyword({self.query!r})"
+
+    def __eq__(self, other):
+        return isinstance(other, Keyword) and self.id == other.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+
+class KeywordRegistry:
+    def __init__(self, locations=LOCATIONS):
+        """
+        초기화
+
+        Args:
+            locations: 지역 사전
+        """
+        self.locations = locations
+        self._by_text = {}  # 입력 문자열 -> Keyword
+        self._by_id = {}    # id -> Keyword (같은 id면 처음 등록한 객체 재사용)
+        self.priorities = {}  # id -> tracking_keywords 우선순위 (load_tracked에서 채움)
+        self._lock = threading.Lock()
+
+    def is_location(self, word):
+        if word in self.locations:
+            return True
+        return len(word) > 1 and word.endswith(LOCATION_SUFFIXES) and word[:-1] in self.locations
+
+    def _intern(self, keyword):
+        return self._by_id.setdefault(keyword.id, keyword)
+
+    def parse(self, text):
+        """
+        "강남 치킨" 같은 검색어를 Keyword로 (결과 캐시)
+
+        첫 단어가 지역이고 뒤에 단어가 더 있으면 지역으로 분리
+        """
+        cached = self._by_text.get(text)
+        if cached:
+            return cached
+
+        normalized = normalize_text(text)
+        if not normalized:
+            raise ValueError("빈 키워드입니다")
+
+        first, _, rest = normalized.partition(' ')
+        if rest and self.is_location(first):
+            keyword = Keyword(rest, first)
+        else:
+            keyword = Keyword(normalized)
+
+        with self._lock:
+            keyword = self._intern(keyword)
+            self._by_text[text] = keyword
+        return keyword
+
+    def get(self, term, location=None):
+        """키워드 + 지역으로 Keyword (예: get('치킨', '강남'))"""
+        key = (term, location)
+        cached = self._by_text.get(key)
+        if cached:
+            return cached
+
+        term = normalize_text(term)
+        location = normalize_text(location) or None
+        if not term:
+            raise ValueError("빈 키워드입니다")
+
+        # 지역이 따로 없으면 키워드 문자열에서 분리 ("강남 치킨" 한 덩어리로 들어온 경우)
+        keyword = Keyword(term, location) if location else self.parse(term)
+
+        with self._lock:
+            keyword = self._intern(keyword)
+            self._by_text[key] = keyword
+        return keyword
+
+    def load_tracked(self, supabase=None, default=None):
+        """
+        추적 키워드 목록 (tracking_keywords 테이블의 활성 키워드, 없으면 기본 목록)
+
+        Returns:
+            Keyword 리스트 (중복 제거, 순서 유지)
+        """
+        entries = []  # (검색어, 우선순위)
+        if supabase:
+            try:
+                rows = iter_rows(supabase, 'tracking_keywords', ('keyword', 'priority'),
+                                 filters=[('eq', 'is_active', True)])
+                entries = [(row['keyword'], row.get('priority')) for row in rows if row.get('keyword')]
+            except Exception as e:
+                print(f"⚠️ 추적 키워드 조회 실패, 기본 목록 사용: {str(e)}")
+
+        if not entries:
+            entries = [(text, None) for text in default or DEFAULT_TRACKED_KEYWORDS]
+
+        keywords = []
+        priorities = {}
+        for text, priority in entries:
+            keyword = self.parse(text)
+            if keyword.id not in priorities:
+                keywords.append(keyword)
+                priorities[keyword.id] = DEFAULT_PRIORITY if priority is None else priority
+            elif priority is not None:
+                # 같은 키워드가 여러 행이면 가장 높은(작은) 우선순위
+                priorities[keyword.id] = min(priority, priorities[keyword.id])
+        self.priorities.update(priorities)
+        return keywords
+
+    def priority(self, keyword):
+        """키워드 우선순위 (1=높음, tracking_keywords에 없으면 DEFAULT_PRIORITY)"""
+        return self.priorities.get(keyword.id, DEFAULT_PRIORITY)
+
+
+# 모든 모듈이 같은 캐시를 쓰도록 공용 인스턴스
+registry = KeywordRegistry()
+
+
+def parse_keyword(text):
+    """공용 레지스트리로 검색어 파싱"""
+    return registry.parse(text)
+
+
+def make_keyword(term, location=None):
+    """공용 레지스트리로 키워드 + 지역 조합"""
+    return registry.get(term, location)
@@ -0,0 +1,161 @@
+"""
+요소 찾기 (후보 선택자 일괄 탐색 + 성공한 선택자 기억)
+try/except로 find_element를 하나씩 시도하면 없는 후보마다 implicit wait(최대 10초)를 기다림
+→ 후보 전체를 execute_script 한 번으로 확인하고, 페이지/단계별로 성공한 선택자를 파일에 저장해
+  다음 실행에서는 그 선택자를 가장 먼저 확인 (레이아웃이 그대로면 WebDriver 왕복 1회)
+
+후보는 (By.NAME, 'userid') 같은 Selenium 로케이터 튜플 그대로 사용
+"""
+
+import os
+import json
+import time
+import threading
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'locator_cache.json')
+
+# arguments: [[by, value], ...], visibleOnly
+# 반환: [후보 번호, 요소] 또는 null
+PROBE_JS = """
+const candidates = arguments[0];
+const visibleOnly = arguments[1];
+const text = el => (el.textContent || '').trim();
+const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+
+function findAll(by, value) {
+    switch (by) {
+        case 'id': return [document.getElementById(value)].filter(Boolean);
+        case 'name': return Array.from(document.getElementsByName(value));
+        case 'css selector': return Array.from(document.querySelectorAll(value));
+        case 'class name': return Array.from(document.getElementsByClassName(value));
+        case 'tag name': return Array.from(document.getElementsByTagName(value));
+        case 'link text': return Array.from(document.querySelectorAll('a')).filter(el => text(el) === value);
+        case 'partial link text': return Array.from(document.querySelectorAll('a')).filter(el => text(el).includes(value));
+        case 'xpath': {
+            const found = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const out = [];
+            for (let i = 0; i < found.snapshotLength; i++) out.push(found.snapshotItem(i));
+            return out;
+        }
+    }
+    return [];
+}
+
+for (let i = 0; i < candidates.length; i++) {
+    let elements = [];
+    try { elements = findAll(candidates[i][0], candidates[i][1]); } catch (e) { continue; }
+    for (const el of elements) {
+        if (!visibleOnly || visible(el)) return [i, el];
+    }
+}
+return null;
+"""
+
+
+class LocatorNotFound(LookupError):
+    """후보 선택자로 요소를 찾지 못함"""
+
+
+class LocatorCache:
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path=None, poll_interval=0.25):
+        """
+        초기화
+
+        Args:
+            path: 성공한 선택자 저장 파일 (None이면 ADLOG_LOCATOR_CACHE 또는 scraping/data/locator_cache.json)
+            poll_interval: 요소가 아직 없을 때 다시 확인하는 간격 (초)
+        """
+        self.path = path or os.getenv('ADLOG_LOCATOR_CACHE') or DEFAULT_CACHE_PATH
+        self.poll_interval = poll_interval
+        self.round_trips = {}  # 단계 -> WebDriver 왕복 수
+        self._lock = threading.Lock()
+
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                self._learned = json.load(f)
+        except (OSError, ValueError):
+            self._learned = {}  # '페이지:단계' -> [by, value]
+
+    @classmethod
+    def shared(cls, path=None):
+        """프로세스 안에서 파일별로 하나만 생성해 공유"""
+        path = path or os.getenv('ADLOG_LOCATOR_CACHE') or DEFAULT_CACHE_PATH
+        with cls._shared_lock:
+            if path not in cls._shared:
+                cls._shared[path] = cls(path)
+            return cls._shared[path]
+
+    def _ordered(self, key, candidates):
+        """기억한 선택자를 맨 앞으로"""
+        candidates = [tuple(candidate) for candidate in candidates]
+        learned = self._learned.get(key)
+        if learned and tuple(learned) in candidates:
+            learned = tuple(learned)
+            return [learned] + [c for c in candidates if c != learned]
+        return candidates
+
+    def _remember(self, key, candidate):
+        with self._lock:
+            if self._learned.get(key) == list(candidate):
+                return
+            self._learned[key] = list(candidate)
+            learned = dict(self._learned)
+
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(learned, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ 선택자 캐시 저장 실패: {str(e)}")
+
+    def find(self, driver, page, step, candidates, timeout=10, visible=True, required=True, metrics=None):
+        """
+        후보 선택자 중 처음 찾은 요소 반환
+
+        Args:
+            driver: Selenium 드라이버 (implicit wait 0 권장)
+            page / step: 캐시 키 (예: 'login', 'username')
+            candidates: (By, 값) 튜플 리스트 (앞쪽 후보 우선)
+            timeout: 아무것도 없을 때 다시 확인할 최대 시간 (초), 0이면 한 번만 확인
+            visible: 화면에 보이는 요소만
+            required: True면 못 찾았을 때 LocatorNotFound, False면 None
+            metrics: 실행 계측 객체 (locator_round_trips / locator_cache_hits 기록)
+
+        Returns:
+            WebElement 또는 None
+        """
+        key = f"{page}:{step}"
+        ordered = self._ordered(key, candidates)
+        probe = [list(candidate) for candidate in ordered]
+        deadline = time.monotonic() + timeout
+
+        while True:
+            with self._lock:
+                self.round_trips[step] = self.round_trips.get(step, 0) + 1
+            if metrics:
+                metrics.incr('locator_round_trips')
+
+            found = driver.execute_script(PROBE_JS, probe, visible)
+            if found:
+                index, element = found
+                if metrics and index == 0 and key in self._learned:
+                    metrics.incr('locator_cache_hits')
+                self._remember(key, ordered[index])
+                return element
+
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(self.poll_interval)
+
+        if metrics:
+            metrics.incr('locator_misses')
+        if required:
+            raise LocatorNotFound(f"{key} 요소를 찾을 수 없음: {[value for _, value in ordered]}")
+        return None
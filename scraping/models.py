@@ -0,0 +1,228 @@
+"""
+순위 / 식당 레코드 공용 모델
+스크래퍼마다 키가 조금씩 다른 dict 대신 __slots__ 레코드 하나로 통일
+(행마다 dict를 만들지 않아 메모리/생성 비용이 적고, DB 행 / Arrow 배치로 바로 변환)
+"""
+
+import re
+from datetime import datetime
+
+from keyword_registry import parse_keyword
+
+# 선택 의존성
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+PLACE_ID_PATTERN = re.compile(r'/(?:restaurant|place)/(\d+)')
+
+
+class ValidationError(ValueError):
+    """레코드 값이 스키마에 맞지 않음"""
+
+
+def place_id_from_url(url):
+    """네이버 플레이스 URL에서 place_id 추출 (없으면 None)"""
+    if not url:
+        return None
+    match = PLACE_ID_PATTERN.search(url)
+    if match:
+        return match.group(1)
+    return url.rstrip('/').split('/')[-1].split('?')[0] or None
+
+
+def _to_int(value, field):
+    if value is None or value == '':
+        return 0
+    if isinstance(value, int):
+        return value
+    try:
+        return int(str(value).replace(',', ''))
+    except ValueError:
+        raise ValidationError(f"{field}은(는) 정수여야 합니다: {value!r}")
+
+
+class _Record:
+    """슬롯 레코드 공통 기능 (기존 dict 접근 코드와 호환되도록 읽기용 [] / get 지원)"""
+
+    __slots__ = ()
+
+    def __getitem__(self, name):
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name)
+
+    def get(self, name, default=None):
+        return getattr(self, name, default)
+
+    def to_dict(self):
+        """JSON / CSV 저장용 dict"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__[:4])
+        return f"{type(self).__name__}({fields}, ...)"
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+
+class RankingRow(_Record):
+    """키워드 검색 결과 한 줄"""
+
+    __slots__ = ('search_keyword', 'search_location', 'rank', 'place_name', 'place_id',
+                 'category', 'address', 'phone', 'blog_count', 'visitor_review_count',
+                 'search_date', 'search_time')
+
+    def __init__(self, search_keyword, rank, place_name, place_id=None, search_location=None,
+                 category='', address='', phone='', blog_count=0, visitor_review_count=0,
+                 search_date=None, search_time=None):
+        if not search_keyword:
+            raise ValidationError("search_keyword가 비어 있습니다")
+        if not place_name:
+            raise ValidationError("place_name이 비어 있습니다")
+
+        rank = _to_int(rank, 'rank')
+        if rank < 1:
+            raise ValidationError(f"rank는 1 이상이어야 합니다: {rank}")
+
+        self.search_keyword = search_keyword
+        self.search_location = search_location or None
+        self.rank = rank
+        self.place_name = place_name
+        self.place_id = str(place_id) if place_id else None
+        self.category = category or ''
+        self.address = address or ''
+        self.phone = phone or ''
+        self.blog_count = _to_int(blog_count, 'blog_count')
+        self.visitor_review_count = _to_int(visitor_review_count, 'visitor_review_count')
+
+        if search_date is None or search_time is None:
+            now = datetime.now()
+            search_date = search_date or now.strftime('%Y-%m-%d')
+            search_time = search_time or now.strftime('%H:%M:%S')
+        self.search_date = search_date
+        self.search_time = search_time
+
+    @property
+    def query(self):
+        """실제 검색어 (예: "강남 치킨")"""
+        if self.search_location:
+            return f"{self.search_location} {self.search_keyword}"
+        return self.search_keyword
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        기존 dict 형식에서 변환
+        ('keyword'에 "지역 키워드"가 합쳐진 예전 형식도 지원)
+        """
+        if 'search_keyword' not in data and 'keyword' in data:
+            keyword = parse_keyword(data['keyword'])
+            data = dict(data)
+            data['search_keyword'] = keyword.term
+            data.setdefault('search_location', keyword.location)
+        return super().from_dict(data)
+
+    @classmethod
+    def coerce(cls, row):
+        """RankingRow면 그대로, dict면 변환"""
+        return row if isinstance(row, cls) else cls.from_dict(row)
+
+    def to_db_row(self):
+        """place_rankings 테이블 행"""
+        return {
+            'search_keyword': self.search_keyword,
+            'search_location': self.search_location,
+            'search_date': self.search_date,
+            'search_time': self.search_time,
+            'rank': self.rank,
+            'place_id': self.place_id,
+            'place_name': self.place_name,
+            'category': self.category
+        }
+
+    def to_daily_row(self, restaurant_id, extra=None):
+        """daily_rankings 테이블 행 (adlog_restaurants id 연결)"""
+        row = {
+            'search_date': self.search_date,
+            'search_time': self.search_time,
+            'search_keyword': self.search_keyword,
+            'restaurant_id': restaurant_id,
+            'rank': self.rank,
+            'blog_count': self.blog_count,
+            'visitor_review_count': self.visitor_review_count
+        }
+        if extra:
+            row.update(extra)
+        return row
+
+
+class Restaurant(_Record):
+    """식당 목록 한 줄"""
+
+    __slots__ = ('place_id', 'place_name', 'place_url', 'category', 'address',
+                 'blog_count', 'visitor_review_count', 'n1_score', 'n2_score', 'n3_score',
+                 'collected_at')
+
+    def __init__(self, place_id, place_name, place_url=None, category='', address='',
+                 blog_count=0, visitor_review_count=0, n1_score=None, n2_score=None, n3_score=None,
+                 collected_at=None):
+        if not place_id:
+            raise ValidationError("place_id가 비어 있습니다")
+        if not place_name:
+            raise ValidationError("place_name이 비어 있습니다")
+
+        self.place_id = str(place_id)
+        self.place_name = place_name
+        self.place_url = place_url or f"https://m.place.naver.com/restaurant/{self.place_id}"
+        self.category = category or ''
+        self.address = address or ''
+        self.blog_count = _to_int(blog_count, 'blog_count')
+        self.visitor_review_count = _to_int(visitor_review_count, 'visitor_review_count')
+        self.n1_score = n1_score
+        self.n2_score = n2_score
+        self.n3_score = n3_score
+        self.collected_at = collected_at or datetime.now().isoformat()
+
+    def to_db_row(self, updated_at=None):
+        """adlog_restaurants 테이블 행"""
+        return {
+            'place_id': self.place_id,
+            'place_name': self.place_name,
+            'category': self.category,
+            'address': self.address,
+            'place_url': self.place_url,
+            'is_active': True,
+            'updated_at': updated_at or datetime.now().isoformat()
+        }
+
+
+def as_dict(row):
+    """레코드면 dict로, dict면 그대로"""
+    return row.to_dict() if isinstance(row, _Record) else row
+
+
+def as_dicts(rows):
+    """레코드 / dict 섞인 리스트를 dict 리스트로 (JSON / CSV 저장용)"""
+    return [as_dict(row) for row in rows]
+
+
+def to_arrow(rows, model=RankingRow):
+    """
+    레코드 리스트를 Arrow RecordBatch로 변환 (행 dict를 만들지 않고 열 단위로 수집)
+
+    Raises:
+        ImportError: pyarrow가 없을 때
+    """
+    if pa is None:
+        raise ImportError("Arrow 변환에는 pyarrow가 필요합니다 (pip install pyarrow)")
+
+    columns = {name: [getattr(row, name) for row in rows] for name in model.__slots__}
+    return pa.RecordBatch.from_pydict(columns)
@@ -0,0 +1,157 @@
+"""
+식당 이름 매칭 인덱스
+하루치 순위 결과를 한 번 인덱싱해 두고 여러 식당을 한 번에 찾기
+(식당마다 전체 순위를 훑는 부분 문자열 검사 / DB ilike '%이름%' 대신 사용)
+
+- place_id를 알면 place_id 일치가 우선
+- 이름은 정규화(NFC, 소문자, 공백/기호 제거) 후 2-gram 역색인으로 후보를 좁히고 부분 일치 확인
+- "BBQ치킨 강남점" / "BBQ치킨(강남점)" / "BBQ치킨강남점" 같은 지점명 변형을 같은 식당으로 봄
+  (양쪽 다 지점이 있고 서로 다르면 다른 식당)
+"""
+
+import re
+import unicodedata
+
+from keyword_registry import registry
+
+# 공백/괄호로 떨어진 지점명 (예: "BBQ치킨 강남점", "BBQ치킨 (강남역점)")
+BRANCH_SEPARATED_PATTERN = re.compile(r'[\s(\[]+([가-힣A-Za-z0-9]{1,12}점)[)\]]?\s*$')
+NON_WORD_PATTERN = re.compile(r'[\W_]+')
+
+
+def _compact(text):
+    text = unicodedata.normalize('NFC', text or '').lower()
+    return NON_WORD_PATTERN.sub('', text)
+
+
+def split_branch(name):
+    """
+    식당 이름을 (본 이름, 지점명)으로 분리
+
+    Returns:
+        (정규화된 본 이름, 정규화된 지점명 또는 None)
+    """
+    name = unicodedata.normalize('NFC', name or '').strip()
+
+    match = BRANCH_SEPARATED_PATTERN.search(name)
+    if match and match.start() > 0:
+        return _compact(name[:match.start()]), _compact(match.group(1))
+
+    # 붙어 있는 지점명 (예: "BBQ치킨강남점") - 점 앞이 지역 사전에 있을 때만 분리 (긴 지역 우선)
+    compact = _compact(name)
+    if compact.endswith('점'):
+        if compact.endswith('본점') and len(compact) > 2:
+            return compact[:-2], '본점'
+        for size in range(min(6, len(compact) - 2), 1, -1):
+            start = len(compact) - 1 - size
+            place = compact[start:-1]
+            if place in registry.locations or (place.endswith('역') and place[:-1] in registry.locations):
+                return compact[:start], compact[start:]
+
+    return compact, None
+
+
+def _bigrams(text):
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class NameIndex:
+    def __init__(self, rankings=()):
+        """
+        초기화
+
+        Args:
+            rankings: 순위 항목 리스트 (RankingRow 또는 place_name/place_id가 있는 dict)
+        """
+        self.rankings = []
+        self._names = []     # 순위 항목별 (정규화 전체 이름, 본 이름, 지점명)
+        self._by_gram = {}   # 2-gram -> 순위 항목 번호 집합
+        self._by_place_id = {}
+
+        for ranking in rankings:
+            self.add(ranking)
+
+    def __len__(self):
+        return len(self.rankings)
+
+    def add(self, ranking):
+        """순위 항목 하나 추가"""
+        index = len(self.rankings)
+        self.rankings.append(ranking)
+
+        place_name = ranking.get('place_name') or ''
+        base, branch = split_branch(place_name)
+        self._names.append((_compact(place_name), base, branch))
+
+        for gram in _bigrams(self._names[index][0]):
+            self._by_gram.setdefault(gram, set()).add(index)
+
+        place_id = ranking.get('place_id')
+        if place_id:
+            self._by_place_id.setdefault(str(place_id), []).append(index)
+
+    def _candidates(self, text):
+        grams = _bigrams(text)
+        if not grams:
+            # 한 글자 이름은 색인으로 좁힐 수 없음
+            return range(len(self.rankings))
+
+        # 가장 드문 2-gram부터 교집합
+        postings = sorted((self._by_gram.get(gram, set()) for gram in grams), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates &= posting
+        return sorted(candidates)
+
+    def match(self, name=None, place_id=None):
+        """
+        식당 하나의 순위 항목 찾기
+
+        Args:
+            name: 식당 이름 (지점명 포함 가능)
+            place_id: 네이버 플레이스 ID (있으면 우선)
+
+        Returns:
+            일치하는 순위 항목 리스트 (입력 순서 유지)
+        """
+        if place_id and str(place_id) in self._by_place_id:
+            return [self.rankings[i] for i in self._by_place_id[str(place_id)]]
+
+        if not name:
+            return []
+
+        base, branch = split_branch(name)
+        if not base:
+            return []
+
+        matches = []
+        for i in self._candidates(base):
+            full, _, other_branch = self._names[i]
+            if base not in full:
+                continue
+            # 둘 다 지점이 있는데 다르면 다른 식당 (예: 강남점 vs 역삼점)
+            if branch and other_branch and branch != other_branch:
+                continue
+            matches.append(self.rankings[i])
+        return matches
+
+    def match_many(self, restaurants):
+        """
+        여러 식당을 한 번에 매칭
+
+        Args:
+            restaurants: 식당 이름 문자열 또는 {'name', 'place_id'} dict 리스트
+
+        Returns:
+            {식당 이름: 순위 항목 리스트}
+        """
+        results = {}
+        for restaurant in restaurants:
+            if isinstance(restaurant, str):
+                name, place_id = restaurant, None
+            else:
+                name, place_id = restaurant.get('name'), restaurant.get('place_id')
+            results[name] = self.match(name, place_id)
+        return results
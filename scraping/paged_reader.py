@@ -0,0 +1,99 @@
+"""
+Supabase 대용량 테이블 페이지 조회 유틸리티
+키셋 페이지네이션 + 컬럼 지정으로 API 행 제한에 잘리지 않고 일정한 메모리로 읽기
+"""
+
+DEFAULT_PAGE_SIZE = 1000  # PostgREST 기본 max-rows와 동일
+
+
+def _apply_filters(query, filters):
+    """
+    필터 적용
+
+    Args:
+        filters: (연산자, 컬럼, 값) 튜플 리스트 (예: [('eq', 'search_date', '2025-11-02')])
+    """
+    for op, column, value in filters or []:
+        query = getattr(query, op)(column, value)
+    return query
+
+
+def iter_pages(client, table, columns='*', key='id', filters=None, page_size=DEFAULT_PAGE_SIZE):
+    """
+    테이블을 키셋 페이지네이션으로 조회하며 페이지(행 리스트) 단위로 반환
+
+    OFFSET 대신 'key > 마지막 값' 조건을 사용하므로 뒤쪽 페이지도 인덱스로 바로 찾음
+
+    Args:
+        client: Supabase 클라이언트
+        table: 테이블 이름
+        columns: 조회 컬럼 (문자열 또는 튜플/리스트), key 컬럼은 자동 포함
+        key: 정렬/페이지 기준 컬럼 (유니크 + 인덱스 필요)
+        filters: (연산자, 컬럼, 값) 튜플 리스트
+        page_size: 페이지 크기
+    """
+    if isinstance(columns, (list, tuple)):
+        columns = list(columns)
+        if key not in columns:
+            columns.append(key)
+        select = ','.join(columns)
+    else:
+        select = columns
+        if select.strip() != '*' and key not in [c.strip() for c in select.split(',')]:
+            select = f"{select},{key}"
+
+    last_key = None
+
+    while True:
+        query = client.table(table).select(select)
+        query = _apply_filters(query, filters)
+        if last_key is not None:
+            query = query.gt(key, last_key)
+
+        rows = query.order(key).limit(page_size).execute().data or []
+        if not rows:
+            break
+
+        yield rows
+
+        if len(rows) < page_size:
+            break
+        last_key = rows[-1][key]
+
+
+def iter_rows(client, table, columns='*', key='id', filters=None, page_size=DEFAULT_PAGE_SIZE):
+    """iter_pages와 같지만 한 행씩 반환"""
+    for page in iter_pages(client, table, columns, key, filters, page_size):
+        yield from page
+
+
+def fetch_map(client, table, key_column, value_column='id', filters=None, page_size=DEFAULT_PAGE_SIZE):
+    """
+    두 컬럼만 읽어 {key_column 값: value_column 값} 딕셔너리 생성
+    (예: place_id -> restaurant id 매핑을 한 번에 구할 때)
+    """
+    mapping = {}
+    for row in iter_rows(client, table, (value_column, key_column), key=value_column,
+                         filters=filters, page_size=page_size):
+        if row.get(key_column) is not None:
+            mapping[row[key_column]] = row[value_column]
+    return mapping
+
+
+def estimate_count(client, table, filters=None, method='planned', key='id'):
+    """
+    행 수 추정 (전체 COUNT 없이 플래너 통계 사용)
+
+    Args:
+        method: 'planned' (EXPLAIN 추정) 또는 'estimated' (작으면 정확, 크면 추정)
+
+    Returns:
+        추정 행 수 (조회 실패 시 None)
+    """
+    try:
+        query = client.table(table).select(key, count=method)
+        query = _apply_filters(query, filters)
+        return query.limit(1).execute().count
+    except Exception as e:
+        print(f"⚠️ {table} 행 수 추정 실패: {str(e)}")
+        return None
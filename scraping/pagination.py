@@ -0,0 +1,160 @@
+"""
+URL로 바로 열 수 있는 페이지네이션
+다음 페이지 링크의 주소에서 페이지 번호 위치(쿼리 파라미터 또는 경로)를 한 번 알아낸 뒤,
+로그인된 브라우저 세션 쿠키로 2..N 페이지를 동시에 요청
+(링크가 javascript: / # 이거나 요청이 실패하면 호출하는 쪽에서 클릭 방식으로 대체)
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+
+from block_detector import classify_response, has_place_links, BLOCKED, LOGIN
+
+DEFAULT_WORKERS = int(os.getenv('ADLOG_PAGE_WORKERS', '4'))
+
+# arguments: 없음 / 반환: 페이지네이션에 보이는 가장 큰 페이지 번호 (없으면 0)
+LAST_PAGE_JS = """
+let last = 0;
+const links = document.querySelectorAll(
+    'a.page-link, button.page-link, .pagination a, .paging a, .page-navigation a');
+for (const el of links) {
+    const n = parseInt((el.textContent || '').trim(), 10);
+    if (!isNaN(n) && n > last) last = n;
+}
+return last;
+"""
+
+
+class PageUrlPattern:
+    """페이지 번호만 바꿔 끼우는 URL 틀"""
+
+    def __init__(self, url, param=None, path_index=None):
+        """
+        Args:
+            url: 예시 URL (다음 페이지 링크)
+            param: 페이지 번호가 들어 있는 쿼리 파라미터 이름
+            path_index: 페이지 번호가 들어 있는 경로 조각 위치 (param이 없을 때)
+        """
+        self.parts = urlsplit(url)
+        self.param = param
+        self.path_index = path_index
+
+    def __repr__(self):
+        where = f"?{self.param}=" if self.param else f"path[{self.path_index}]"
+        return f"PageUrlPattern({self.parts.netloc}{self.parts.path} {where})"
+
+    @classmethod
+    def discover(cls, href, page_num):
+        """
+        다음 페이지 링크 주소에서 페이지 번호 위치 찾기
+
+        Args:
+            href: 다음 페이지 링크의 절대 URL
+            page_num: 그 링크가 가리키는 페이지 번호
+
+        Returns:
+            PageUrlPattern 또는 None (주소로 열 수 없는 링크)
+        """
+        if not href or not href.startswith(('http://', 'https://')):
+            return None
+
+        target = str(page_num)
+        parts = urlsplit(href)
+
+        for name, value in parse_qsl(parts.query, keep_blank_values=True):
+            if value == target:
+                return cls(href, param=name)
+
+        segments = parts.path.split('/')
+        for index in range(len(segments) - 1, -1, -1):
+            if segments[index] == target:
+                return cls(href, path_index=index)
+
+        return None
+
+    def url(self, page_num):
+        """페이지 번호의 URL"""
+        if self.param:
+            query = [
+                (name, str(page_num) if name == self.param else value)
+                for name, value in parse_qsl(self.parts.query, keep_blank_values=True)
+            ]
+            return urlunsplit(self.parts._replace(query=urlencode(query)))
+
+        segments = self.parts.path.split('/')
+        segments[self.path_index] = str(page_num)
+        return urlunsplit(self.parts._replace(path='/'.join(segments)))
+
+
+def last_page_number(driver):
+    """페이지네이션에 보이는 마지막 페이지 번호 (모르면 0)"""
+    try:
+        return int(driver.execute_script(LAST_PAGE_JS) or 0)
+    except Exception:
+        return 0
+
+
+def session_from_driver(driver):
+    """브라우저의 로그인 쿠키 / User-Agent를 그대로 쓰는 requests 세션"""
+    session = requests.Session()
+    for cookie in driver.get_cookies():
+        session.cookies.set(cookie['name'], cookie['value'],
+                            domain=cookie.get('domain'), path=cookie.get('path', '/'))
+
+    try:
+        user_agent = driver.execute_script("return navigator.userAgent;")
+    except Exception:
+        user_agent = None
+    if user_agent:
+        session.headers['User-Agent'] = user_agent
+    session.headers['Referer'] = driver.current_url
+    return session
+
+
+class PageFetchError(RuntimeError):
+    """세션으로 페이지를 받지 못함 (로그인 만료 / 차단 / HTTP 오류)"""
+
+
+def fetch_pages(session, pattern, pages, workers=DEFAULT_WORKERS, timeout=20, metrics=None):
+    """
+    여러 페이지를 동시에 요청
+
+    Args:
+        session: 로그인 쿠키가 있는 requests 세션
+        pattern: PageUrlPattern
+        pages: 페이지 번호 리스트
+        workers: 동시 요청 수
+        metrics: 실행 계측 객체 (page_fetch 단계 / page_fetches 카운터)
+
+    Returns:
+        페이지 번호 순서의 HTML 리스트
+
+    Raises:
+        PageFetchError: 한 페이지라도 실패하면 (호출하는 쪽에서 클릭 방식으로 대체)
+    """
+    def fetch(page_num):
+        started = time.perf_counter()
+        response = session.get(pattern.url(page_num), timeout=timeout)
+        if metrics:
+            metrics.record('page_fetch', time.perf_counter() - started)
+            metrics.incr('page_fetches')
+
+        if response.status_code != 200:
+            raise PageFetchError(f"{page_num}페이지 HTTP {response.status_code}")
+        html = response.text
+        if classify_response(response.status_code, html, response.url, has_place_links(html)) in (BLOCKED, LOGIN):
+            raise PageFetchError(f"{page_num}페이지가 로그인/차단 화면으로 응답")
+        return html
+
+    if not pages:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pages)))) as executor:
+        try:
+            return list(executor.map(fetch, pages))
+        except requests.RequestException as e:
+            raise PageFetchError(str(e))
@@ -0,0 +1,255 @@
+"""
+단일 식당 실시간 순위 확인 (로컬 HTTP 서비스 / CLI)
+배치 작업을 기다리지 않고 "지금 강남 치킨에서 몇 위?"를 바로 확인
+
+- 같은 키워드를 동시에 요청하면 스크래핑은 한 번만 하고 결과를 함께 사용
+- 결과는 키워드별 TTL 캐시에 보관 (유효 시간 안의 반복 요청은 스크래핑 없음)
+
+사용법:
+    python scraping/rank_check_service.py check "강남 치킨" --place "BBQ치킨"
+    python scraping/rank_check_service.py serve --port 8765
+    curl "http://127.0.0.1:8765/rank?keyword=강남%20치킨&place=BBQ치킨"
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import threading
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from adlog_login_scraper import AdlogLoginScraper
+from report_cache import ReportCache
+from run_metrics import RunMetrics
+from models import as_dicts
+from keyword_registry import parse_keyword
+
+DEFAULT_TTL = int(os.getenv('ADLOG_RANK_CHECK_TTL', '300'))
+DEFAULT_PORT = 8765
+
+PLACE_ID_PATTERN = re.compile(r'/(?:restaurant|place)/(\d+)')
+
+
+class RankCheckError(RuntimeError):
+    """순위를 가져오지 못함 (로그인 실패 / 결과 없음)"""
+
+
+def find_place(rankings, place_name=None, place_url=None):
+    """
+    순위 목록에서 내 식당 찾기
+
+    Args:
+        place_name: 식당 이름 (부분 일치)
+        place_url: 네이버 플레이스 URL (place_id 일치 우선)
+
+    Returns:
+        순위 항목 또는 None
+    """
+    place_id = None
+    if place_url:
+        match = PLACE_ID_PATTERN.search(place_url)
+        place_id = match.group(1) if match else None
+
+    if place_id:
+        for ranking in rankings:
+            if str(ranking.get('place_id')) == place_id:
+                return ranking
+
+    if place_name:
+        needle = place_name.replace(' ', '')
+        for ranking in rankings:
+            if needle in (ranking.get('place_name') or '').replace(' ', ''):
+                return ranking
+
+    return None
+
+
+class RankCheckService:
+    def __init__(self, ttl=DEFAULT_TTL, pool=None, headless=True, metrics=None):
+        """
+        초기화
+
+        Args:
+            ttl: 키워드별 결과 유효 시간 (초)
+            pool: 드라이버 풀 (있으면 로그인된 드라이버를 빌려 씀, 없으면 브라우저 1개를 계속 사용)
+            headless: 헤드리스 실행 여부 (pool이 없을 때)
+            metrics: 실행 계측 객체
+        """
+        self.ttl = ttl
+        self.pool = pool
+        self.metrics = metrics or RunMetrics('rank_check_service')
+        self.cache = ReportCache(max_entries=512, default_ttl=ttl)
+
+        # 브라우저 1개는 동시에 한 검색만 가능
+        self._scraper = None if pool else AdlogLoginScraper(headless=headless, metrics=self.metrics)
+        self._scrape_lock = threading.Lock()
+
+    def _scrape(self, keyword):
+        """키워드 검색 결과 스크래핑 (캐시 미스일 때만 호출)"""
+        self.metrics.incr('rank_check_scrapes')
+
+        with self.metrics.timer('rank_check_scrape'):
+            if self.pool:
+                scraper = AdlogLoginScraper(headless=True, metrics=self.metrics)
+                with self.pool.acquire(self.metrics) as driver:
+                    scraper.attach_driver(driver)
+                    rankings = scraper.search_with_limit(scraper.search_place_ranking, keyword)
+                    scraper.close()
+            else:
+                with self._scrape_lock:
+                    rankings = self._scraper.search_with_limit(self._scraper.search_place_ranking, keyword)
+
+        # 빈 결과는 캐시하지 않음 (로그인 만료 / 일시 오류일 수 있음)
+        if not rankings:
+            raise RankCheckError(f"'{keyword}' 검색 결과를 가져오지 못했습니다")
+
+        return {'rankings': as_dicts(rankings), 'checked_at': datetime.now().isoformat()}
+
+    def check(self, keyword, place_name=None, place_url=None):
+        """
+        키워드 순위 확인 (TTL 안이면 캐시 결과)
+
+        place_url은 검색 조건이 아니라 결과에서 식당을 찾는 데만 사용
+        (같은 키워드의 다른 식당 요청도 캐시를 함께 씀)
+
+        Returns:
+            {'keyword', 'checked_at', 'cached', 'my_rank', 'rankings'}
+        """
+        if not (keyword or '').strip():
+            raise ValueError("keyword가 필요합니다")
+        parsed = parse_keyword(keyword)
+        keyword = parsed.query
+
+        scraped = []
+
+        def load():
+            scraped.append(True)
+            return self._scrape(keyword)
+
+        result = self.cache.get_or_load(('rank_check', parsed.id), load)
+
+        self.metrics.incr('rank_check_requests')
+        return {
+            'keyword': keyword,
+            'checked_at': result['checked_at'],
+            'cached': not scraped,  # 캐시 적중 또는 다른 요청의 스크래핑 결과를 함께 받음
+            'my_rank': find_place(result['rankings'], place_name, place_url),
+            'rankings': result['rankings']
+        }
+
+    def close(self):
+        if self._scraper:
+            self._scraper.close()
+
+
+class RankCheckHandler(BaseHTTPRequestHandler):
+    """GET /rank?keyword=...&place=...&place_url=... / GET /health"""
+
+    service = None
+
+    def _send_json(self, status, body):
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+
+        if url.path == '/health':
+            self._send_json(200, {'status': 'ok', 'cache': self.service.cache.stats()})
+            return
+
+        if url.path != '/rank':
+            self._send_json(404, {'error': 'not found'})
+            return
+
+        try:
+            result = self.service.check(
+                params.get('keyword', ''),
+                place_name=params.get('place'),
+                place_url=params.get('place_url')
+            )
+            if params.get('full') != '1':
+                result.pop('rankings')
+            self._send_json(200, result)
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+        except RankCheckError as e:
+            self._send_json(502, {'error': str(e)})
+        except Exception as e:
+            self._send_json(500, {'error': str(e)})
+
+    def log_message(self, format, *args):
+        print(f"🌐 {self.address_string()} {format % args}")
+
+
+def serve(host='127.0.0.1', port=DEFAULT_PORT, ttl=DEFAULT_TTL):
+    """HTTP 서비스 실행 (Ctrl+C로 종료)"""
+    service = RankCheckService(ttl=ttl)
+    RankCheckHandler.service = service
+    server = ThreadingHTTPServer((host, port), RankCheckHandler)
+
+    print(f"🚀 순위 확인 서비스: http://{host}:{port}/rank?keyword=강남 치킨&place=식당이름")
+    print(f"  • 키워드별 캐시 {ttl}초")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        service.metrics.finish()
+
+
+def print_result(result, place_name=None):
+    print(f"\n🔍 {result['keyword']} ({result['checked_at'][:19]}{', 캐시' if result['cached'] else ''})")
+    my_rank = result['my_rank']
+    if my_rank:
+        print(f"🎯 {my_rank['place_name']}: {my_rank['rank']}위")
+    elif place_name:
+        print(f"😢 '{place_name}'은(는) 상위 {len(result['rankings'])}위 안에 없습니다")
+    for ranking in result['rankings']:
+        print(f"  {ranking['rank']}위: {ranking['place_name']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ADLOG 실시간 순위 확인")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = sub.add_parser('serve', help="로컬 HTTP 서비스 실행")
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    serve_parser.add_argument('--ttl', type=int, default=DEFAULT_TTL, help="키워드별 캐시 시간 (초)")
+
+    check_parser = sub.add_parser('check', help="한 번 확인하고 종료")
+    check_parser.add_argument('keyword')
+    check_parser.add_argument('--place', help="식당 이름")
+    check_parser.add_argument('--place-url', help="네이버 플레이스 URL")
+
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        serve(args.host, args.port, args.ttl)
+        return
+
+    service = RankCheckService()
+    try:
+        print_result(service.check(args.keyword, args.place, args.place_url), args.place)
+    except RankCheckError as e:
+        print(f"❌ {str(e)}")
+        sys.exit(1)
+    finally:
+        service.close()
+        service.metrics.finish()
+
+
+if __name__ == "__main__":
+    main()
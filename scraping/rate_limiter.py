@@ -0,0 +1,184 @@
+"""
+ADLOG 요청 간격 조절 (적응형 토큰 버킷)
+모듈마다 따로 있던 고정 sleep 대신, 응답이 빠르고 정상이면 간격을 조금씩 줄이고
+느려지거나 오류/캡차가 나오면 크게 늘림 (AIMD)
+상태는 파일 잠금 + JSON으로 공유해 스레드/프로세스(스케줄러, 수동 실행 등)가 같은 속도를 지킴
+"""
+
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DEFAULT_STATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+# 차단/캡차 페이지에 나오는 문구
+BLOCK_MARKERS = ['captcha', '자동입력', '비정상적인 접근', '접근이 제한', 'too many requests']
+
+
+def looks_blocked(text):
+    """페이지 텍스트가 차단/캡차 화면인지"""
+    text = (text or '').lower()
+    return any(marker in text for marker in BLOCK_MARKERS)
+
+
+@contextmanager
+def _file_lock(path):
+    """프로세스 간 배타 잠금"""
+    with open(path, 'a+b') as f:
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class AdaptiveRateLimiter:
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, name='adlog', initial_interval=3.0, min_interval=1.0, max_interval=60.0,
+                 target_latency=5.0, burst=1, state_dir=None):
+        """
+        초기화
+
+        Args:
+            name: 공유 이름 (같은 이름이면 같은 상태 파일 사용)
+            initial_interval: 처음 요청 간격 (초)
+            min_interval / max_interval: 간격 하한 / 상한 (초)
+            target_latency: 이보다 느린 응답은 부하 신호로 보고 간격을 늘림 (초)
+            burst: 쉬었다가 연속으로 보낼 수 있는 요청 수
+            state_dir: 상태 파일 폴더 (None이면 ADLOG_RATE_LIMIT_DIR 또는 scraping/data)
+        """
+        self.name = name
+        self.initial_interval = initial_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_latency = target_latency
+        self.burst = burst
+
+        state_dir = state_dir or os.getenv('ADLOG_RATE_LIMIT_DIR') or DEFAULT_STATE_DIR
+        os.makedirs(state_dir, exist_ok=True)
+        self.state_path = os.path.join(state_dir, f"rate_limit_{name}.json")
+        self.lock_path = self.state_path + '.lock'
+        self._thread_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, name='adlog', **kwargs):
+        """프로세스 안에서 이름별로 하나만 생성해 공유"""
+        with cls._shared_lock:
+            if name not in cls._shared:
+                cls._shared[name] = cls(name, **kwargs)
+            return cls._shared[name]
+
+    @contextmanager
+    def _locked_state(self):
+        """잠금 상태에서 공유 상태 읽기/쓰기"""
+        with self._thread_lock, _file_lock(self.lock_path):
+            try:
+                with open(self.state_path, encoding='utf-8') as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                state = {}
+
+            state.setdefault('interval', self.initial_interval)
+            state.setdefault('tokens', float(self.burst))
+            state.setdefault('updated_at', time.time())
+
+            yield state
+
+            tmp_path = self.state_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)
+
+    @property
+    def interval(self):
+        """현재 요청 간격 (초)"""
+        with self._locked_state() as state:
+            return state['interval']
+
+    def reserve(self):
+        """
+        요청 1회분 토큰 예약
+
+        Returns:
+            요청 전에 기다려야 하는 시간 (초)
+        """
+        with self._locked_state() as state:
+            now = time.time()
+            interval = state['interval']
+            refill = (now - state['updated_at']) / interval
+            tokens = min(float(self.burst), state['tokens'] + refill)
+
+            # 부족하면 미리 빼 두고 (음수) 채워질 때까지 기다림 → 여러 프로세스가 순서대로 대기
+            tokens -= 1
+            state['tokens'] = tokens
+            state['updated_at'] = now
+
+        return max(0.0, -tokens * interval)
+
+    def wait(self, metrics=None):
+        """다음 요청 가능 시점까지 대기 (metrics가 있으면 rate_limit_wait로 기록)"""
+        delay = self.reserve()
+        if delay <= 0:
+            return 0.0
+
+        if metrics:
+            metrics.sleep(delay, stage='rate_limit_wait')
+        else:
+            time.sleep(delay)
+        return delay
+
+    def record(self, latency=None, ok=True, blocked=False):
+        """
+        요청 결과 반영 (AIMD)
+
+        Args:
+            latency: 응답 시간 (초)
+            ok: 정상 응답 여부
+            blocked: 차단/캡차/429 응답 여부
+        """
+        with self._locked_state() as state:
+            interval = state['interval']
+
+            if blocked:
+                interval *= 2.0
+                # 쌓인 토큰도 버려 바로 쉬게 함
+                state['tokens'] = min(state['tokens'], 0.0)
+            elif not ok:
+                interval *= 1.5
+            elif latency is not None and latency > self.target_latency:
+                interval *= 1.25
+            else:
+                interval -= 0.1  # 정상이면 조금씩 빠르게
+
+            state['interval'] = round(min(self.max_interval, max(self.min_interval, interval)), 3)
+            state['last_result'] = 'blocked' if blocked else ('ok' if ok else 'error')
+
+        if blocked:
+            print(f"🐢 차단 응답 감지 - 요청 간격 {state['interval']:.1f}초로 늘림")
+
+        return state['interval']
+
+    def reset(self):
+        """상태 초기화"""
+        with self._locked_state() as state:
+            state.clear()
+            state.update({'interval': self.initial_interval, 'tokens': float(self.burst),
+                          'updated_at': time.time()})
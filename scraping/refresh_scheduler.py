@@ -0,0 +1,254 @@
+"""
+키워드별 변동성 기반 갱신 스케줄러
+모든 키워드를 06:00 / 18:00에 똑같이 다시 검색하는 대신,
+지난 순위 기록(place_rankings / daily_rankings)에서 키워드마다
+- 변동성: 연속한 두 수집 사이에 순위표 자리가 바뀐 비율
+- 회원 수: 순위에 나온 우리 회원 식당 수
+를 구해 자주 바뀌고 회원이 많은 키워드는 자주, 안정적인 키워드는 드물게 갱신
+(하루 전체 요청 예산 안에서 배분 → 같은 요청 수로 더 많은 순위 변동을 발견)
+"""
+
+import math
+from datetime import datetime, timedelta
+
+from keyword_registry import make_keyword
+from paged_reader import iter_rows
+
+# 기록이 없는 키워드는 꽤 자주 바뀌는 키워드로 가정 (처음 며칠은 자주 확인)
+PRIOR_VOLATILITY = 0.5
+PRIOR_WEIGHT = 1
+
+
+class KeywordStats:
+    """키워드 하나의 수집 기록 요약"""
+
+    __slots__ = ('keyword', 'comparisons', 'changed', 'members', 'last_refreshed', 'last_top')
+
+    def __init__(self, keyword):
+        self.keyword = keyword
+        self.comparisons = 0   # 비교한 연속 수집 쌍 수
+        self.changed = 0.0     # 쌍마다 바뀐 자리 비율의 합
+        self.members = set()   # 이 키워드 순위에 나온 회원 식당
+        self.last_refreshed = None
+        self.last_top = {}     # 기록 종류 -> 마지막 수집의 순위 순서 식당 키
+
+    @property
+    def volatility(self):
+        """평균 변동 비율 (0~1, 기록이 적으면 PRIOR_VOLATILITY 쪽으로)"""
+        return (self.changed + PRIOR_VOLATILITY * PRIOR_WEIGHT) / (self.comparisons + PRIOR_WEIGHT)
+
+    @property
+    def score(self):
+        """갱신 우선순위 (변동성 x 회원 가중치)"""
+        return self.volatility * (1 + len(self.members))
+
+    def observe(self, when, top, member_keys=(), source='place'):
+        """
+        수집 결과 하나 반영 (종류별로 시간 순서대로 호출)
+
+        Args:
+            when: 수집 시각 (datetime)
+            top: 순위 순서의 식당 키 리스트
+            member_keys: 회원 식당 키 집합
+            source: 기록 종류 ('place' = place_rankings의 place_id, 'daily' = daily_rankings의 restaurant_id)
+        """
+        top = tuple(top)
+        last = self.last_top.get(source)
+        if last is not None and (top or last):
+            size = max(len(top), len(last))
+            moved = sum(1 for i in range(size) if i >= len(top) or i >= len(last) or top[i] != last[i])
+            self.comparisons += 1
+            self.changed += moved / size
+
+        self.members.update(key for key in top if key in member_keys)
+        self.last_top[source] = top
+        if self.last_refreshed is None or when > self.last_refreshed:
+            self.last_refreshed = when
+
+
+def _snapshot_time(row):
+    moment = f"{row['search_date']} {(row.get('search_time') or '00:00:00')[:8]}"
+    return datetime.strptime(moment, '%Y-%m-%d %H:%M:%S')
+
+
+class RefreshScheduler:
+    def __init__(self, keywords, budget=None, min_per_day=1, max_per_day=12):
+        """
+        초기화
+
+        Args:
+            keywords: 갱신할 Keyword 리스트
+            budget: 하루 전체 검색 요청 예산 (None이면 키워드 수 x 2, 기존 하루 두 번과 같은 양)
+            min_per_day: 키워드당 최소 하루 갱신 횟수 (예산이 모자라면 모두 같은 비율로 줄임)
+            max_per_day: 키워드당 최대 하루 갱신 횟수
+        """
+        self.keywords = list(keywords)
+        self.budget = budget if budget is not None else len(self.keywords) * 2
+        self.min_per_day = min_per_day
+        self.max_per_day = max_per_day
+        self.member_keys = set()
+        self.stats = {keyword.id: KeywordStats(keyword) for keyword in self.keywords}
+
+        self._day = None
+        self._used_today = 0
+
+    @classmethod
+    def from_history(cls, client, keywords, days=14, **kwargs):
+        """
+        지난 순위 기록으로 키워드별 통계를 채운 스케줄러
+
+        Args:
+            client: Supabase 클라이언트 (None이면 기록 없이 시작)
+            keywords: 갱신할 Keyword 리스트
+            days: 읽을 기록 기간 (일)
+        """
+        scheduler = cls(keywords, **kwargs)
+        if client:
+            try:
+                scheduler.load_history(client, days)
+            except Exception as e:
+                print(f"⚠️ 순위 기록 조회 실패, 기록 없이 시작: {str(e)}")
+        return scheduler
+
+    def load_history(self, client, days=14):
+        """place_rankings(공개 순위) / daily_rankings(회원 순위) 최근 기록 반영"""
+        since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        filters = [('gte', 'search_date', since)]
+
+        # 회원 식당 (daily_rankings는 restaurant_id, place_rankings는 place_id로 나옴)
+        for row in iter_rows(client, 'adlog_restaurants', ('id', 'place_id'),
+                             filters=[('eq', 'is_our_member', True)]):
+            self.member_keys.update(str(value) for value in (row.get('id'), row.get('place_id')) if value)
+
+        snapshots = {}  # (키워드 id, 기록 종류, 수집 시각) -> [(순위, 식당 키)]
+        for row in iter_rows(client, 'place_rankings',
+                             ('search_keyword', 'search_location', 'search_date', 'search_time', 'rank', 'place_id'),
+                             filters=filters):
+            keyword = make_keyword(row['search_keyword'], row.get('search_location'))
+            if keyword.id in self.stats:
+                snapshots.setdefault((keyword.id, 'place', _snapshot_time(row)), []).append(
+                    (row.get('rank') or 0, str(row.get('place_id') or '')))
+
+        for row in iter_rows(client, 'daily_rankings',
+                             ('search_keyword', 'search_date', 'search_time', 'rank', 'restaurant_id'),
+                             filters=filters):
+            keyword = make_keyword(row['search_keyword'])
+            if keyword.id in self.stats and row.get('rank') is not None:
+                # daily_rankings는 키워드+날짜당 식당별 한 행 (시각은 날짜 단위로 묶음)
+                snapshots.setdefault((keyword.id, 'daily', _snapshot_time({'search_date': row['search_date']})),
+                                     []).append((row['rank'], str(row.get('restaurant_id') or '')))
+
+        for (keyword_id, source, when), entries in sorted(snapshots.items(), key=lambda item: item[0][2]):
+            entries.sort()
+            self.stats[keyword_id].observe(when, [key for _, key in entries], self.member_keys, source)
+
+    def refreshes_per_day(self):
+        """
+        키워드별 하루 갱신 횟수 배분 (예산 안에서 우선순위에 비례)
+
+        Returns:
+            {키워드 id: 하루 갱신 횟수 (소수 가능)}
+        """
+        if not self.keywords:
+            return {}
+
+        count = len(self.keywords)
+        if self.budget <= count * self.min_per_day:
+            # 최소 횟수도 못 채우면 모두 같은 간격으로
+            return {keyword.id: self.budget / count for keyword in self.keywords}
+
+        rates = {keyword.id: float(self.min_per_day) for keyword in self.keywords}
+        remaining = self.budget - count * self.min_per_day
+        open_ids = set(rates)
+
+        # 상한에 걸린 키워드를 빼며 남은 예산을 점수 비율로 나눔
+        while remaining > 1e-9 and open_ids:
+            total = sum(self.stats[keyword_id].score for keyword_id in open_ids) or len(open_ids)
+            capped = set()
+            spent = 0.0
+            for keyword_id in open_ids:
+                share = remaining * (self.stats[keyword_id].score or 1) / total
+                room = self.max_per_day - rates[keyword_id]
+                if share >= room:
+                    share = room
+                    capped.add(keyword_id)
+                rates[keyword_id] += share
+                spent += share
+            remaining -= spent
+            if not capped:
+                break
+            open_ids -= capped
+
+        return rates
+
+    def due(self, now=None, limit=None):
+        """
+        지금 갱신할 키워드 (간격이 지난 것 중 우선순위 순, 하루 예산 이내)
+
+        Args:
+            now: 기준 시각 (None이면 현재)
+            limit: 이번에 갱신할 최대 키워드 수
+
+        Returns:
+            Keyword 리스트
+        """
+        now = now or datetime.now()
+        if self._day != now.date():
+            self._day = now.date()
+            self._used_today = 0
+
+        left = self.budget - self._used_today
+        if limit is not None:
+            left = min(left, limit)
+        if left <= 0:
+            return []
+
+        rates = self.refreshes_per_day()
+        candidates = []
+        for keyword in self.keywords:
+            stats = self.stats[keyword.id]
+            interval = timedelta(days=1) / max(rates[keyword.id], 1e-6)
+            if stats.last_refreshed is None:
+                overdue = math.inf
+            else:
+                overdue = (now - stats.last_refreshed) / interval
+            if overdue >= 1:
+                candidates.append((overdue * stats.score, keyword))
+
+        candidates.sort(key=lambda item: item[0], reverse=True)
+        return [keyword for _, keyword in candidates[:int(left)]]
+
+    def record(self, keyword, rankings, when=None):
+        """
+        갱신 결과 반영 (다음 간격 / 변동성 계산에 사용)
+
+        Args:
+            keyword: 갱신한 Keyword
+            rankings: 수집한 순위 리스트 (RankingRow, 실패면 빈 리스트)
+            when: 수집 시각 (None이면 현재)
+        """
+        when = when or datetime.now()
+        if self._day != when.date():
+            self._day = when.date()
+            self._used_today = 0
+        self._used_today += 1
+
+        stats = self.stats.get(keyword.id)
+        if stats is None:
+            return
+        if not rankings:
+            # 실패한 갱신은 변동성에 넣지 않고 간격만 다시 시작 (바로 재시도하지 않도록)
+            stats.last_refreshed = when
+            return
+
+        ordered = sorted(rankings, key=lambda ranking: ranking['rank'])
+        stats.observe(when, [str(ranking['place_id'] or '') for ranking in ordered], self.member_keys)
+
+    def print_plan(self):
+        """키워드별 변동성 / 회원 수 / 하루 갱신 횟수 출력"""
+        rates = self.refreshes_per_day()
+        print(f"📅 키워드 갱신 계획 (하루 예산 {self.budget}회)")
+        for keyword in sorted(self.keywords, key=lambda k: rates[k.id], reverse=True):
+            stats = self.stats[keyword.id]
+            print(f"  • {keyword.query}: 변동성 {stats.volatility:.2f}, 회원 {len(stats.members)}곳, "
+                  f"하루 {rates[keyword.id]:.1f}회")
@@ -0,0 +1,171 @@
+"""
+리포트 조회용 Read-through 캐시
+쿼리별 TTL + LRU 제거로 같은 날 반복되는 리포트 생성을 메모리에서 처리
+같은 키를 동시에 요청하면 loader는 한 번만 실행하고 결과를 함께 사용 (single-flight)
+무효화는 세대(generation) 번호로 기록해 로딩 중이던 결과는 저장하지 않고,
+같은 namespace를 쓰는 다른 인스턴스의 항목도 함께 만료
+"""
+
+import time
+import threading
+from collections import OrderedDict
+
+# namespace별 무효화 기록 (인스턴스 간 공유): namespace -> {'generation': 번호, 'invalidated': {쿼리 이름 또는 None: 번호}}
+_namespaces = {}
+_namespaces_lock = threading.Lock()
+
+
+def _key_name(key):
+    """캐시 키의 쿼리 이름 (튜플이면 첫 요소)"""
+    return key[0] if isinstance(key, tuple) else key
+
+
+class _Flight:
+    """로딩 중인 키 하나 (대기 중인 호출에 결과/예외 전달)"""
+
+    def __init__(self):
+        self._done = threading.Event()
+        self.value = None
+        self.error = None
+
+    def finish(self, value=None, error=None):
+        self.value = value
+        self.error = error
+        self._done.set()
+
+    def wait(self):
+        self._done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class ReportCache:
+    def __init__(self, max_entries=128, default_ttl=300, namespace=None):
+        """
+        초기화
+
+        Args:
+            max_entries: 최대 보관 항목 수 (초과 시 가장 오래 안 쓴 항목 제거)
+            default_ttl: 기본 유효 시간 (초)
+            namespace: 무효화를 공유할 이름 (같은 이름의 인스턴스끼리 invalidate()가 함께 적용, None이면 이 인스턴스만)
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+
+        if namespace is None:
+            self._state = {'generation': 0, 'invalidated': {}}
+        else:
+            with _namespaces_lock:
+                self._state = _namespaces.setdefault(namespace, {'generation': 0, 'invalidated': {}})
+
+        self._entries = OrderedDict()  # key -> (만료 시각, 저장 세대, 값)
+        self._inflight = {}            # key -> 로딩 중인 _Flight
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get_or_load(self, key, loader, ttl=None):
+        """
+        캐시에 있으면 반환, 없거나 만료됐으면 loader() 결과를 저장 후 반환
+
+        Args:
+            key: 캐시 키 (튜플 권장, 첫 요소는 쿼리 이름)
+            loader: 캐시 미스 시 호출할 함수 (예외는 캐시하지 않고 대기 중인 호출에도 전달)
+            ttl: 이 항목의 유효 시간 (초), None이면 기본값
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now and not self._stale(key, entry[1]):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+
+            if entry:
+                del self._entries[key]
+
+            # 같은 키를 이미 로딩 중이면 그 결과를 기다림
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+                self.misses += 1
+                generation = self._generation()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return flight.wait()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            flight.finish(error=e)
+            raise
+
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            # 로딩 중에 무효화됐으면 이전 데이터일 수 있으므로 저장하지 않음 (호출자에게만 반환)
+            if not self._stale(key, generation):
+                self._entries[key] = (expires_at, generation, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            del self._inflight[key]
+        flight.finish(value=value)
+
+        return value
+
+    def _generation(self):
+        """지금 세대 번호 (loader 호출 전에 기록)"""
+        with _namespaces_lock:
+            return self._state['generation']
+
+    def _stale(self, key, generation):
+        """generation 세대에 읽은 항목이 그 뒤의 무효화(전체 또는 같은 쿼리 이름)로 만료됐는지"""
+        with _namespaces_lock:
+            invalidated = self._state['invalidated']
+            return max(invalidated.get(None, 0), invalidated.get(_key_name(key), 0)) > generation
+
+    def invalidate(self, name=None):
+        """
+        캐시 무효화 (같은 namespace의 다른 인스턴스 항목은 다음 조회 때 만료)
+
+        Args:
+            name: 쿼리 이름 (키의 첫 요소), None이면 전체 삭제
+        """
+        with _namespaces_lock:
+            self._state['generation'] += 1
+            self._state['invalidated'][name] = self._state['generation']
+
+        with self._lock:
+            if name is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                stale = [key for key in self._entries if _key_name(key) == name]
+                for key in stale:
+                    del self._entries[key]
+                removed = len(stale)
+
+        return removed
+
+    def stats(self):
+        """캐시 적중 통계"""
+        with self._lock:
+            size = len(self._entries)
+
+        total = self.hits + self.misses
+        return {
+            'entries': size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0
+        }
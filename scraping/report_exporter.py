@@ -0,0 +1,318 @@
+"""
+대용량 리포트 스트리밍 내보내기
+DataFrame을 만들지 않고 행 단위로 바로 기록 (xlsx / csv / parquet)
+"""
+
+import os
+import csv
+import json
+import time
+import tracemalloc
+from datetime import datetime
+
+from models import as_dict
+
+# 선택 의존성
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+class StreamingReportExporter:
+    SUPPORTED_FORMATS = ('xlsx', 'csv', 'parquet')
+
+    def __init__(self, filepath, fmt='xlsx', engine='openpyxl', batch_size=5000):
+        """
+        초기화
+
+        Args:
+            filepath: 저장 경로 (csv/parquet은 시트별로 '<이름>_<시트>.<확장자>' 파일 생성)
+            fmt: 'xlsx', 'csv', 'parquet'
+            engine: xlsx 엔진 ('openpyxl' write-only 또는 'xlsxwriter' constant_memory)
+            batch_size: parquet 기록 시 한 번에 모을 행 수
+        """
+        if fmt not in self.SUPPORTED_FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {fmt}")
+        if fmt == 'parquet' and pa is None:
+            raise ImportError("parquet 내보내기에는 pyarrow가 필요합니다 (pip install pyarrow)")
+        if fmt == 'xlsx' and engine == 'xlsxwriter' and xlsxwriter is None:
+            raise ImportError("xlsxwriter 엔진을 사용하려면 pip install xlsxwriter")
+
+        self.filepath = filepath
+        self.fmt = fmt
+        self.engine = engine
+        self.batch_size = batch_size
+
+        self.files = []        # 생성된 파일 목록
+        self.row_counts = {}   # 시트별 기록 행 수
+
+        self._workbook = None
+        if fmt == 'xlsx':
+            self._workbook = self._open_workbook()
+
+    def _open_workbook(self):
+        """xlsx 워크북 열기 (스트리밍 모드)"""
+        if self.engine == 'xlsxwriter':
+            return xlsxwriter.Workbook(self.filepath, {'constant_memory': True})
+
+        from openpyxl import Workbook
+        return Workbook(write_only=True)
+
+    def _sheet_path(self, sheet_name):
+        """csv/parquet 시트별 파일 경로"""
+        base, _ = os.path.splitext(self.filepath)
+        return f"{base}_{sheet_name}.{self.fmt}"
+
+    @staticmethod
+    def _cell(value):
+        """엑셀/CSV 셀 값으로 변환 (조인 결과 같은 중첩 값은 JSON 문자열)"""
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False)
+        return value
+
+    def write_sheet(self, sheet_name, rows, columns=None, schema=None):
+        """
+        행 이터러블을 시트 하나로 기록
+
+        Args:
+            sheet_name: 시트 이름
+            rows: dict / RankingRow / Restaurant 행을 내는 이터러블 (리스트, 제너레이터, 쿼리 페이지 등)
+            columns: 컬럼 순서 (None이면 첫 행의 키 순서)
+            schema: parquet 컬럼 타입 (pyarrow Schema 또는 {컬럼: 타입}, None이면 배치에서 추론해 넓힘)
+
+        Returns:
+            기록한 행 수
+        """
+        iterator = map(as_dict, rows)
+        first = next(iterator, None)
+        if first is None:
+            self.row_counts[sheet_name] = 0
+            return 0
+
+        if columns is None:
+            columns = list(first.keys())
+
+        if self.fmt == 'xlsx':
+            count = self._write_xlsx(sheet_name, columns, first, iterator)
+        elif self.fmt == 'csv':
+            count = self._write_csv(sheet_name, columns, first, iterator)
+        else:
+            count = self._write_parquet(sheet_name, columns, first, iterator, schema)
+
+        self.row_counts[sheet_name] = count
+        return count
+
+    def _write_xlsx(self, sheet_name, columns, first, iterator):
+        count = 0
+        if self.engine == 'xlsxwriter':
+            worksheet = self._workbook.add_worksheet(sheet_name)
+            worksheet.write_row(0, 0, columns)
+            row_idx = 1
+            for row in _chain_first(first, iterator):
+                worksheet.write_row(row_idx, 0, [self._cell(row.get(c)) for c in columns])
+                row_idx += 1
+                count += 1
+        else:
+            worksheet = self._workbook.create_sheet(title=sheet_name)
+            worksheet.append(columns)
+            for row in _chain_first(first, iterator):
+                worksheet.append([self._cell(row.get(c)) for c in columns])
+                count += 1
+        return count
+
+    def _write_csv(self, sheet_name, columns, first, iterator):
+        path = self._sheet_path(sheet_name)
+        count = 0
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for row in _chain_first(first, iterator):
+                writer.writerow([self._cell(row.get(c)) for c in columns])
+                count += 1
+        self.files.append(path)
+        return count
+
+    def _write_parquet(self, sheet_name, columns, first, iterator, schema=None):
+        path = self._sheet_path(sheet_name)
+        writer = None
+        fixed = schema is not None  # 지정한 스키마는 넓히지 않고 그대로 변환
+        if isinstance(schema, dict):
+            schema = pa.schema([(c, schema[c]) for c in columns])
+        count = 0
+        batch = []
+
+        def flush():
+            nonlocal writer, schema
+            table = _batch_table(batch, columns)
+            if schema is None:
+                # 첫 배치에서 값이 없는 컬럼은 문자열로
+                schema = pa.schema([
+                    pa.field(field.name, pa.string()) if pa.types.is_null(field.type) else field
+                    for field in table.schema
+                ])
+            elif not fixed:
+                widened = _widen_schema(schema, table.schema)
+                if widened != schema and writer is not None:
+                    # 뒤 배치에서 타입이 바뀜 (None → 문자열, 정수 → 실수 등) → 이미 쓴 행을 넓힌 타입으로 다시 기록
+                    writer.close()
+                    written = pq.read_table(path).cast(widened)
+                    writer = pq.ParquetWriter(path, widened)
+                    writer.write_table(written)
+                schema = widened
+            if writer is None:
+                writer = pq.ParquetWriter(path, schema)
+            writer.write_table(table.cast(schema))
+            batch.clear()
+
+        for row in _chain_first(first, iterator):
+            batch.append({c: self._cell(row.get(c)) for c in columns})
+            count += 1
+            if len(batch) >= self.batch_size:
+                flush()
+
+        if batch:
+            flush()
+        if writer:
+            writer.close()
+
+        self.files.append(path)
+        return count
+
+    def close(self):
+        """파일 마무리"""
+        if self._workbook is not None:
+            if self.engine == 'xlsxwriter':
+                self._workbook.close()
+            else:
+                self._workbook.save(self.filepath)
+            self._workbook = None
+            self.files.append(self.filepath)
+        return self.files
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def _batch_table(batch, columns):
+    """dict 행 배치를 Arrow 테이블로 (한 컬럼에 문자열과 다른 값이 섞이면 그 컬럼은 문자열)"""
+    for column in columns:
+        kinds = {type(row[column]) for row in batch if row[column] is not None}
+        if str in kinds and len(kinds) > 1:
+            for row in batch:
+                if row[column] is not None:
+                    row[column] = str(row[column])
+    return pa.Table.from_pylist(batch).select(columns)
+
+
+def _widen_schema(schema, other):
+    """
+    두 배치 스키마를 모두 담을 수 있는 스키마
+    (값 없음은 상대 타입, 정수 / 실수는 실수, 그 외 다른 타입은 문자열)
+    """
+    fields = []
+    for field in schema:
+        current, new = field.type, other.field(field.name).type
+        if current == new or pa.types.is_null(new):
+            widened = current
+        elif pa.types.is_null(current):
+            widened = new
+        elif _is_number(current) and _is_number(new):
+            widened = current if pa.types.is_floating(current) else (new if pa.types.is_floating(new) else pa.int64())
+        else:
+            widened = pa.string()
+        fields.append(pa.field(field.name, widened))
+    return pa.schema(fields)
+
+
+def _is_number(arrow_type):
+    return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+
+
+def _chain_first(first, iterator):
+    """이미 꺼낸 첫 행과 나머지 이터레이터를 이어서 반환"""
+    yield first
+    yield from iterator
+
+
+def _sample_rows(count):
+    """벤치마크용 순위 행 생성 (키워드 × 식당)"""
+    today = datetime.now().strftime('%Y-%m-%d')
+    for i in range(count):
+        yield {
+            'search_keyword': f"키워드{i // 500}",
+            'rank': i % 500 + 1,
+            'place_name': f"식당 {i % 500}",
+            'place_id': str(1000000 + i % 500),
+            'blog_count': i % 3000,
+            'visitor_review_count': i % 9000,
+            'n1_score': 0.5 + (i % 100) / 1000,
+            'search_date': today,
+            'search_time': '06:00:00'
+        }
+
+
+def benchmark_export(rows=100_000, output_dir='scraping/reports/benchmark'):
+    """
+    내보내기 방식별 소요 시간과 최대 메모리 측정
+
+    Returns:
+        방식별 결과 리스트 (seconds, peak_mb)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    results = []
+
+    def measure(label, func):
+        tracemalloc.start()
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results.append({'method': label, 'rows': rows, 'seconds': round(elapsed, 2), 'peak_mb': round(peak / 1024 / 1024, 1)})
+
+    def pandas_export():
+        import pandas as pd
+        with pd.ExcelWriter(os.path.join(output_dir, 'pandas.xlsx'), engine='openpyxl') as writer:
+            pd.DataFrame(list(_sample_rows(rows))).to_excel(writer, sheet_name='오늘순위', index=False)
+
+    def streaming(fmt, engine='openpyxl'):
+        def run():
+            with StreamingReportExporter(os.path.join(output_dir, f"stream_{engine}.{fmt}"), fmt=fmt, engine=engine) as exporter:
+                exporter.write_sheet('오늘순위', _sample_rows(rows))
+        return run
+
+    measure('pandas + openpyxl', pandas_export)
+    measure('streaming xlsx (openpyxl write-only)', streaming('xlsx'))
+    if xlsxwriter is not None:
+        measure('streaming xlsx (xlsxwriter constant_memory)', streaming('xlsx', 'xlsxwriter'))
+    measure('streaming csv', streaming('csv'))
+    if pa is not None:
+        measure('streaming parquet', streaming('parquet'))
+
+    return results
+
+
+# 벤치마크 실행
+if __name__ == "__main__":
+    import sys
+
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print("=" * 60)
+    print(f"📁 내보내기 벤치마크 ({row_count:,}행)")
+    print("=" * 60)
+
+    for result in benchmark_export(row_count):
+        print(f"  • {result['method']:<45} {result['seconds']:>7.2f}초  최대 {result['peak_mb']:>7.1f}MB")
@@ -0,0 +1,129 @@
+"""
+수집 마감 시각 관리
+키워드마다 걸린 시간으로 남은 키워드 하나에 걸릴 시간을 추정해,
+마감 전에 끝낼 수 없는 키워드는 시작하지 않고 다음 실행으로 미룸
+(미룬 키워드는 파일에 기록 → 다음 실행에서 가장 먼저 검색)
+"""
+
+import os
+import json
+import time
+from datetime import datetime, timedelta
+
+DEFAULT_DEFERRED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'deferred_keywords.json')
+
+
+def parse_deadline(value, now=None):
+    """
+    마감 시각 해석
+
+    Args:
+        value: datetime / 'HH:MM' (이미 지났으면 다음 날) / 지금부터 남은 초 (숫자 또는 숫자 문자열) / None
+
+    Returns:
+        datetime 또는 None (마감 없음)
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value
+
+    now = now or datetime.now()
+    if isinstance(value, (int, float)):
+        return now + timedelta(seconds=value)
+
+    value = str(value).strip()
+    if ':' in value:
+        hour, minute = (int(part) for part in value.split(':', 1))
+        deadline = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        return deadline if deadline > now else deadline + timedelta(days=1)
+    return now + timedelta(seconds=float(value))
+
+
+class RunDeadline:
+    def __init__(self, deadline=None, reserve=120, margin=0.5, initial_estimate=15.0):
+        """
+        초기화
+
+        Args:
+            deadline: 마감 시각 (parse_deadline 형식, None이면 ADLOG_RUN_DEADLINE, 그것도 없으면 마감 없음)
+            reserve: 마감 전에 남겨 둘 시간 (초, 저장/요약용)
+            margin: 추정 시간에 더할 여유 비율 (0.5면 1.5배로 잡음)
+            initial_estimate: 아직 끝낸 키워드가 없을 때 키워드당 추정 시간 (초)
+        """
+        if deadline is None:
+            deadline = os.getenv('ADLOG_RUN_DEADLINE')
+        self.deadline = parse_deadline(deadline)
+        self.reserve = reserve
+        self.margin = margin
+        self.initial_estimate = initial_estimate
+
+        self._started = time.perf_counter()
+        self.completed = 0
+
+    def __bool__(self):
+        return self.deadline is not None
+
+    def __repr__(self):
+        return f"RunDeadline({self.deadline:%Y-%m-%d %H:%M})" if self.deadline else "RunDeadline(없음)"
+
+    def start(self):
+        """키워드 처리 시작 시각 기록 (그 전 단계 시간은 키워드당 추정에서 제외)"""
+        self._started = time.perf_counter()
+        self.completed = 0
+        return self
+
+    def done(self, count=1):
+        """키워드 완료 기록 (평균 소요 시간 계산용)"""
+        self.completed += count
+
+    @property
+    def estimate(self):
+        """키워드 하나에 걸리는 시간 추정 (초, 지금까지의 평균 처리 간격)"""
+        if not self.completed:
+            return self.initial_estimate
+        return (time.perf_counter() - self._started) / self.completed
+
+    def time_left(self):
+        """마감까지 남은 시간 (초, 마감 없으면 무한대)"""
+        if self.deadline is None:
+            return float('inf')
+        return (self.deadline - datetime.now()).total_seconds()
+
+    def can_start(self):
+        """키워드 하나를 더 시작해도 마감 전에 끝낼 수 있는지"""
+        return self.time_left() >= self.estimate * (1 + self.margin) + self.reserve
+
+
+def load_deferred(path=None):
+    """지난 실행에서 미룬 키워드 검색어 리스트"""
+    path = path or os.getenv('ADLOG_DEFERRED_KEYWORDS') or DEFAULT_DEFERRED_PATH
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f).get('keywords', [])
+    except (OSError, ValueError):
+        return []
+
+
+def save_deferred(keywords, path=None, deadline=None):
+    """
+    이번 실행에서 미룬 키워드 기록 (없으면 빈 목록으로 덮어씀)
+
+    Args:
+        keywords: 미룬 키워드 검색어 리스트
+        deadline: 이번 실행의 마감 시각 (기록용)
+    """
+    path = path or os.getenv('ADLOG_DEFERRED_KEYWORDS') or DEFAULT_DEFERRED_PATH
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    record = {
+        'keywords': list(keywords),
+        'deferred_at': datetime.now().isoformat(),
+        'deadline': deadline.isoformat() if deadline else None
+    }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(record, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
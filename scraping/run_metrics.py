@@ -0,0 +1,196 @@
+"""
+수집 실행 계측 (단계별 타이머 + 카운터)
+실행마다 JSON Lines 요약을 남기고, 선택적으로 Prometheus textfile도 기록
+"""
+
+import os
+import re
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+# 실행 위치(cron / 스케줄러의 작업 디렉터리)와 관계없이 scraping/data 아래에 기록
+DEFAULT_METRICS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'run_metrics.jsonl')
+
+# textfile 이름에 쓸 수 없는 문자
+UNSAFE_FILENAME_PATTERN = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
+class RunMetrics:
+    def __init__(self, run_name):
+        """
+        초기화
+
+        Args:
+            run_name: 실행 이름 (예: 'full_collection', 'daily_scraping_job')
+        """
+        self.run_name = run_name
+        self.started_at = datetime.now()
+        self._started = time.perf_counter()
+
+        self.stages = {}    # stage -> {'count', 'total', 'max'}
+        self.counters = {}  # name -> 값
+        self._lock = threading.Lock()
+        self._finished = None
+
+    @contextmanager
+    def timer(self, stage):
+        """
+        단계 소요 시간 측정
+
+        사용 예:
+            with metrics.timer('page_load'):
+                driver.get(url)
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def record(self, stage, seconds):
+        """측정한 시간을 단계에 누적"""
+        with self._lock:
+            stat = self.stages.setdefault(stage, {'count': 0, 'total': 0.0, 'max': 0.0})
+            stat['count'] += 1
+            stat['total'] += seconds
+            stat['max'] = max(stat['max'], seconds)
+
+    def incr(self, name, value=1):
+        """카운터 증가"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def sleep(self, seconds, stage='sleep'):
+        """대기하면서 대기 시간도 기록"""
+        with self.timer(stage):
+            time.sleep(seconds)
+
+    def summary(self):
+        """실행 요약 (dict)"""
+        elapsed = (self._finished or time.perf_counter()) - self._started
+
+        with self._lock:
+            stages = {
+                name: {
+                    'count': stat['count'],
+                    'total_sec': round(stat['total'], 3),
+                    'avg_sec': round(stat['total'] / stat['count'], 3) if stat['count'] else 0.0,
+                    'max_sec': round(stat['max'], 3)
+                }
+                for name, stat in self.stages.items()
+            }
+            counters = dict(self.counters)
+
+        return {
+            'run': self.run_name,
+            'started_at': self.started_at.isoformat(),
+            'duration_sec': round(elapsed, 3),
+            'stages': stages,
+            'counters': counters
+        }
+
+    def finish(self, jsonl_path=None, prometheus_path=None):
+        """
+        실행 종료 처리: 요약 출력 + JSON Lines 기록 + (설정 시) Prometheus textfile 기록
+
+        Args:
+            jsonl_path: JSON Lines 경로 (기본: ADLOG_METRICS_FILE 환경변수 또는 scraping/data/run_metrics.jsonl)
+            prometheus_path: textfile 경로 (기본: ADLOG_PROMETHEUS_TEXTFILE 환경변수, 없으면 생략, 실행 이름별 파일로 기록)
+        """
+        if self._finished is None:
+            self._finished = time.perf_counter()
+
+        summary = self.summary()
+
+        print(f"\n⏱️ 단계별 소요 시간 ({self.run_name}, 총 {summary['duration_sec']:.1f}초)")
+        for name, stat in sorted(summary['stages'].items(), key=lambda item: -item[1]['total_sec']):
+            print(f"  • {name}: {stat['total_sec']:.1f}초 ({stat['count']}회, 평균 {stat['avg_sec']:.2f}초)")
+        for name, value in sorted(summary['counters'].items()):
+            print(f"  • {name}: {value}")
+
+        jsonl_path = jsonl_path or os.getenv('ADLOG_METRICS_FILE', DEFAULT_METRICS_FILE)
+        try:
+            self.write_jsonl(jsonl_path, summary)
+        except Exception as e:
+            print(f"⚠️ 실행 지표 저장 실패: {str(e)}")
+
+        prometheus_path = prometheus_path or os.getenv('ADLOG_PROMETHEUS_TEXTFILE')
+        if prometheus_path:
+            try:
+                self.write_prometheus(prometheus_path, summary)
+            except Exception as e:
+                print(f"⚠️ Prometheus 지표 저장 실패: {str(e)}")
+
+        return summary
+
+    def write_jsonl(self, path, summary=None):
+        """요약 한 줄을 JSON Lines 파일에 추가"""
+        summary = summary or self.summary()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(summary, ensure_ascii=False) + '\n')
+
+    def prometheus_path(self, path):
+        """
+        실행 이름별 textfile 경로 (daily / adaptive / login 실행이 서로 덮어쓰지 않도록)
+        예: /var/lib/node_exporter/adlog.prom → adlog_daily_scraping_job.prom, 디렉터리면 그 안에 adlog_<실행>.prom
+        """
+        run = UNSAFE_FILENAME_PATTERN.sub('_', self.run_name)
+        if path.endswith(os.sep) or os.path.isdir(path):
+            return os.path.join(path, f"adlog_{run}.prom")
+        base, ext = os.path.splitext(path)
+        return f"{base}_{run}{ext or '.prom'}"
+
+    def write_prometheus(self, path, summary=None):
+        """
+        node_exporter textfile collector 형식으로 기록 (임시 파일 후 교체)
+
+        Returns:
+            기록한 파일 경로 (prometheus_path 참고)
+        """
+        summary = summary or self.summary()
+        run = summary['run']
+        path = self.prometheus_path(path)
+
+        lines = [
+            '# HELP adlog_run_duration_seconds Duration of the last run.',
+            '# TYPE adlog_run_duration_seconds gauge',
+            f'adlog_run_duration_seconds{{run="{run}"}} {summary["duration_sec"]}',
+            '# HELP adlog_run_last_timestamp_seconds Start time of the last run.',
+            '# TYPE adlog_run_last_timestamp_seconds gauge',
+            f'adlog_run_last_timestamp_seconds{{run="{run}"}} {self.started_at.timestamp():.0f}',
+            '# HELP adlog_stage_seconds Time spent per stage in the last run.',
+            '# TYPE adlog_stage_seconds gauge'
+        ]
+        for name, stat in summary['stages'].items():
+            lines.append(f'adlog_stage_seconds{{run="{run}",stage="{name}"}} {stat["total_sec"]}')
+
+        lines += [
+            '# HELP adlog_stage_calls Number of timed calls per stage in the last run.',
+            '# TYPE adlog_stage_calls gauge'
+        ]
+        for name, stat in summary['stages'].items():
+            lines.append(f'adlog_stage_calls{{run="{run}",stage="{name}"}} {stat["count"]}')
+
+        lines += [
+            '# HELP adlog_run_counter Counters recorded in the last run.',
+            '# TYPE adlog_run_counter gauge'
+        ]
+        for name, value in summary['counters'].items():
+            lines.append(f'adlog_run_counter{{run="{run}",name="{name}"}} {value}')
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(tmp_path, path)
+        return path
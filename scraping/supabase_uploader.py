@@ -4,17 +4,94 @@ ADLOG 스크래핑 데이터를 Supabase에 저장
 """
 
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 from supabase import create_client, Client
 from dotenv import load_dotenv
 import json
+from run_metrics import RunMetrics
+from models import RankingRow
+from keyword_registry import make_keyword
+from paged_reader import iter_rows
+from name_matcher import NameIndex
 
 # 환경변수 로드
 load_dotenv()
 
+
+def bulk_save_run(client, restaurants=(), rankings=(), search_date=None, search_time=None, metrics=None):
+    """
+    한 실행의 식당 + 순위를 DB 함수 adlog_bulk_save로 일괄 저장 (RPC 한 번, 한 트랜잭션)
+    식당 upsert → place_id로 restaurant_id 조인 → daily_rankings upsert를 DB 안에서 처리
+
+    Args:
+        client: Supabase 클라이언트
+        restaurants: Restaurant 리스트
+        rankings: RankingRow 리스트 (또는 예전 dict 형식, place_id 없는 순위는 제외)
+        search_date: 저장할 순위 날짜 'YYYY-MM-DD' (None이면 오늘)
+        search_time: 저장할 순위 시각 'HH:MM:SS' (None이면 지금)
+        metrics: 실행 계측 객체
+
+    Returns:
+        {'restaurants', 'rankings', 'skipped'} 저장 행 수 (함수가 없거나 실패하면 None)
+    """
+    if not client:
+        return None
+
+    now = datetime.now()
+    # 저장 시각 기준 날짜/시간 + 순위 행에 없는 컬럼 기본값 (행마다 저장하던 때와 같은 값)
+    extra = {
+        'search_date': search_date or now.strftime('%Y-%m-%d'),
+        'search_time': search_time or now.strftime('%H:%M:%S'),
+        'reservation_count': 0,
+        'n1_score': None,
+        'n2_score': None,
+        'n3_score': None
+    }
+    ranking_rows = []
+    for ranking in map(RankingRow.coerce, rankings):
+        if ranking.place_id:
+            row = ranking.to_daily_row(None, extra)
+            del row['restaurant_id']
+            row['place_id'] = ranking.place_id
+            ranking_rows.append(row)
+
+    updated_at = now.isoformat()
+    payload = {
+        'restaurants': [restaurant.to_db_row(updated_at) for restaurant in restaurants],
+        'rankings': ranking_rows
+    }
+
+    try:
+        if metrics:
+            with metrics.timer('db_write'):
+                result = client.rpc('adlog_bulk_save', {'payload': payload}).execute()
+        else:
+            result = client.rpc('adlog_bulk_save', {'payload': payload}).execute()
+    except Exception as e:
+        if metrics:
+            metrics.incr('db_failures')
+        print(f"⚠️ 일괄 저장 실패 (create_ranking_table SQL의 adlog_bulk_save 실행 여부 확인): {str(e)}")
+        return None
+
+    counts = result.data if isinstance(result.data, dict) else None
+    if counts is None:
+        return None
+
+    if metrics:
+        metrics.incr('db_rows_written', counts.get('restaurants', 0) + counts.get('rankings', 0))
+    print(f"  ✅ 일괄 저장: 식당 {counts.get('restaurants', 0)}개, 순위 {counts.get('rankings', 0)}개"
+          f" (건너뜀 {counts.get('skipped', 0)}개)")
+    return counts
+
 class SupabaseUploader:
-    def __init__(self):
-        """Supabase 클라이언트 초기화"""
+    def __init__(self, metrics=None):
+        """
+        Supabase 클라이언트 초기화
+        Args:
+            metrics: 실행 계측 객체 (없으면 새로 생성)
+        """
+        self.metrics = metrics or RunMetrics('supabase_uploader')
+        
         # 프로젝트 루트의 .env 파일 로드
         env_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
         if os.path.exists(env_path):
@@ -67,6 +144,17 @@ class SupabaseUploader:
         CREATE INDEX idx_place_rankings_date ON place_rankings(search_date);
         CREATE INDEX idx_place_rankings_place_name ON place_rankings(place_name);
         
+        -- 지역 없는 키워드도 같은 날짜 / 순위는 한 행 (UNIQUE는 NULL 지역을 서로 다른 값으로 봄)
+        -- 기존 중복은 가장 나중에 저장한 행만 남김
+        DELETE FROM place_rankings a USING place_rankings b
+        WHERE a.search_keyword = b.search_keyword
+            AND COALESCE(a.search_location, '') = COALESCE(b.search_location, '')
+            AND a.search_date = b.search_date
+            AND a.rank = b.rank
+            AND (a.created_at, a.id::text) < (b.created_at, b.id::text);
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_place_rankings_slot
+            ON place_rankings(search_keyword, COALESCE(search_location, ''), search_date, rank);
+        
         -- 내 식당 순위 추적 테이블
         CREATE TABLE IF NOT EXISTS my_restaurant_rankings (
             id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
@@ -90,24 +178,144 @@ class SupabaseUploader:
             UNIQUE(restaurant_name, keyword, location, tracked_date)
         );
         
-        -- 순위 변동 히스토리 뷰
-        CREATE OR REPLACE VIEW ranking_trends AS
-        SELECT 
-            place_name,
-            search_keyword,
-            search_location,
-            search_date,
-            rank,
-            LAG(rank) OVER (
-                PARTITION BY place_name, search_keyword, search_location 
-                ORDER BY search_date
-            ) as previous_rank,
-            rank - LAG(rank) OVER (
-                PARTITION BY place_name, search_keyword, search_location 
-                ORDER BY search_date
-            ) as rank_change
-        FROM place_rankings
-        ORDER BY search_date DESC, rank;
+        -- 순위 변동 히스토리 (뷰 대신 테이블, 수집 후 refresh_ranking_trends(날짜)로 그 날짜만 추가)
+        DROP VIEW IF EXISTS ranking_trends;
+        CREATE TABLE IF NOT EXISTS ranking_trends (
+            place_name VARCHAR(200) NOT NULL,
+            search_keyword VARCHAR(100) NOT NULL,
+            search_location VARCHAR(50) NOT NULL DEFAULT '',
+            search_date DATE NOT NULL,
+            rank INTEGER NOT NULL,
+            previous_rank INTEGER,
+            rank_change INTEGER,
+            
+            PRIMARY KEY (search_date, search_keyword, search_location, place_name)
+        );
+        
+        CREATE INDEX IF NOT EXISTS idx_ranking_trends_place
+            ON ranking_trends(place_name, search_keyword, search_location, search_date DESC);
+        
+        -- 이전 순위 조회용 (식당 + 키워드 + 지역의 직전 날짜)
+        CREATE INDEX IF NOT EXISTS idx_place_rankings_place_keyword_date
+            ON place_rankings(place_name, search_keyword, search_location, search_date DESC);
+        
+        CREATE OR REPLACE FUNCTION refresh_ranking_trends(p_date DATE DEFAULT CURRENT_DATE)
+        RETURNS INTEGER AS $$
+        DECLARE
+            v_rows INTEGER;
+        BEGIN
+            DELETE FROM ranking_trends WHERE search_date = p_date;
+            
+            -- 같은 날 여러 번 수집했으면 가장 좋은 순위 사용
+            INSERT INTO ranking_trends (place_name, search_keyword, search_location, search_date,
+                                        rank, previous_rank, rank_change)
+            SELECT cur.place_name, cur.search_keyword, cur.search_location, p_date,
+                   cur.rank, prev.rank, cur.rank - prev.rank
+            FROM (
+                SELECT place_name, search_keyword, COALESCE(search_location, '') AS search_location,
+                       MIN(rank) AS rank
+                FROM place_rankings
+                WHERE search_date = p_date
+                GROUP BY place_name, search_keyword, COALESCE(search_location, '')
+            ) cur
+            LEFT JOIN LATERAL (
+                SELECT MIN(pr.rank) AS rank
+                FROM place_rankings pr
+                WHERE pr.place_name = cur.place_name
+                    AND pr.search_keyword = cur.search_keyword
+                    AND COALESCE(pr.search_location, '') = cur.search_location
+                    AND pr.search_date = (
+                        SELECT MAX(search_date) FROM place_rankings p2
+                        WHERE p2.place_name = cur.place_name
+                            AND p2.search_keyword = cur.search_keyword
+                            AND COALESCE(p2.search_location, '') = cur.search_location
+                            AND p2.search_date < p_date
+                    )
+            ) prev ON TRUE;
+            
+            GET DIAGNOSTICS v_rows = ROW_COUNT;
+            RETURN v_rows;
+        END;
+        $$ LANGUAGE plpgsql;
+        
+        -- 기존 히스토리 한 번 채우기 (뷰가 보여 주던 이전 날짜, 이미 채운 날짜는 건너뜀)
+        DO $$
+        DECLARE
+            v_date DATE;
+        BEGIN
+            FOR v_date IN
+                SELECT DISTINCT pr.search_date FROM place_rankings pr
+                WHERE NOT EXISTS (SELECT 1 FROM ranking_trends rt WHERE rt.search_date = pr.search_date)
+                ORDER BY pr.search_date
+            LOOP
+                PERFORM refresh_ranking_trends(v_date);
+            END LOOP;
+        END $$;
+        
+        -- 한 실행 결과 일괄 저장 (RPC 한 번, 한 트랜잭션)
+        -- adlog_restaurants / daily_rankings는 database/schemas/features/ranking/create-adlog-tables.sql
+        -- payload: {"restaurants": [adlog_restaurants 행], "rankings": [daily_rankings 행 + place_id]}
+        CREATE OR REPLACE FUNCTION adlog_bulk_save(payload JSONB)
+        RETURNS JSONB AS $$
+        DECLARE
+            v_restaurants INTEGER := 0;
+            v_rankings INTEGER := 0;
+            v_received INTEGER := 0;
+        BEGIN
+            -- 1. 식당 upsert (place_id 기준)
+            INSERT INTO adlog_restaurants (place_id, place_name, category, address, place_url, is_active, updated_at)
+            SELECT DISTINCT ON (r.place_id)
+                   r.place_id, r.place_name, r.category, r.address, r.place_url,
+                   COALESCE(r.is_active, TRUE), COALESCE(r.updated_at, NOW())
+            FROM jsonb_to_recordset(COALESCE(payload->'restaurants', '[]'::jsonb)) AS r(
+                place_id VARCHAR, place_name VARCHAR, category VARCHAR, address VARCHAR,
+                place_url TEXT, is_active BOOLEAN, updated_at TIMESTAMPTZ
+            )
+            WHERE r.place_id IS NOT NULL AND r.place_name IS NOT NULL
+            ORDER BY r.place_id
+            ON CONFLICT (place_id) DO UPDATE SET
+                place_name = EXCLUDED.place_name,
+                category = EXCLUDED.category,
+                address = EXCLUDED.address,
+                place_url = EXCLUDED.place_url,
+                is_active = EXCLUDED.is_active,
+                updated_at = EXCLUDED.updated_at;
+            GET DIAGNOSTICS v_restaurants = ROW_COUNT;
+            
+            -- 2. place_id -> restaurant_id 조인 후 순위 upsert (같은 날짜/키워드/식당은 가장 좋은 순위)
+            INSERT INTO daily_rankings (search_date, search_time, search_keyword, restaurant_id, rank,
+                                        blog_count, visitor_review_count, reservation_count,
+                                        n1_score, n2_score, n3_score)
+            SELECT DISTINCT ON (d.search_date, d.search_keyword, ar.id)
+                   d.search_date, d.search_time, d.search_keyword, ar.id, d.rank,
+                   COALESCE(d.blog_count, 0), COALESCE(d.visitor_review_count, 0),
+                   COALESCE(d.reservation_count, 0), d.n1_score, d.n2_score, d.n3_score
+            FROM jsonb_to_recordset(COALESCE(payload->'rankings', '[]'::jsonb)) AS d(
+                search_date DATE, search_time TIME, search_keyword VARCHAR, place_id VARCHAR, rank INTEGER,
+                blog_count INTEGER, visitor_review_count INTEGER, reservation_count INTEGER,
+                n1_score NUMERIC, n2_score NUMERIC, n3_score NUMERIC
+            )
+            JOIN adlog_restaurants ar ON ar.place_id = d.place_id
+            ORDER BY d.search_date, d.search_keyword, ar.id, d.rank
+            ON CONFLICT (search_date, search_keyword, restaurant_id) DO UPDATE SET
+                search_time = EXCLUDED.search_time,
+                rank = EXCLUDED.rank,
+                blog_count = EXCLUDED.blog_count,
+                visitor_review_count = EXCLUDED.visitor_review_count,
+                reservation_count = EXCLUDED.reservation_count,
+                n1_score = EXCLUDED.n1_score,
+                n2_score = EXCLUDED.n2_score,
+                n3_score = EXCLUDED.n3_score;
+            GET DIAGNOSTICS v_rankings = ROW_COUNT;
+            
+            v_received := jsonb_array_length(COALESCE(payload->'rankings', '[]'::jsonb));
+            RETURN jsonb_build_object(
+                'restaurants', v_restaurants,
+                'rankings', v_rankings,
+                'skipped', v_received - v_rankings  -- 등록되지 않은 식당 / 중복 순위
+            );
+        END;
+        $$ LANGUAGE plpgsql;
         """
         
         print("📋 위 SQL을 Supabase SQL Editor에서 실행해주세요!")
@@ -118,107 +326,186 @@ class SupabaseUploader:
         순위 데이터를 Supabase에 업로드
         
         Args:
-            rankings_data: 스크래핑한 순위 데이터 리스트
+            rankings_data: 스크래핑한 순위 데이터 리스트 (RankingRow 또는 예전 dict 형식)
         """
         if not self.supabase:
             print("❌ Supabase 연결이 필요합니다!")
             return False
         
         try:
-            # 데이터 정제
+            # place_rankings 행으로 변환 (원본 데이터는 수정하지 않음)
+            # 같은 키워드 / 지역 / 날짜 / 순위가 배치 안에 여러 번 있으면 나중 것만
+            slots = {}
             for ranking in rankings_data:
-                # location 분리
-                keyword_parts = ranking['keyword'].split()
-                location = keyword_parts[0] if len(keyword_parts) > 1 else None
-                keyword = ' '.join(keyword_parts[1:]) if len(keyword_parts) > 1 else ranking['keyword']
-                
-                ranking['search_keyword'] = keyword
-                ranking['search_location'] = location
+                row = RankingRow.coerce(ranking).to_db_row()
+                slots[(row['search_keyword'], row['search_location'] or '', row['search_date'], row['rank'])] = row
+            rows = list(slots.values())
+            
+            with self.metrics.timer('db_write'):
+                # 오늘 이미 수집한 키워드는 그날 순위를 새 결과로 교체 (하루 여러 번 갱신)
+                for keyword, location, search_date in sorted({key[:3] for key in slots}):
+                    query = (self.supabase.table('place_rankings').delete()
+                             .eq('search_keyword', keyword)
+                             .eq('search_date', search_date))
+                    if location:
+                        query = query.eq('search_location', location)
+                    else:
+                        query = query.is_('search_location', 'null')
+                    query.execute()
                 
-                # 불필요한 필드 제거
-                if 'keyword' in ranking:
-                    del ranking['keyword']
+                self.supabase.table('place_rankings').insert(rows).execute()
+            self.metrics.incr('db_rows_written', len(rows))
             
-            # Supabase에 삽입
-            result = self.supabase.table('place_rankings').insert(rankings_data).execute()
+            print(f"✅ {len(rows)}개 데이터 업로드 완료!")
             
-            print(f"✅ {len(rankings_data)}개 데이터 업로드 완료!")
+            # 업로드한 날짜만 순위 변동 히스토리 갱신
+            for search_date in sorted({row['search_date'] for row in rows}):
+                self.refresh_ranking_trends(search_date)
             return True
             
         except Exception as e:
+            self.metrics.incr('db_failures')
             print(f"❌ 업로드 실패: {str(e)}")
             return False
     
-    def track_my_restaurant(self, restaurant_name, user_id=None):
+    def bulk_save_run(self, restaurants=(), rankings=(), search_date=None, search_time=None):
         """
-        내 식당 순위 추적
+        한 실행 결과를 adlog_restaurants / daily_rankings에 일괄 저장 (RPC 한 번)
         
         Args:
-            restaurant_name: 식당 이름
+            restaurants: Restaurant 리스트
+            rankings: RankingRow 리스트
+            search_date: 순위 날짜 (None이면 오늘)
+            search_time: 순위 시각 (None이면 지금)
+        
+        Returns:
+            저장 행 수 dict (실패 시 None, 모듈 함수 bulk_save_run 참고)
+        """
+        if not self.supabase:
+            print("❌ Supabase 연결이 필요합니다!")
+            return None
+        
+        return bulk_save_run(self.supabase, restaurants, rankings, search_date, search_time, self.metrics)
+    
+    def refresh_ranking_trends(self, date=None):
+        """
+        ranking_trends 테이블에 하루치 순위 변동 추가 (DB 함수 refresh_ranking_trends 호출)
+        
+        Args:
+            date: 'YYYY-MM-DD' (None이면 오늘)
+        """
+        if not self.supabase:
+            return None
+        
+        date = date or datetime.now().strftime('%Y-%m-%d')
+        try:
+            with self.metrics.timer('summary_refresh'):
+                result = self.supabase.rpc('refresh_ranking_trends', {'p_date': date}).execute()
+            return result.data
+        except Exception as e:
+            self.metrics.incr('summary_failures')
+            print(f"⚠️ 순위 변동 히스토리 갱신 실패 (create_ranking_table SQL 실행 여부 확인): {str(e)}")
+            return None
+    
+    def _load_day_rankings(self, date):
+        """하루치 place_rankings를 필요한 컬럼만 페이지 단위로 조회"""
+        with self.metrics.timer('db_read'):
+            return list(iter_rows(
+                self.supabase, 'place_rankings',
+                ('search_keyword', 'search_location', 'rank', 'place_name', 'place_id'),
+                filters=[('eq', 'search_date', date)]
+            ))
+    
+    def track_my_restaurants(self, restaurants, user_id=None):
+        """
+        여러 식당 순위를 한 번에 추적
+        (오늘/전일 순위를 한 번씩만 읽고 이름 색인으로 매칭)
+        
+        Args:
+            restaurants: 식당 이름 문자열 또는 {'name', 'place_id'} dict 리스트
             user_id: 사용자 ID (옵션)
+        
+        Returns:
+            {식당 이름: 순위 데이터 리스트}
         """
         if not self.supabase:
-            return []
+            return {}
         
         try:
-            # 오늘 날짜
             today = datetime.now().strftime('%Y-%m-%d')
+            yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
             
-            # 내 식당 순위 조회
-            result = self.supabase.table('place_rankings')\
-                .select("*")\
-                .ilike('place_name', f'%{restaurant_name}%')\
-                .eq('search_date', today)\
-                .execute()
+            index = NameIndex(self._load_day_rankings(today))
+            matched = index.match_many(restaurants)
+            if not any(matched.values()):
+                return {name: [] for name in matched}
             
-            my_rankings = []
-            for ranking in result.data:
-                # 전일 순위 조회
-                yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-                prev_result = self.supabase.table('place_rankings')\
-                    .select("rank")\
-                    .eq('place_name', ranking['place_name'])\
-                    .eq('search_keyword', ranking['search_keyword'])\
-                    .eq('search_date', yesterday)\
-                    .execute()
-                
-                prev_rank = prev_result.data[0]['rank'] if prev_result.data else None
-                rank_change = (prev_rank - ranking['rank']) if prev_rank else None
-                
-                # 내 식당 순위 저장
-                my_rank_data = {
-                    'restaurant_name': restaurant_name,
-                    'user_id': user_id,
-                    'keyword': ranking['search_keyword'],
-                    'location': ranking['search_location'],
-                    'rank': ranking['rank'],
-                    'rank_change': rank_change,
-                    'tracked_date': today
-                }
-                
-                # DB에 저장
-                self.supabase.table('my_restaurant_rankings')\
-                    .upsert(my_rank_data)\
-                    .execute()
-                
-                my_rankings.append(my_rank_data)
-                
-                # 순위 변동 출력
-                if rank_change:
-                    if rank_change > 0:
-                        print(f"📈 {ranking['search_keyword']}: {ranking['rank']}위 (↑{rank_change})")
-                    elif rank_change < 0:
-                        print(f"📉 {ranking['search_keyword']}: {ranking['rank']}위 (↓{abs(rank_change)})")
+            # 전일 순위 (식당 + 키워드 + 지역 기준)
+            prev_ranks = {
+                (row['place_name'], row['search_keyword'], row.get('search_location')): row['rank']
+                for row in self._load_day_rankings(yesterday)
+            }
+            
+            results = {}
+            rows = []
+            for restaurant_name, rankings in matched.items():
+                my_rankings = []
+                for ranking in rankings:
+                    prev_rank = prev_ranks.get(
+                        (ranking['place_name'], ranking['search_keyword'], ranking.get('search_location'))
+                    )
+                    rank_change = (prev_rank - ranking['rank']) if prev_rank else None
+                    
+                    my_rank_data = {
+                        'restaurant_name': restaurant_name,
+                        'user_id': user_id,
+                        'keyword': ranking['search_keyword'],
+                        'location': ranking['search_location'],
+                        'rank': ranking['rank'],
+                        'rank_change': rank_change,
+                        'tracked_date': today
+                    }
+                    my_rankings.append(my_rank_data)
+                    
+                    # 순위 변동 출력
+                    if rank_change:
+                        if rank_change > 0:
+                            print(f"📈 {ranking['search_keyword']}: {ranking['rank']}위 (↑{rank_change})")
+                        elif rank_change < 0:
+                            print(f"📉 {ranking['search_keyword']}: {ranking['rank']}위 (↓{abs(rank_change)})")
+                        else:
+                            print(f"➡️ {ranking['search_keyword']}: {ranking['rank']}위 (→)")
                     else:
-                        print(f"➡️ {ranking['search_keyword']}: {ranking['rank']}위 (→)")
-                else:
-                    print(f"🆕 {ranking['search_keyword']}: {ranking['rank']}위 (신규)")
+                        print(f"🆕 {ranking['search_keyword']}: {ranking['rank']}위 (신규)")
+                
+                results[restaurant_name] = my_rankings
+                rows.extend(my_rankings)
+            
+            # 내 식당 순위 저장 (한 번에)
+            if rows:
+                with self.metrics.timer('db_write'):
+                    self.supabase.table('my_restaurant_rankings')\
+                        .upsert(rows)\
+                        .execute()
+                self.metrics.incr('db_rows_written', len(rows))
             
-            return my_rankings
+            return results
             
         except Exception as e:
             print(f"❌ 조회 실패: {str(e)}")
-            return []
+            return {}
+    
+    def track_my_restaurant(self, restaurant_name, user_id=None, place_id=None):
+        """
+        내 식당 순위 추적
+        
+        Args:
+            restaurant_name: 식당 이름 (지점명 변형 허용, 예: "BBQ치킨 강남점")
+            user_id: 사용자 ID (옵션)
+            place_id: 네이버 플레이스 ID (있으면 이름보다 우선)
+        """
+        results = self.track_my_restaurants([{'name': restaurant_name, 'place_id': place_id}], user_id)
+        return results.get(restaurant_name, [])
     
     def get_weekly_report(self, restaurant_name):
         """
@@ -254,7 +541,7 @@ class SupabaseUploader:
             
             # 키워드별 분석
             for ranking in result.data:
-                key = f"{ranking['location']} {ranking['keyword']}" if ranking['location'] else ranking['keyword']
+                key = make_keyword(ranking['keyword'], ranking['location']).query
                 
                 if key not in report['keywords']:
                     report['keywords'][key] = {
@@ -297,8 +584,6 @@ class SupabaseUploader:
 
 # 사용 예제
 if __name__ == "__main__":
-    from datetime import timedelta
-    
     # Uploader 초기화
     uploader = SupabaseUploader()
     
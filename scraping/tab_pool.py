@@ -0,0 +1,151 @@
+"""
+브라우저 하나 / 로그인 한 번으로 여러 탭에서 키워드 검색
+탭마다 검색을 제출해 두고(기다리지 않음) 다른 탭을 돌며 결과가 그려진 탭부터 수집
+→ A 탭 결과가 렌더링되는 동안 B 탭에서 다음 검색 제출 (파이프라인)
+탭 추가 비용은 렌더러 프로세스 하나 정도라 브라우저를 더 띄우는 것보다 메모리가 훨씬 적음
+"""
+
+import time
+from collections import deque
+
+# 검색 제출 전에 현재 문서에 표시 → 새 문서로 바뀌고 로딩이 끝나면 결과 준비 완료
+MARK_PENDING_JS = "window.__adlogPending = true;"
+READY_JS = "return document.readyState === 'complete' && !window.__adlogPending;"
+
+
+class TabPool:
+    def __init__(self, driver, size=3, poll_interval=0.2, timeout=30, metrics=None):
+        """
+        초기화
+
+        Args:
+            driver: 로그인된 Selenium 드라이버
+            size: 사용할 탭 수 (현재 탭 포함)
+            poll_interval: 모든 탭이 아직 렌더링 중일 때 다시 확인하는 간격 (초)
+            timeout: 검색 하나를 기다리는 최대 시간 (초)
+            metrics: 실행 계측 객체
+        """
+        self.driver = driver
+        self.size = max(1, size)
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.metrics = metrics
+
+        self.main_handle = None
+        self.handles = []
+        self.home_url = None
+
+    def open(self, url):
+        """
+        탭 열기 (현재 탭 + size-1개), 모든 탭을 검색 페이지로 이동
+
+        Args:
+            url: 검색 폼이 있는 페이지
+        """
+        self.home_url = url
+        self.main_handle = self.driver.current_window_handle
+        self.handles = [self.main_handle]
+
+        for _ in range(self.size - 1):
+            self.driver.switch_to.new_window('tab')
+            self.handles.append(self.driver.current_window_handle)
+
+        for handle in self.handles:
+            self.driver.switch_to.window(handle)
+            self.driver.get(url)
+
+        if self.metrics:
+            self.metrics.incr('search_tabs', len(self.handles))
+        return self
+
+    def _is_ready(self):
+        try:
+            return bool(self.driver.execute_script(READY_JS))
+        except Exception:
+            # 새 문서로 넘어가는 중
+            return False
+
+    def _submit(self, submit, keyword):
+        """현재 탭에서 검색 제출 (폼이 없으면 검색 페이지를 다시 열고 한 번 더)"""
+        self.driver.execute_script(MARK_PENDING_JS)
+        if submit(keyword):
+            return True
+
+        self.driver.get(self.home_url)
+        self.driver.execute_script(MARK_PENDING_JS)
+        return bool(submit(keyword))
+
+    def run(self, keywords, submit, stop=None):
+        """
+        키워드를 탭에 번갈아 제출하고 결과가 준비된 순서대로 반환
+
+        Args:
+            keywords: 검색할 키워드 리스트
+            submit: submit(keyword) -> bool, 현재 탭에서 검색을 제출만 하고 바로 반환하는 함수
+            stop: stop() -> bool, True면 새 키워드를 더 제출하지 않음 (제출한 검색은 마저 수집)
+
+        Yields:
+            (keyword, 소요 시간(초), 상태) - 상태는 'ready' / 'timeout'(기다려도 새 문서가 안 옴) / 'failed'(제출 실패)
+            / 'deferred'(stop으로 제출하지 않음)
+            yield 동안 드라이버는 그 결과가 있는 탭을 보고 있으므로 호출하는 쪽에서 바로 파싱
+        """
+        pending = deque(keywords)
+        slots = {handle: None for handle in self.handles}  # handle -> (keyword, 제출 시각)
+
+        while pending or any(slots.values()):
+            progressed = False
+
+            for handle in self.handles:
+                slot = slots[handle]
+                if slot is None and not pending:
+                    continue
+
+                self.driver.switch_to.window(handle)
+                if self.metrics:
+                    self.metrics.incr('tab_switches')
+
+                if slot is not None:
+                    keyword, started = slot
+                    elapsed = time.perf_counter() - started
+                    ready = self._is_ready()
+                    if not ready and elapsed < self.timeout:
+                        continue
+
+                    slots[handle] = None
+                    progressed = True
+                    if self.metrics:
+                        self.metrics.record('tab_search', elapsed)
+                    yield keyword, elapsed, 'ready' if ready else 'timeout'
+
+                # 빈 탭에 다음 키워드 제출
+                if pending and stop and stop():
+                    while pending:
+                        yield pending.popleft(), 0.0, 'deferred'
+                if pending:
+                    keyword = pending.popleft()
+                    if self._submit(submit, keyword):
+                        slots[handle] = (keyword, time.perf_counter())
+                    else:
+                        yield keyword, 0.0, 'failed'
+                    progressed = True
+
+            if not progressed:
+                time.sleep(self.poll_interval)
+
+    def close(self):
+        """추가로 연 탭 닫고 원래 탭으로 복귀"""
+        for handle in self.handles:
+            if handle == self.main_handle:
+                continue
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception:
+                pass
+
+        if self.main_handle:
+            try:
+                self.driver.switch_to.window(self.main_handle)
+            except Exception:
+                pass
+        self.handles = []
@@ -0,0 +1,105 @@
+"""
+결과 테이블 헤더 → 컬럼 위치 매핑
+행마다 모든 셀을 훑으며 숫자 모양 / 점수 범위(0.56~0.58 등)로 값을 추측하는 대신,
+헤더를 한 번 읽어 필드별 컬럼 위치를 만들고(같은 헤더 구성이면 캐시 재사용)
+행에서는 그 위치의 셀만 미리 컴파일한 정규식으로 숫자로 변환
+"""
+
+import re
+from functools import lru_cache
+
+# 필드 -> 헤더 이름 후보 (공백 제거 / 대문자 기준, 앞쪽 후보 우선)
+HEADER_ALIASES = {
+    'rank': ('순위', 'RANK'),
+    'place_name': ('플레이스명', '업체명', '상호명', '상호', '플레이스'),
+    'category': ('업종', '카테고리'),
+    'address': ('주소',),
+    'phone': ('전화번호', '전화'),
+    'blog_count': ('블로그리뷰', '블로그'),
+    'visitor_review_count': ('방문자리뷰', '방문자'),
+    'n1_score': ('N1',),
+    'n2_score': ('N2',),
+    'n3_score': ('N3',),
+}
+
+# 헤더 없이 행만 받았을 때 쓰는 애드로그 기본 컬럼 순서
+DEFAULT_HEADERS = ('순위', '플레이스명', '업종', '주소', '블로그리뷰', '방문자리뷰', 'N1', 'N2', 'N3')
+
+INT_PATTERN = re.compile(r'\d[\d,]*')
+FLOAT_PATTERN = re.compile(r'\d+(?:\.\d+)?')
+HEADER_SPACE_PATTERN = re.compile(r'\s+')
+
+
+class ColumnMap:
+    """필드 이름 -> 셀 위치"""
+
+    __slots__ = ('headers', 'index')
+
+    def __init__(self, headers, index):
+        self.headers = headers
+        self.index = index
+
+    def __contains__(self, field):
+        return field in self.index
+
+    def __repr__(self):
+        return f"ColumnMap({self.index})"
+
+    def text(self, cells, field, default=''):
+        """셀 텍스트 (컬럼이 없거나 행이 짧으면 default)"""
+        position = self.index.get(field)
+        if position is None or position >= len(cells):
+            return default
+        return cells[position]
+
+    def int_value(self, cells, field, default=0):
+        """'1,234' / '1,234건' 같은 셀의 정수 값"""
+        match = INT_PATTERN.search(self.text(cells, field))
+        return int(match.group().replace(',', '')) if match else default
+
+    def float_value(self, cells, field, default=None):
+        """'0.565093' 같은 셀의 실수 값"""
+        match = FLOAT_PATTERN.search(self.text(cells, field))
+        return float(match.group()) if match else default
+
+
+def _normalize(header):
+    return HEADER_SPACE_PATTERN.sub('', header or '').upper()
+
+
+@lru_cache(maxsize=32)
+def _build(headers):
+    normalized = [_normalize(header) for header in headers]
+    index = {}
+
+    for field, aliases in HEADER_ALIASES.items():
+        # 정확히 일치하는 헤더 우선, 없으면 후보로 시작하는 헤더 ('N1 점수', '블로그리뷰수' 등)
+        for match in (lambda h, a: h == a, lambda h, a: h.startswith(a)):
+            position = next(
+                (i for alias in aliases for i, header in enumerate(normalized)
+                 if i not in index.values() and match(header, alias)),
+                None
+            )
+            if position is not None:
+                index[field] = position
+                break
+
+    return ColumnMap(headers, index)
+
+
+def column_map(headers=None):
+    """
+    헤더 셀 텍스트로 컬럼 매핑 생성 (같은 헤더 구성은 캐시에서 재사용)
+
+    Args:
+        headers: 헤더 셀 텍스트 리스트 (없으면 DEFAULT_HEADERS)
+
+    Returns:
+        ColumnMap
+    """
+    headers = tuple(headers) if headers else DEFAULT_HEADERS
+    columns = _build(headers)
+    if 'place_name' not in columns and headers != DEFAULT_HEADERS:
+        # 헤더 행이 아닌 것을 받음 (헤더 없는 테이블) → 기본 순서
+        return _build(DEFAULT_HEADERS)
+    return columns
@@ -0,0 +1,32 @@
+"""
+오프라인 테스트 공용 설정
+scraping/ 모듈과 benchmarks/의 가짜 Supabase / 저장된 결과 페이지를 그대로 사용
+"""
+
+import os
+import sys
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRAPING_DIR = os.path.dirname(TESTS_DIR)
+BENCH_DIR = os.path.join(SCRAPING_DIR, 'benchmarks')
+FIXTURE_DIR = os.path.join(BENCH_DIR, 'fixtures')
+sys.path.insert(0, SCRAPING_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+
+def load_fixture(name):
+    """저장된 HTML 픽스처 읽기"""
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.fixture
+def keyword_page():
+    return load_fixture('keyword_result_page.html')
+
+
+@pytest.fixture
+def restaurant_page():
+    return load_fixture('restaurant_list_page.html')
@@ -0,0 +1,27 @@
+from datetime import datetime, timedelta
+
+from adlog_500_manager import Adlog500Manager
+from fake_supabase import FakeSupabase
+
+
+def weekly(restaurant_id, period_end, times_in_top10):
+    end = datetime.now().date() - timedelta(days=period_end)
+    return {'id': restaurant_id * 10 + period_end, 'restaurant_id': restaurant_id, 'period_type': 'weekly',
+            'period_start': (end - timedelta(days=6)).isoformat(), 'period_end': end.isoformat(),
+            'times_in_top10': times_in_top10}
+
+
+def test_trending_uses_latest_weekly_window_when_today_is_missing():
+    manager = Adlog500Manager()
+    manager.supabase = FakeSupabase({'ranking_statistics': [
+        weekly(1, 1, 3), weekly(2, 1, 5), weekly(1, 2, 9), weekly(3, 30, 7),
+    ]})
+    trending = manager.get_trending_restaurants()
+    assert [row['restaurant_id'] for row in trending] == [2, 1]
+    assert {row['period_end'] for row in trending} == {weekly(1, 1, 0)['period_end']}
+
+
+def test_trending_empty():
+    manager = Adlog500Manager()
+    manager.supabase = FakeSupabase()
+    assert manager.get_trending_restaurants() == []
@@ -0,0 +1,54 @@
+import pytest
+
+from block_detector import (BLOCKED, EMPTY, ERROR, LOGIN, OK, CircuitBreaker, CircuitOpen,
+                            classify_response, has_place_links, visible_text)
+
+RECAPTCHA_HEAD = ('<html><head><script src="https://www.google.com/recaptcha/api.js"></script>'
+                  '<style>.captcha {}</style></head><body>')
+
+
+def test_visible_text_drops_scripts_and_tags():
+    html = RECAPTCHA_HEAD + '<!-- captcha --><p>검색&nbsp;결과   없음</p></body>'
+    assert visible_text(html) == '검색 결과 없음'
+
+
+def test_classify_response(keyword_page):
+    assert classify_response(429) == BLOCKED
+    assert classify_response(200, keyword_page, has_results=has_place_links(keyword_page)) == OK
+    assert classify_response(200, '<body><p>비정상적인 접근이 감지되었습니다</p></body>') == BLOCKED
+    assert classify_response(500, '<body></body>') == ERROR
+    assert classify_response(200, '<body>결과 없음</body>') == EMPTY
+
+
+def test_recaptcha_script_is_not_blocked():
+    html = RECAPTCHA_HEAD + '<div>결과 없음</div></body>'
+    assert classify_response(200, html, 'https://www.adlog.kr/rank') == EMPTY
+
+
+def test_login_detection():
+    header_widget = '<body><header><input type="password"></header><div>결과 없음</div></body>'
+    assert classify_response(200, header_widget, logged_in=False) == EMPTY
+    assert classify_response(200, header_widget) == LOGIN
+    assert classify_response(200, '<body><a>로그아웃</a><input type=password></body>') == EMPTY
+    assert classify_response(302, '', 'https://www.adlog.kr/login?next=/', logged_in=False) == LOGIN
+
+
+def test_breaker_pauses_then_aborts():
+    breaker = CircuitBreaker(cooldown=0, max_pauses=1)
+    assert breaker.record(BLOCKED, 1.0) is None
+    assert breaker.record(BLOCKED, 1.0) == 'pause'
+    assert breaker.record(BLOCKED) is None
+    assert breaker.record(BLOCKED) == 'abort'
+    assert breaker.record(OK) == 'abort'
+    assert breaker.lost[BLOCKED] == [4, 2.0]
+    with pytest.raises(CircuitOpen):
+        breaker.check()
+
+
+def test_breaker_success_resets_streaks():
+    breaker = CircuitBreaker(max_relogins=1)
+    assert breaker.record(LOGIN) == 'relogin'
+    assert breaker.record(OK) is None
+    assert breaker.record(LOGIN) == 'relogin'
+    assert breaker.record(LOGIN) == 'abort'
+    assert breaker.report()[LOGIN]['count'] == 3
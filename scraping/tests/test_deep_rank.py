@@ -0,0 +1,53 @@
+from datetime import datetime
+
+from deep_rank import RankTargets, load_keyword_targets
+from fake_supabase import FakeSupabase
+from keyword_registry import parse_keyword
+
+HEADERS = ('순위', '플레이스명', '업종')
+
+
+def row(rank, name, place_id):
+    return [str(rank), name, '치킨'], f"https://m.place.naver.com/restaurant/{place_id}", HEADERS
+
+
+def test_rank_targets_done_when_all_found():
+    targets = RankTargets(['BBQ치킨 강남점', {'name': '전혀 다른 이름', 'place_id': '3'}])
+    assert len(targets) == 2
+    assert not targets.add_rows([row(1, 'BBQ치킨 강남점', 1), row(2, '교촌치킨', 2)])
+    assert targets.pending == [('전혀 다른 이름', '3')]
+    assert targets.add_rows([row(21, '굽네치킨', 3)])
+    assert targets.done
+    assert len(targets) == 2
+
+
+def test_rank_targets_without_restaurants_is_done():
+    assert RankTargets().done
+
+
+def test_load_keyword_targets_per_keyword():
+    today = datetime.now().strftime('%Y-%m-%d')
+    client = FakeSupabase({
+        'adlog_restaurants': [
+            {'id': 1, 'place_id': '100', 'place_name': 'A', 'is_our_member': True},
+            {'id': 2, 'place_id': '200', 'place_name': 'B', 'is_our_member': True},
+            {'id': 3, 'place_id': '300', 'place_name': 'C', 'is_our_member': False},
+        ],
+        'tracking_keywords': [{'id': 10, 'keyword': '강남 치킨'}],
+        'keyword_restaurant_mapping': [{'keyword_id': 10, 'restaurant_id': 2}],
+        'daily_rankings': [
+            {'search_keyword': '강남 치킨', 'restaurant_id': 1, 'search_date': today},
+            {'search_keyword': '강남 피자', 'restaurant_id': 3, 'search_date': today},
+            {'search_keyword': '홍대 맛집', 'restaurant_id': 1, 'search_date': '2000-01-01'},
+        ],
+    })
+    keywords = [parse_keyword(text) for text in ('강남 치킨', '강남 피자', '홍대 맛집')]
+    targets = load_keyword_targets(client, keywords)
+
+    assert sorted(place['place_id'] for place in targets[keywords[0].id]) == ['100', '200']
+    assert targets[keywords[1].id] == []       # 기록은 있지만 회원 없음 → 첫 페이지만
+    assert keywords[2].id not in targets       # 최근 기록 없음 → 깊이 끝까지
+
+
+def test_load_keyword_targets_without_client():
+    assert load_keyword_targets(None, [parse_keyword('강남 치킨')]) is None
@@ -0,0 +1,54 @@
+import threading
+
+from driver_pool import DriverPool, PooledDriver
+
+
+class SlowQuitScraper:
+    """종료(quit)가 멈추는 드라이버 흉내"""
+
+    def __init__(self, healthy, quitting=None, release=None):
+        self.driver = self
+        self.healthy = healthy
+        self.quitting = quitting
+        self.release = release
+
+    def execute_script(self, script):
+        if not self.healthy:
+            raise RuntimeError("chrome not reachable")
+        return 'complete'
+
+    @property
+    def current_url(self):
+        return 'https://www.adlog.kr/adlog/naver_place_rank_check.php'
+
+    def close(self):
+        self.quitting.set()
+        self.release.wait(5)
+
+
+def test_retiring_unhealthy_driver_does_not_hold_lock():
+    quitting, release = threading.Event(), threading.Event()
+    pool = DriverPool(size=1)
+    pool._launch = lambda: None
+    pool._idle = [PooledDriver(SlowQuitScraper(True)), PooledDriver(SlowQuitScraper(False, quitting, release))]
+
+    def borrow_dead():
+        try:
+            with pool.acquire():
+                pass
+        except RuntimeError:
+            pass
+
+    # 첫 번째 스레드는 죽은 드라이버를 꺼내 종료하다 멈춤
+    first = threading.Thread(target=borrow_dead)
+    first.start()
+    assert quitting.wait(5)
+
+    # 그동안 다른 스레드가 잠금을 얻어 반납 / 대여할 수 있어야 함
+    acquired = pool._lock.acquire(timeout=1)
+    assert acquired
+    pool._lock.release()
+
+    release.set()
+    first.join(5)
+    assert pool.stats['unhealthy'] == 1
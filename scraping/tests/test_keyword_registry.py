@@ -0,0 +1,58 @@
+import unicodedata
+
+from fake_supabase import FakeSupabase
+from keyword_registry import DEFAULT_PRIORITY, Keyword, KeywordRegistry, normalize_text
+
+
+def test_normalize_text_joins_jamo_and_spaces():
+    decomposed = unicodedata.normalize('NFD', '강남')  # macOS 등에서 들어오는 자모 분리 형태
+    assert normalize_text(f"  {decomposed}   치킨 ") == '강남 치킨'
+
+
+def test_parse_splits_location():
+    registry = KeywordRegistry()
+    keyword = registry.parse('강남 치킨')
+    assert (keyword.term, keyword.location, keyword.query) == ('치킨', '강남', '강남 치킨')
+    assert registry.parse('강남역 맛집').location == '강남역'
+    assert registry.parse('성수동 카페').location == '성수동'
+    assert registry.parse('치킨').location is None
+
+
+def test_menu_words_are_not_locations():
+    registry = KeywordRegistry()
+    keyword = registry.parse('우동 맛집')
+    assert (keyword.term, keyword.location) == ('우동 맛집', None)
+    for menu in ('규동', '텐동', '가츠동'):
+        assert registry.parse(f"{menu} 맛집").location is None
+    assert registry.parse('강남 우동').term == '우동'
+
+
+def test_same_id_reuses_keyword():
+    registry = KeywordRegistry()
+    first = registry.parse('강남 치킨')
+    assert registry.parse('강남   치킨') is first
+    assert registry.get('치킨', '강남') is first
+    assert registry.get('강남 치킨') is first
+    assert Keyword('BBQ 치킨').id == Keyword('bbq치킨').id
+
+
+def test_load_tracked_reads_priority():
+    client = FakeSupabase({'tracking_keywords': [
+        {'id': 1, 'keyword': '강남 치킨', 'priority': 3, 'is_active': True},
+        {'id': 2, 'keyword': '강남  치킨', 'priority': 2, 'is_active': True},
+        {'id': 3, 'keyword': '홍대 맛집', 'priority': None, 'is_active': True},
+        {'id': 4, 'keyword': '역삼 피자', 'priority': 1, 'is_active': False},
+    ]})
+    registry = KeywordRegistry()
+    keywords = registry.load_tracked(client)
+
+    assert [keyword.query for keyword in keywords] == ['강남 치킨', '홍대 맛집']
+    assert registry.priority(keywords[0]) == 2
+    assert registry.priority(keywords[1]) == DEFAULT_PRIORITY
+    assert registry.priority(registry.parse('역삼 피자')) == DEFAULT_PRIORITY
+
+
+def test_load_tracked_falls_back_to_default():
+    registry = KeywordRegistry()
+    keywords = registry.load_tracked(FakeSupabase(), default=['강남 치킨', '강남 치킨', '홍대 맛집'])
+    assert [keyword.query for keyword in keywords] == ['강남 치킨', '홍대 맛집']
@@ -0,0 +1,73 @@
+import pytest
+
+from models import RankingRow, Restaurant, ValidationError, as_dicts, place_id_from_url
+
+
+def test_place_id_from_url():
+    assert place_id_from_url('https://m.place.naver.com/restaurant/1234567/home') == '1234567'
+    assert place_id_from_url('https://map.naver.com/p/entry/place/7654321?c=15') == '7654321'
+    assert place_id_from_url('https://example.com/shop/abc?x=1') == 'abc'
+    assert place_id_from_url('') is None
+    assert place_id_from_url(None) is None
+
+
+def test_ranking_row_coerces_numbers():
+    row = RankingRow('치킨', '3', 'BBQ치킨 강남점', place_id=123, search_location='강남',
+                     blog_count='1,234', visitor_review_count='')
+    assert row.rank == 3
+    assert row.place_id == '123'
+    assert row.blog_count == 1234
+    assert row.visitor_review_count == 0
+    assert row.query == '강남 치킨'
+    assert row['place_name'] == 'BBQ치킨 강남점'
+    assert row.get('missing', 'x') == 'x'
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'search_keyword': '', 'rank': 1, 'place_name': 'a'},
+    {'search_keyword': '치킨', 'rank': 1, 'place_name': ''},
+    {'search_keyword': '치킨', 'rank': 0, 'place_name': 'a'},
+    {'search_keyword': '치킨', 'rank': '1위', 'place_name': 'a'},
+])
+def test_ranking_row_rejects_invalid(kwargs):
+    with pytest.raises(ValidationError):
+        RankingRow(**kwargs)
+
+
+def test_ranking_row_from_legacy_dict():
+    row = RankingRow.from_dict({'keyword': '강남 치킨', 'rank': 1, 'place_name': 'BBQ',
+                                'search_date': '2026-01-01', 'search_time': '06:00:00'})
+    assert row.search_keyword == '치킨'
+    assert row.search_location == '강남'
+    assert RankingRow.coerce(row) is row
+    assert RankingRow.from_dict(row.to_dict()) == row
+
+
+def test_ranking_row_db_rows():
+    row = RankingRow('치킨', 1, 'BBQ', place_id='1', search_location='강남', blog_count=5,
+                     search_date='2026-01-01', search_time='06:00:00')
+    assert row.to_db_row()['search_location'] == '강남'
+    daily = row.to_daily_row(7, extra={'rank_change': 2})
+    assert daily['restaurant_id'] == 7
+    assert daily['blog_count'] == 5
+    assert daily['rank_change'] == 2
+
+
+def test_restaurant_defaults_and_validation():
+    restaurant = Restaurant(place_id=42, place_name='교촌치킨', blog_count='10')
+    assert restaurant.place_id == '42'
+    assert restaurant.place_url == 'https://m.place.naver.com/restaurant/42'
+    assert restaurant.blog_count == 10
+    assert restaurant.to_db_row(updated_at='t')['updated_at'] == 't'
+
+    with pytest.raises(ValidationError):
+        Restaurant(place_id='', place_name='a')
+    with pytest.raises(ValidationError):
+        Restaurant(place_id='1', place_name='')
+
+
+def test_as_dicts_mixes_records_and_dicts():
+    restaurant = Restaurant(place_id='1', place_name='a', collected_at='t')
+    rows = as_dicts([restaurant, {'place_id': '2'}])
+    assert rows[0]['place_id'] == '1'
+    assert rows[1] == {'place_id': '2'}
@@ -0,0 +1,33 @@
+from name_matcher import NameIndex, split_branch
+
+
+def test_split_branch():
+    assert split_branch('BBQ치킨 강남점') == ('bbq치킨', '강남점')
+    assert split_branch('교촌치킨(강남역점)') == ('교촌치킨', '강남역점')
+    assert split_branch('BBQ치킨강남점') == ('bbq치킨', '강남점')
+    assert split_branch('원조족발 본점') == ('원조족발', '본점')
+    assert split_branch('맘스터치') == ('맘스터치', None)
+
+
+def test_match_by_name_and_branch():
+    index = NameIndex([
+        {'place_name': 'BBQ치킨 강남점', 'place_id': '1'},
+        {'place_name': 'BBQ치킨 역삼점', 'place_id': '2'},
+        {'place_name': '교촌치킨 강남역점', 'place_id': '3'},
+    ])
+    assert [row['place_id'] for row in index.match('BBQ치킨')] == ['1', '2']
+    assert [row['place_id'] for row in index.match('bbq 치킨 강남점')] == ['1']
+    assert index.match('BBQ치킨 신촌점') == []
+    assert index.match('피자') == []
+
+
+def test_place_id_wins_over_name():
+    index = NameIndex([{'place_name': '전혀 다른 이름', 'place_id': '99'}])
+    assert index.match('BBQ치킨', place_id=99)[0]['place_id'] == '99'
+
+
+def test_match_many():
+    index = NameIndex([{'place_name': '교촌치킨 강남역점', 'place_id': '3'}])
+    results = index.match_many(['교촌치킨', {'name': 'BBQ', 'place_id': None}])
+    assert len(results['교촌치킨']) == 1
+    assert results['BBQ'] == []
@@ -0,0 +1,19 @@
+from pagination import PageUrlPattern
+
+
+def test_discover_query_parameter():
+    pattern = PageUrlPattern.discover('https://www.adlog.kr/rank?kw=%EC%B9%98%ED%82%A8&page=2&size=20', 2)
+    assert pattern.param == 'page'
+    assert pattern.url(5) == 'https://www.adlog.kr/rank?kw=%EC%B9%98%ED%82%A8&page=5&size=20'
+
+
+def test_discover_path_segment():
+    pattern = PageUrlPattern.discover('https://www.adlog.kr/rank/2/list', 2)
+    assert pattern.param is None
+    assert pattern.url(7) == 'https://www.adlog.kr/rank/7/list'
+
+
+def test_discover_rejects_script_links():
+    assert PageUrlPattern.discover('javascript:goPage(2)', 2) is None
+    assert PageUrlPattern.discover('https://www.adlog.kr/rank?page=3', 2) is None
+    assert PageUrlPattern.discover(None, 2) is None
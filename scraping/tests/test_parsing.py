@@ -0,0 +1,54 @@
+"""저장된 결과 페이지 파싱 (브라우저 없이)"""
+
+import pytest
+
+from adlog_full_scraper import AdlogFullScraper
+from adlog_login_scraper import AdlogLoginScraper
+from models import RankingRow, Restaurant
+
+
+@pytest.fixture
+def full_scraper():
+    return AdlogFullScraper(headless=True)
+
+
+def test_restaurant_list_page(full_scraper, restaurant_page):
+    restaurants = []
+    full_scraper.parse_restaurant_page(restaurant_page, restaurants, set())
+    assert len(restaurants) == 50
+    assert all(isinstance(restaurant, Restaurant) for restaurant in restaurants)
+    assert restaurants[0].place_id == '1000000000'
+    assert restaurants[0].place_name == 'BBQ치킨 강남점'
+    assert len({restaurant.place_id for restaurant in restaurants}) == 50
+
+
+def test_keyword_result_page(full_scraper, keyword_page):
+    rankings = full_scraper.parse_keyword_results(keyword_page, '강남 치킨')
+    assert [row.rank for row in rankings] == list(range(1, 21))
+    assert all(isinstance(row, RankingRow) for row in rankings)
+    assert rankings[0].place_name == 'BBQ치킨 강남점'
+    assert rankings[0].place_id == '1000000000'
+
+
+def test_login_scraper_matches_full_scraper(full_scraper, keyword_page):
+    expected = full_scraper.parse_keyword_results(keyword_page, '강남 치킨')
+    rankings = AdlogLoginScraper(headless=True).parse_ranking_results(keyword_page, '강남 치킨')
+    assert [(row.rank, row.place_id, row.place_name) for row in rankings] == \
+        [(row.rank, row.place_id, row.place_name) for row in expected]
+
+
+def test_select_box_fallback_adds_restaurant_records(full_scraper):
+    restaurants = [Restaurant(place_id='1', place_name='이미 수집', collected_at='t')]
+    options = [
+        ('https://m.place.naver.com/restaurant/1/home', '이미 수집'),
+        ('https://m.place.naver.com/restaurant/2/home', ' 교촌치킨 강남역점 '),
+        ('https://m.place.naver.com/restaurant/3/home', ''),
+        ('', '선택하세요'),
+    ]
+    added = full_scraper.add_select_options(options, restaurants, {'1'})
+
+    assert added == 1
+    assert all(isinstance(restaurant, Restaurant) for restaurant in restaurants)
+    assert restaurants[1].place_id == '2'
+    assert restaurants[1].place_name == '교촌치킨 강남역점'
+    assert restaurants[1].to_db_row()['place_url'] == 'https://m.place.naver.com/restaurant/2'
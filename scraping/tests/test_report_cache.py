@@ -0,0 +1,83 @@
+import threading
+import time
+
+from report_cache import ReportCache
+
+
+def test_hits_and_ttl():
+    cache = ReportCache(default_ttl=300)
+    assert cache.get_or_load(('q', 1), lambda: 'a') == 'a'
+    assert cache.get_or_load(('q', 1), lambda: 'b') == 'a'
+    assert cache.get_or_load(('q', 2), lambda: 'c', ttl=0) == 'c'
+    assert cache.get_or_load(('q', 2), lambda: 'd') == 'd'  # 만료
+    assert cache.stats()['hits'] == 1
+
+
+def test_lru_eviction():
+    cache = ReportCache(max_entries=2)
+    for key in ('a', 'b', 'c'):
+        cache.get_or_load(key, lambda: key)
+    assert cache.stats()['entries'] == 2
+    assert cache.get_or_load('a', lambda: 'reloaded') == 'reloaded'
+
+
+def test_invalidate_by_name():
+    cache = ReportCache()
+    cache.get_or_load(('daily', 1), lambda: 1)
+    cache.get_or_load(('weekly', 1), lambda: 1)
+    assert cache.invalidate('daily') == 1
+    assert cache.get_or_load(('daily', 1), lambda: 2) == 2
+    assert cache.get_or_load(('weekly', 1), lambda: 2) == 1
+
+
+def test_concurrent_loads_share_one_loader():
+    cache = ReportCache()
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        release.wait(5)
+        return 'value'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load('k', loader))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while cache.stats()['coalesced'] < 3 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert results == ['value'] * 4
+    assert len(calls) == 1
+
+
+def test_invalidate_during_load_skips_store():
+    cache = ReportCache()
+    started, release = threading.Event(), threading.Event()
+
+    def slow_loader():
+        started.set()
+        release.wait(5)
+        return 'stale'
+
+    thread = threading.Thread(target=cache.get_or_load, args=(('daily',), slow_loader))
+    thread.start()
+    started.wait(5)
+    cache.invalidate()
+    release.set()
+    thread.join()
+    assert cache.get_or_load(('daily',), lambda: 'fresh') == 'fresh'
+
+
+def test_invalidate_reaches_same_namespace():
+    first = ReportCache(namespace='test_reports')
+    second = ReportCache(namespace='test_reports')
+    other = ReportCache()
+    for cache in (first, second, other):
+        cache.get_or_load(('daily',), lambda: 'old')
+    first.invalidate('daily')
+    assert second.get_or_load(('daily',), lambda: 'new') == 'new'
+    assert other.get_or_load(('daily',), lambda: 'new') == 'old'
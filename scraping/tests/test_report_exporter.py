@@ -0,0 +1,69 @@
+import csv
+
+import pytest
+
+from models import RankingRow
+from report_exporter import StreamingReportExporter
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+
+def rankings(count):
+    return [RankingRow('치킨', rank, f"식당 {rank}", place_id=str(rank), search_location='강남',
+                       search_date='2026-01-01', search_time='06:00:00') for rank in range(1, count + 1)]
+
+
+def test_csv_accepts_model_rows(tmp_path):
+    with StreamingReportExporter(str(tmp_path / 'report.csv'), fmt='csv') as exporter:
+        assert exporter.write_sheet('rankings', rankings(3)) == 3
+
+    with open(exporter.files[0], encoding='utf-8-sig') as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]['place_name'] == '식당 1'
+    assert rows[2]['rank'] == '3'
+
+
+def test_parquet_accepts_model_rows(tmp_path):
+    with StreamingReportExporter(str(tmp_path / 'report.parquet'), fmt='parquet', batch_size=2) as exporter:
+        exporter.write_sheet('rankings', rankings(5))
+    table = pq.read_table(exporter.files[0])
+    assert table.num_rows == 5
+    assert table.column('rank').to_pylist() == [1, 2, 3, 4, 5]
+
+
+def test_parquet_widens_types_across_batches(tmp_path):
+    rows = [
+        {'name': 'a', 'score': 1, 'memo': None},
+        {'name': 'b', 'score': 2, 'memo': None},
+        {'name': 'c', 'score': 2.5, 'memo': '메모'},
+        {'name': 'd', 'score': None, 'memo': 7},
+    ]
+    with StreamingReportExporter(str(tmp_path / 'report.parquet'), fmt='parquet', batch_size=2) as exporter:
+        assert exporter.write_sheet('mixed', rows) == 4
+
+    table = pq.read_table(exporter.files[0])
+    assert table.schema.field('score').type == pa.float64()
+    assert table.column('score').to_pylist() == [1.0, 2.0, 2.5, None]
+    assert table.column('memo').to_pylist() == [None, None, '메모', '7']
+
+
+def test_parquet_explicit_schema(tmp_path):
+    rows = [{'rank': 1, 'note': None}, {'rank': 2, 'note': None}, {'rank': 3, 'note': 'x'}]
+    with StreamingReportExporter(str(tmp_path / 'report.parquet'), fmt='parquet', batch_size=1) as exporter:
+        exporter.write_sheet('fixed', rows, schema={'rank': pa.int32(), 'note': pa.string()})
+    table = pq.read_table(exporter.files[0])
+    assert table.schema.field('rank').type == pa.int32()
+    assert table.column('note').to_pylist() == [None, None, 'x']
+
+
+def test_empty_rows(tmp_path):
+    with StreamingReportExporter(str(tmp_path / 'report.csv'), fmt='csv') as exporter:
+        assert exporter.write_sheet('empty', []) == 0
+    assert exporter.files == []
+
+
+def test_xlsx_accepts_model_rows(tmp_path):
+    pytest.importorskip('openpyxl')
+    with StreamingReportExporter(str(tmp_path / 'report.xlsx'), fmt='xlsx') as exporter:
+        assert exporter.write_sheet('rankings', rankings(2)) == 2
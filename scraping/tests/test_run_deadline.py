@@ -0,0 +1,44 @@
+import time
+from datetime import datetime, timedelta
+
+from run_deadline import RunDeadline, load_deferred, parse_deadline, save_deferred
+
+
+def test_parse_deadline_forms():
+    now = datetime(2026, 1, 1, 12, 0)
+    assert parse_deadline(None) is None
+    assert parse_deadline('') is None
+    assert parse_deadline('13:30', now) == datetime(2026, 1, 1, 13, 30)
+    assert parse_deadline('06:00', now) == datetime(2026, 1, 2, 6, 0)  # 이미 지났으면 다음 날
+    assert parse_deadline(90, now) == now + timedelta(seconds=90)
+    assert parse_deadline('90', now) == now + timedelta(seconds=90)
+
+
+def test_no_deadline_always_starts(monkeypatch):
+    monkeypatch.delenv('ADLOG_RUN_DEADLINE', raising=False)
+    deadline = RunDeadline()
+    assert not deadline
+    assert deadline.can_start()
+
+
+def test_can_start_uses_estimate_and_reserve():
+    deadline = RunDeadline(deadline=100, reserve=60, margin=0.5, initial_estimate=20)
+    assert deadline.can_start()       # 100초 남음 >= 20 * 1.5 + 60
+    deadline = RunDeadline(deadline=80, reserve=60, margin=0.5, initial_estimate=20)
+    assert not deadline.can_start()   # 80초 남음 < 90초
+
+
+def test_estimate_is_average_per_keyword():
+    deadline = RunDeadline(deadline=600).start()
+    time.sleep(0.02)
+    deadline.done(2)
+    assert 0.005 < deadline.estimate < 1.0
+
+
+def test_deferred_round_trip(tmp_path):
+    path = str(tmp_path / 'deferred.json')
+    assert load_deferred(path) == []
+    save_deferred(['강남 치킨', '홍대 맛집'], path=path, deadline=datetime(2026, 1, 1, 7, 0))
+    assert load_deferred(path) == ['강남 치킨', '홍대 맛집']
+    save_deferred([], path=path)
+    assert load_deferred(path) == []
@@ -0,0 +1,34 @@
+import json
+import os
+
+import run_metrics
+from run_metrics import RunMetrics
+
+
+def test_default_jsonl_path_is_next_to_module():
+    assert os.path.isabs(run_metrics.DEFAULT_METRICS_FILE)
+    assert os.path.dirname(os.path.dirname(run_metrics.DEFAULT_METRICS_FILE)) == \
+        os.path.dirname(os.path.abspath(run_metrics.__file__))
+
+
+def test_finish_writes_jsonl_and_prometheus_per_run(tmp_path):
+    textfile = str(tmp_path / 'prom' / 'adlog.prom')
+    os.makedirs(tmp_path / 'prom')
+    for name in ('daily_scraping_job', 'adaptive_refresh_job'):
+        metrics = RunMetrics(name)
+        metrics.incr('rankings_collected', 3)
+        metrics.record('db_write', 0.5)
+        metrics.finish(jsonl_path=str(tmp_path / 'metrics.jsonl'), prometheus_path=textfile)
+
+    with open(tmp_path / 'metrics.jsonl', encoding='utf-8') as f:
+        assert [json.loads(line)['run'] for line in f] == ['daily_scraping_job', 'adaptive_refresh_job']
+
+    files = sorted(os.listdir(tmp_path / 'prom'))
+    assert files == ['adlog_adaptive_refresh_job.prom', 'adlog_daily_scraping_job.prom']
+    with open(tmp_path / 'prom' / files[1], encoding='utf-8') as f:
+        text = f.read()
+    assert 'adlog_run_counter{run="daily_scraping_job",name="rankings_collected"} 3' in text
+
+
+def test_prometheus_path_in_directory(tmp_path):
+    assert RunMetrics('login job').prometheus_path(str(tmp_path)) == str(tmp_path / 'adlog_login_job.prom')
@@ -0,0 +1,40 @@
+import pytest
+
+from fake_supabase import FakeSupabase
+from models import RankingRow
+from supabase_uploader import SupabaseUploader
+
+
+@pytest.fixture
+def uploader():
+    uploader = SupabaseUploader()
+    uploader.supabase = FakeSupabase()
+    return uploader
+
+
+def rankings(names, location='강남', search_date='2026-01-01'):
+    return [RankingRow('치킨', rank, name, place_id=str(rank), search_location=location,
+                       search_date=search_date, search_time='06:00:00')
+            for rank, name in enumerate(names, 1)]
+
+
+def test_same_day_recollection_replaces_rankings(uploader):
+    assert uploader.upload_rankings(rankings(['A', 'B', 'C']))
+    assert uploader.upload_rankings(rankings(['B', 'A']))
+
+    rows = sorted(uploader.supabase.tables['place_rankings'], key=lambda row: row['rank'])
+    assert [(row['rank'], row['place_name']) for row in rows] == [(1, 'B'), (2, 'A')]
+
+
+def test_other_days_and_locations_are_kept(uploader):
+    uploader.upload_rankings(rankings(['A'], search_date='2025-12-31') + rankings(['A'], location=None))
+    uploader.upload_rankings(rankings(['B']) + rankings(['B'], location=None))
+
+    rows = uploader.supabase.tables['place_rankings']
+    assert sorted((row['search_date'], row['search_location'] or '', row['place_name']) for row in rows) == [
+        ('2025-12-31', '강남', 'A'), ('2026-01-01', '', 'B'), ('2026-01-01', '강남', 'B')]
+
+
+def test_batch_duplicates_keep_last(uploader):
+    assert uploader.upload_rankings(rankings(['A']) + rankings(['B']))
+    assert [row['place_name'] for row in uploader.supabase.tables['place_rankings']] == ['B']
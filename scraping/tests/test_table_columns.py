@@ -0,0 +1,29 @@
+from table_columns import DEFAULT_HEADERS, column_map
+
+
+def test_maps_headers_with_spaces_and_suffixes():
+    columns = column_map(['순위', '업체명', '카테고리', '블로그 리뷰수', '방문자 리뷰', 'N1 점수'])
+    cells = ['3', 'BBQ치킨 강남점', '치킨', '1,234건', '56', '0.565093']
+    assert columns.int_value(cells, 'rank') == 3
+    assert columns.text(cells, 'place_name') == 'BBQ치킨 강남점'
+    assert columns.int_value(cells, 'blog_count') == 1234
+    assert columns.int_value(cells, 'visitor_review_count') == 56
+    assert columns.float_value(cells, 'n1_score') == 0.565093
+    assert 'address' not in columns
+    assert columns.text(cells, 'address', default='-') == '-'
+
+
+def test_missing_or_short_cells_use_default():
+    columns = column_map()
+    assert columns.headers == DEFAULT_HEADERS
+    assert columns.int_value(['1', 'BBQ'], 'blog_count') == 0
+    assert columns.float_value(['1', 'BBQ'], 'n2_score') is None
+
+
+def test_data_row_instead_of_header_uses_default_order():
+    columns = column_map(['1', 'BBQ치킨', '치킨'])
+    assert columns.index == column_map().index
+
+
+def test_same_headers_are_cached():
+    assert column_map(['순위', '플레이스명']) is column_map(('순위', '플레이스명'))